@@ -1,17 +1,83 @@
 import streamlit as st
 import os
-from extractor import extract_text_from_pdf
-from matcher import analyze_resume
-from visualizer import (
-    create_skills_chart,
-    create_match_visualization,
-    create_skills_distribution_bar,
-    create_match_gauge,
-    create_skills_radar,
-    # create_skills_wordcloud,  # Optional, see notes below
-)
+import instrumentation
+import service_client
+import taxonomy
+from jd_matcher import JDMatcher
+from matcher import JOB_SKILLS, analyze_resume
+from parse_cache import ParseCache
+from resume_parser import ResumeParser
+from visualizer import create_dashboard
 from suggestions import get_improvement_suggestions
 
+# When set, PDFs are parsed by the analysis service (service.py) and this
+# app only polls for results instead of parsing in the script thread
+SERVICE_URL = os.environ.get("RESUME_ANALYZER_SERVICE_URL")
+
+# Processes used to extract long PDFs page range by page range; short ones
+# are always extracted in the script thread
+PDF_WORKERS = int(os.environ.get("RESUME_PDF_WORKERS") or os.cpu_count() or 1)
+
+
+@st.cache_resource
+def get_parse_cache():
+    return ParseCache()
+
+
+@st.cache_resource
+def get_resume_parser():
+    return ResumeParser(pdf_workers=PDF_WORKERS)
+
+
+@st.cache_resource
+def get_jd_matcher():
+    # Loads the offline-fitted vectorizer once per server process
+    return JDMatcher()
+
+
+def load_resume(uploaded_file):
+    """Return the cached extraction for an upload, parsing the PDF only on a miss"""
+    # getvalue() shares the upload's bytes instead of copying them
+    pdf_bytes = uploaded_file.getvalue()
+    cache = get_parse_cache()
+    key = cache.key_for(pdf_bytes)
+
+    entry = cache.get(key)
+    if entry is not None:
+        return entry
+
+    if SERVICE_URL:
+        return load_resume_from_service(cache, key, pdf_bytes)
+
+    # Extract text straight from the upload buffer; no temp file, so
+    # concurrent sessions cannot overwrite each other's PDF. The parser's
+    # own extraction, done once, feeds both the displayed text and the parse
+    parser = get_resume_parser()
+    with st.spinner("🔍 Extracting text from your resume..."):
+        resume_text = parser.extract_text_from_pdf(pdf_bytes)
+
+    if not resume_text:
+        return None
+
+    with st.spinner("🧠 Parsing resume details..."):
+        resume_data = parser.parse_text(resume_text)
+    return cache.put(key, resume_text, resume_data)
+
+
+def load_resume_from_service(cache, key, pdf_bytes):
+    """Parse an upload on the analysis service, polling until it finishes"""
+    try:
+        with st.spinner("🔍 Analyzing your resume..."):
+            result = service_client.analyze(SERVICE_URL, pdf_bytes)
+    except service_client.ServiceBusy:
+        st.warning("⏳ The analyzer is busy right now. Please try again in a moment.")
+        return None
+    except (service_client.ServiceError, OSError) as e:
+        st.error(f"Error contacting the analysis service: {e}")
+        return None
+    return cache.put(key, result['text'], result['resume_data'])
+
+
 def main():
     # Page config - must be first Streamlit call
     st.set_page_config(
@@ -76,18 +142,7 @@ def main():
     st.markdown('<p class="sub-header">AI-powered resume analysis to match your skills with job requirements</p>', unsafe_allow_html=True)
 
     # Job role selection
-    job_roles = [
-        "Data Scientist",
-        "ML Engineer", 
-        "Software Developer",
-        "Business Analyst",
-        "Product Manager",
-        "DevOps Engineer",
-        "Frontend Developer",
-        "Backend Developer",
-        "Full Stack Developer",
-        "Data Analyst"
-    ]
+    job_roles = list(JOB_SKILLS)
     
     selected_role = st.selectbox(
         "🎯 Select Target Job Role:",
@@ -102,111 +157,132 @@ def main():
         help="Upload your resume in PDF format for analysis"
     )
 
+    # Opt-in cProfile/tracemalloc run for this request, shown in the debug panel
+    profile = st.sidebar.checkbox("Profile this request", value=False)
+
     if uploaded_file is not None:
-        # Save uploaded file temporarily
-        with open("temp_resume.pdf", "wb") as f:
-            f.write(uploaded_file.getbuffer())
-
-        # Extract text from PDF
-        with st.spinner("🔍 Extracting text from your resume..."):
-            resume_text = extract_text_from_pdf("temp_resume.pdf")
-
-        if resume_text:
-            st.success("✅ Resume text extracted successfully!")
-
-            # Analyze resume
-            with st.spinner("🤖 Analyzing your resume..."):
-                analysis_result = analyze_resume(resume_text, selected_role)
-
-            # Show match score and skills found
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown(f"""
-                <div class="metric-container">
-                    <h3>Match Score</h3>
-                    <h1>{analysis_result.get('match_percentage', 0):.1f}%</h1>
-                </div>
-                """, unsafe_allow_html=True)
-
-            with col2:
-                st.markdown(f"""
-                <div class="metric-container">
-                    <h3>Skills Found</h3>
-                    <h1>{len(analysis_result.get('matched_skills', []))} / {len(analysis_result.get('job_skills', []))}</h1>
-                </div>
-                """, unsafe_allow_html=True)
-
-            # Skills analysis section
-            st.markdown('<h2 class="section-header">📊 Skills Analysis</h2>', unsafe_allow_html=True)
-
-            # Matched skills
-            if analysis_result.get('matched_skills'):
-                st.markdown("**✅ Skills Found in Your Resume:**")
-                skills_html = ""
-                for skill in analysis_result['matched_skills']:
-                    skills_html += f'<span class="skill-tag">{skill}</span>'
-                st.markdown(skills_html, unsafe_allow_html=True)
-
-            # Missing skills
-            if analysis_result.get('missing_skills'):
-                st.markdown("**❌ Missing Skills:**")
-                missing_skills_html = ""
-                for skill in analysis_result['missing_skills']:
-                    missing_skills_html += f'<span class="missing-skill-tag">{skill}</span>'
-                st.markdown(missing_skills_html, unsafe_allow_html=True)
-
-            # Visual Analysis
-            st.markdown('<h2 class="section-header">📈 Visual Analysis</h2>', unsafe_allow_html=True)
-            col1, col2 = st.columns(2)
-
-            with col1:
-                try:
-                    skills_chart = create_skills_chart(analysis_result)
-                    st.plotly_chart(skills_chart, use_container_width=True)
-                except Exception as e:
-                    st.error(f"Error generating skills chart: {e}")
-
-                try:
-                    skills_dist = create_skills_distribution_bar(analysis_result)
-                    st.plotly_chart(skills_dist, use_container_width=True)
-                except Exception as e:
-                    st.error(f"Error generating skills distribution chart: {e}")
-
-            with col2:
-                try:
-                    match_viz = create_match_visualization(analysis_result)
-                    st.plotly_chart(match_viz, use_container_width=True)
-                except Exception as e:
-                    st.error(f"Error generating match visualization: {e}")
-
-                try:
-                    match_gauge = create_match_gauge(analysis_result)
-                    st.plotly_chart(match_gauge, use_container_width=True)
-                except Exception as e:
-                    st.error(f"Error generating match gauge: {e}")
-
-            # Radar chart full width
-            try:
-                skills_radar = create_skills_radar(analysis_result)
-                st.plotly_chart(skills_radar, use_container_width=True)
-            except Exception as e:
-                st.error(f"Error generating skills radar chart: {e}")
-
-            # Improvement suggestions
-            st.markdown('<h2 class="section-header">💡 Improvement Suggestions</h2>', unsafe_allow_html=True)
-            suggestions = get_improvement_suggestions(analysis_result, selected_role)
-            for i, suggestion in enumerate(suggestions, 1):
-                st.markdown(f"**{i}.** {suggestion}")
-
-        else:
-            st.error("❌ Could not extract text from the PDF. Please ensure it's a valid PDF file.")
-
-        # Clean up temp file
-        if os.path.exists("temp_resume.pdf"):
-            os.remove("temp_resume.pdf")
+        with instrumentation.request('app', profile=profile) as metrics:
+            show_analysis(uploaded_file, selected_role)
+        if metrics is not None:
+            show_metrics(metrics)
 
     else:
         st.info("Please upload your resume in PDF format to start analysis.")
 
+
+def show_analysis(uploaded_file, selected_role):
+    """Render the analysis of an uploaded resume for the selected role"""
+    # Text and parse results are cached by content hash, so switching
+    # roles only re-runs the analysis below
+    with instrumentation.stage('app.load_resume'):
+        resume_entry = load_resume(uploaded_file)
+    resume_text = resume_entry['text'] if resume_entry else ""
+
+    if resume_text:
+        st.success("✅ Resume text extracted successfully!")
+
+        # Analyze resume
+        with st.spinner("🤖 Analyzing your resume..."), instrumentation.stage('app.analyze_resume'):
+            # Reuses the cached parse, so a role switch only re-scores
+            analysis_result = analyze_resume(resume_text, selected_role, resume_entry.get('resume_data'))
+
+        # Show match score and skills found
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown(f"""
+            <div class="metric-container">
+                <h3>Match Score</h3>
+                <h1>{analysis_result.get('match_percentage', 0):.1f}%</h1>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col2:
+            st.markdown(f"""
+            <div class="metric-container">
+                <h3>Skills Found</h3>
+                <h1>{len(analysis_result.get('matched_skills', []))} / {len(analysis_result.get('job_skills', []))}</h1>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Skills analysis section
+        st.markdown('<h2 class="section-header">📊 Skills Analysis</h2>', unsafe_allow_html=True)
+
+        # Matched skills
+        if analysis_result.get('matched_skills'):
+            st.markdown("**✅ Skills Found in Your Resume:**")
+            skills_html = ""
+            for skill in analysis_result['matched_skills']:
+                skills_html += f'<span class="skill-tag">{skill}</span>'
+            st.markdown(skills_html, unsafe_allow_html=True)
+
+        # Missing skills
+        if analysis_result.get('missing_skills'):
+            st.markdown("**❌ Missing Skills:**")
+            missing_skills_html = ""
+            for skill in analysis_result['missing_skills']:
+                missing_skills_html += f'<span class="missing-skill-tag">{skill}</span>'
+            st.markdown(missing_skills_html, unsafe_allow_html=True)
+
+        # Visual Analysis
+        st.markdown('<h2 class="section-header">📈 Visual Analysis</h2>', unsafe_allow_html=True)
+        # One memoized figure instead of five: reruns with an unchanged
+        # result reuse it, and the browser receives a single chart payload
+        try:
+            st.plotly_chart(create_dashboard(analysis_result), use_container_width=True)
+        except Exception as e:
+            st.error(f"Error generating charts: {e}")
+
+        # Improvement suggestions
+        st.markdown('<h2 class="section-header">💡 Improvement Suggestions</h2>', unsafe_allow_html=True)
+        suggestions = get_improvement_suggestions(analysis_result, selected_role)
+        for i, suggestion in enumerate(suggestions, 1):
+            st.markdown(f"**{i}.** {suggestion}")
+
+        show_jd_match(resume_text, analysis_result)
+
+    else:
+        st.error("❌ Could not extract text from the PDF. Please ensure it's a valid PDF file.")
+
+
+def show_jd_match(resume_text, analysis_result):
+    """Score the resume against a pasted job description"""
+    st.markdown('<h2 class="section-header">📝 Job Description Match</h2>', unsafe_allow_html=True)
+    jd_text = st.text_area("Paste a job description to compare your resume against it", height=200)
+    if not jd_text.strip():
+        return
+
+    with instrumentation.stage('app.jd_match'):
+        similarity = get_jd_matcher().similarity(jd_text, resume_text)
+        # Skills the posting names that the resume doesn't, via the taxonomy automaton
+        jd_skills = {skill for _, _, skill, _ in taxonomy.current().matcher.finditer(jd_text.lower())}
+        missing = sorted(jd_skills - set(analysis_result.get('resume_skills', [])))
+
+    st.markdown(f"""
+    <div class="metric-container">
+        <h3>Job Description Similarity</h3>
+        <h1>{similarity * 100:.1f}%</h1>
+    </div>
+    """, unsafe_allow_html=True)
+    if missing:
+        st.markdown("**❌ Skills in the Job Description Missing from Your Resume:**")
+        st.markdown("".join(f'<span class="missing-skill-tag">{skill}</span>' for skill in missing),
+                    unsafe_allow_html=True)
+
+
+def show_metrics(metrics):
+    """Debug panel with stage timings, counters and any profile output"""
+    with st.expander("🛠️ Performance details"):
+        data = metrics.as_dict()
+        st.write(f"Total: {(data['total_seconds'] or 0) * 1000:.1f} ms")
+        st.json({
+            'stages_ms': {name: round(seconds * 1000, 1) for name, seconds in data['stages'].items()},
+            'counters': data['counters'],
+        })
+        if data['profile']:
+            st.text(data['profile'])
+        if data['memory']:
+            st.text('\n'.join(data['memory']))
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,538 @@
+import argparse
+import csv
+import json
+import os
+import signal
+import sys
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+import dedup
+import models
+import sandbox
+from matcher import JOB_SKILLS, analyze_resume
+from resume_parser import ResumeParser
+from result_store import DEFAULT_BATCH_ROWS as STORE_BATCH_ROWS, ResultStore
+from revisions import RevisionStore
+from skill_index import SkillIndex
+
+# Fields a near-duplicate's record copies from its original's
+DUPLICATE_FIELDS = ('contact_info', 'total_experience', 'skills', 'skill_proficiency', 'matches', 'best_role')
+
+# Files analyzed per worker task; their texts share one spaCy nlp.pipe run
+PARSE_BATCH_SIZE = 8
+
+# One parser per worker process, created by the pool initializer
+_parser = None
+_hasher = None
+
+
+class FileTimeout(BaseException):
+    """Raised inside a worker when a single resume exceeds its time budget
+
+    A BaseException, so the `except Exception` fallbacks in the extractors
+    and parser can't swallow it and report an empty result instead.
+    """
+
+
+def init_worker():
+    global _parser
+    # No-op when the models were inherited from the parent through fork
+    models.warm_up()
+    _parser = ResumeParser()
+
+
+def _on_alarm(signum, frame):
+    raise FileTimeout()
+
+
+@contextmanager
+def _time_limit(timeout):
+    """Raise FileTimeout in the block once `timeout` seconds pass (no-op without SIGALRM)"""
+    if not timeout or not hasattr(signal, 'SIGALRM'):
+        yield
+        return
+    signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def collect_pdfs(source):
+    """Return PDF paths from a directory (recursively) or a manifest file"""
+    if os.path.isdir(source):
+        paths = []
+        for root, _, files in os.walk(source):
+            for name in files:
+                if name.lower().endswith('.pdf'):
+                    paths.append(os.path.join(root, name))
+        return sorted(paths)
+
+    # Manifest: one path per line, relative paths resolve against the manifest
+    base_dir = os.path.dirname(os.path.abspath(source))
+    paths = []
+    with open(source, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                paths.append(os.path.normpath(os.path.join(base_dir, line)))
+    return paths
+
+
+def _chart_path(path, charts_dir, chart_format):
+    if not charts_dir:
+        return None
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(charts_dir, f'{name}.{chart_format}')
+
+
+def _fail(record, error, timeout):
+    """Record why analyzing a file raised `error`"""
+    if isinstance(error, FileTimeout):
+        record.update(status='timeout', error=f'exceeded {timeout}s')
+    elif isinstance(error, sandbox.ExtractionRejected):
+        record.update(status='rejected', error=str(error))
+    else:
+        record.update(status='error', error=str(error))
+    return record
+
+
+def analyze_file(path, roles, timeout=None, charts_dir=None, chart_format='svg', limits=None, text=None):
+    """Extract, parse and score one PDF file; never raises so the batch keeps going
+
+    With `charts_dir`, the dashboard for the best-matching role is saved
+    there as a static image named after the PDF. With `limits`, see
+    analyze_pdf.
+    """
+    if limits is not None or text is not None:
+        # The sandboxed child opens the file itself, and with text we never need it
+        pdf_source = path
+    else:
+        try:
+            # Read the file here so an unreadable path is reported with its OSError
+            with open(path, 'rb') as f:
+                pdf_source = f.read()
+        except OSError as e:
+            return {'path': path, 'status': 'error', 'error': str(e)}
+
+    chart_path = _chart_path(path, charts_dir, chart_format)
+    record = analyze_pdf(pdf_source, roles, timeout=timeout, chart_path=chart_path, limits=limits, text=text)
+    return {'path': path, **record}
+
+
+def analyze_files(paths, roles, timeout=None, charts_dir=None, chart_format='svg', limits=None, texts=None):
+    """analyze_file for a chunk of PDFs, parsing their texts together with ResumeParser.parse_texts
+
+    spaCy NER then runs over the whole chunk in one nlp.pipe call. Each
+    file is extracted and scored within its own time budget; the parse
+    gets the chunk's combined budget, and if it fails or overruns, every
+    file is re-analyzed on its own so only the one at fault is marked.
+    Pass `texts` (one per path) when the PDFs were already extracted.
+    """
+    records = [None] * len(paths)
+    extracted = []
+    for i, path in enumerate(paths):
+        if texts is not None:
+            text, record = texts[i], {'path': path, 'status': 'ok', 'error': None}
+        else:
+            text, record = extract_file(path, limits, timeout)
+        if text is None:
+            records[i] = record
+        else:
+            extracted.append((i, text, record))
+    if not extracted:
+        return records
+
+    try:
+        with _time_limit(timeout and timeout * len(extracted)):
+            parsed = _parser.parse_texts([text for _, text, _ in extracted])
+    except (FileTimeout, Exception):
+        parsed = None
+
+    for n, (i, text, record) in enumerate(extracted):
+        if parsed is None:
+            records[i] = analyze_file(paths[i], roles, timeout, charts_dir, chart_format, limits, text)
+            continue
+        try:
+            with _time_limit(timeout):
+                _score(record, text, parsed[n], roles, _chart_path(paths[i], charts_dir, chart_format))
+        except (FileTimeout, Exception) as e:
+            _fail(record, e, timeout)
+        records[i] = record
+    return records
+
+
+def analyze_pdf(pdf_source, roles, timeout=None, keep_documents=False, chart_path=None, limits=None,
+                candidate_id=None, text=None):
+    """Extract, parse and score one PDF (bytes or a path) within an optional time budget
+
+    With `keep_documents` the record also carries the extracted text and the
+    full parse_resume output, for callers that analyze further themselves.
+    With `chart_path` the best role's dashboard is written there as SVG or
+    PNG, picked by the file extension. With `limits` (keyword arguments
+    for sandbox.extract_guarded, {} for its defaults) the text is extracted
+    once in a memory-capped child process under page, byte and time budgets.
+    With `candidate_id` the candidate's previous revision is diffed against
+    this one and only changed pages and sections are re-analyzed (see
+    revisions.RevisionStore). Pass already-extracted `text` to skip
+    extraction; the PDF is then not opened at all.
+    """
+    record = {'status': 'ok', 'error': None}
+
+    try:
+        with _time_limit(timeout):
+            if text is not None:
+                resume_text = text
+            elif limits is not None:
+                extraction = sandbox.extract_guarded(pdf_source, **limits)
+                resume_text = extraction['text']
+                if extraction['truncated']:
+                    record['truncated'] = extraction['reason']
+            elif candidate_id is not None:
+                # Page-level diffing extracts the text itself
+                resume_text = None
+            else:
+                # The parser's own extraction, parsed below without reopening the PDF
+                resume_text = _parser.extract_text_from_pdf(pdf_source)
+            if resume_text == "":
+                record.update(status='error', error='no text extracted')
+                return record
+
+            if candidate_id is not None:
+                resume_data = RevisionStore().analyze(candidate_id, _parser, pdf_source=pdf_source, raw_text=resume_text)
+                if resume_data is None:
+                    record.update(status='error', error='no text extracted')
+                    return record
+                resume_text = resume_data['raw_text']
+                record['revision'] = resume_data['revision']
+            else:
+                # Parse the text we have; an untrusted PDF must not be reopened here
+                resume_data = _parser.parse_text(resume_text)
+            _score(record, resume_text, resume_data, roles, chart_path)
+
+            if keep_documents:
+                record['text'] = resume_text
+                record['resume_data'] = resume_data
+    except (FileTimeout, Exception) as e:
+        _fail(record, e, timeout)
+
+    return record
+
+
+def _score(record, resume_text, resume_data, roles, chart_path=None):
+    """Add parse results, role matches and the optional chart to a record"""
+    if resume_data:
+        record['contact_info'] = resume_data['contact_info']
+        record['total_experience'] = resume_data['experience']['total_experience']
+        record['skills'] = resume_data['all_skills']
+        record['skill_proficiency'] = resume_data['skill_proficiency']
+
+    analyses = {role: analyze_resume(resume_text, role, resume_data) for role in roles}
+    record['matches'] = {role: analysis['match_percentage'] for role, analysis in analyses.items()}
+    record['best_role'] = max(record['matches'], key=record['matches'].get) if roles else None
+
+    if chart_path and record['best_role']:
+        try:
+            record['chart'] = write_chart(analyses[record['best_role']], chart_path)
+        except (ImportError, ValueError, OSError) as e:
+            # A missing chart shouldn't fail an otherwise parsed resume
+            record['chart_error'] = str(e)
+    return record
+
+
+def extract_file(path, limits=None, timeout=None):
+    """Extract one PDF within its time budget; returns (text, record), text None on failure
+
+    Without `limits` this is the parser's own extraction, as in
+    parse_resume, so a file parses the same however its text was obtained.
+    """
+    record = {'path': path, 'status': 'ok', 'error': None}
+    try:
+        with _time_limit(timeout):
+            if limits is not None:
+                extraction = sandbox.extract_guarded(path, **limits)
+                text = extraction['text']
+                if extraction['truncated']:
+                    record['truncated'] = extraction['reason']
+            else:
+                text = _parser.extract_text_from_pdf(path)
+    except (FileTimeout, Exception) as e:
+        return None, _fail(record, e, timeout)
+    if not text:
+        record.update(status='error', error='no text extracted')
+        return None, record
+    return text, record
+
+
+def fingerprint_file(path, limits=None, num_perm=dedup.DEFAULT_NUM_PERM, timeout=None):
+    """Extract one PDF and MinHash its cleaned text; returns (text, signature) or an error record"""
+    global _hasher
+    text, record = extract_file(path, limits, timeout)
+    if text is None:
+        return record
+
+    if _hasher is None or _hasher.num_perm != num_perm:
+        _hasher = dedup.MinHasher(num_perm)
+    return text, _hasher.text_signature(_parser.clean_text(text))
+
+
+def _duplicate_record(path, original, score, fields):
+    return {
+        **fields, 'path': path, 'status': 'duplicate', 'error': None,
+        'duplicate_of': original, 'similarity': round(score, 3),
+    }
+
+
+def write_chart(analysis_result, chart_path):
+    """Save a static dashboard image; returns its path"""
+    from visualizer import export_dashboard
+
+    image_format = os.path.splitext(chart_path)[1].lstrip('.').lower()
+    # Render first, so a missing image backend leaves no empty file behind
+    image = export_dashboard(analysis_result, format=image_format)
+    with open(chart_path, 'wb') as f:
+        f.write(image)
+    return chart_path
+
+
+class JsonlWriter:
+    """Append records to a JSON Lines file"""
+
+    def __init__(self, path, roles):
+        self.file = open(path, 'a', encoding='utf-8')
+
+    def write(self, record):
+        self.file.write(json.dumps(record) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class CsvWriter:
+    """Append flattened records to a CSV file, one match column per role"""
+
+    def __init__(self, path, roles):
+        self.roles = roles
+        write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, 'a', encoding='utf-8', newline='')
+        self.fields = ['path', 'status', 'error', 'email', 'phone', 'total_experience',
+                       'skills', 'best_role', 'duplicate_of'] + [f'match_{role}' for role in roles]
+        self.writer = csv.DictWriter(self.file, fieldnames=self.fields)
+        if write_header:
+            self.writer.writeheader()
+
+    def write(self, record):
+        contact_info = record.get('contact_info') or {}
+        row = {
+            'path': record['path'],
+            'status': record['status'],
+            'error': record['error'],
+            'email': contact_info.get('email'),
+            'phone': contact_info.get('phone'),
+            'total_experience': record.get('total_experience'),
+            'skills': ';'.join(record.get('skills', [])),
+            'best_role': record.get('best_role'),
+            'duplicate_of': record.get('duplicate_of'),
+        }
+        for role in self.roles:
+            row[f'match_{role}'] = record.get('matches', {}).get(role)
+        self.writer.writerow(row)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def load_completed(output_path):
+    """Return the paths already present in a previous run's output"""
+    if not os.path.exists(output_path):
+        return set()
+
+    completed = set()
+    with open(output_path, encoding='utf-8', newline='') as f:
+        if output_path.endswith('.csv'):
+            for row in csv.DictReader(f):
+                completed.add(row['path'])
+        else:
+            for line in f:
+                try:
+                    completed.add(json.loads(line)['path'])
+                except (ValueError, KeyError):
+                    # A truncated last line from an interrupted run is retried
+                    continue
+    return completed
+
+
+def run_batch(paths, output_path, roles, workers=None, timeout=None, index_path=None,
+              charts_dir=None, chart_format='svg', limits=None, dedup_threshold=None, store_path=None):
+    """Score every path across a process pool, streaming records to output_path
+
+    With `index_path`, each parsed resume's skills are also added to the
+    on-disk SkillIndex under its path. With `charts_dir`, a static dashboard
+    image is saved per resume. With `limits`, PDFs are extracted in
+    sandboxed child processes (see analyze_pdf). With `dedup_threshold`,
+    each PDF is first extracted and MinHashed; one whose estimated
+    similarity to an earlier PDF of this run reaches the threshold is not
+    parsed but recorded as a duplicate of it. With `store_path`, records
+    are also appended to a partitioned Parquet ResultStore there.
+    """
+    completed = load_completed(output_path)
+    pending = [path for path in paths if path not in completed]
+    writer_class = CsvWriter if output_path.endswith('.csv') else JsonlWriter
+    writer = writer_class(output_path, roles)
+    index = SkillIndex(index_path) if index_path else None
+    workers = workers or os.cpu_count() or 1
+    if charts_dir:
+        os.makedirs(charts_dir, exist_ok=True)
+    lsh = dedup.LSHIndex(dedup_threshold) if dedup_threshold else None
+    store = ResultStore(store_path) if store_path else None
+    unstored = []
+    # DUPLICATE_FIELDS of every finished original, and duplicates waiting
+    # for an original that hasn't been written yet
+    originals = {}
+    held = {}
+
+    # Load models once in the parent so forked workers start warm
+    models.warm_up()
+
+    processed = 0
+    duplicates = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            # Keep a bounded number of tasks in flight so huge batches stream.
+            # Files are analyzed in chunks, so spaCy NER runs over a chunk's
+            # texts at once; with dedup, originals are chunked after their
+            # fingerprint shows they aren't duplicates.
+            queue = iter(pending)
+            exhausted = False
+            originals_ready = []
+            in_flight = {}
+            while True:
+                while len(in_flight) < workers * 2:
+                    fingerprinting = any(kind == 'fingerprint' for kind, _ in in_flight.values())
+                    if originals_ready and (len(originals_ready) >= PARSE_BATCH_SIZE
+                                            or (exhausted and not fingerprinting)):
+                        chunk = originals_ready[:PARSE_BATCH_SIZE]
+                        del originals_ready[:PARSE_BATCH_SIZE]
+                        future = pool.submit(analyze_files, [path for path, _ in chunk], roles, timeout,
+                                             charts_dir, chart_format, limits, [text for _, text in chunk])
+                        in_flight[future] = ('analyze', None)
+                        continue
+                    if exhausted:
+                        break
+                    if lsh is not None:
+                        path = next(queue, None)
+                        if path is None:
+                            exhausted = True
+                            continue
+                        future = pool.submit(fingerprint_file, path, limits, lsh.num_perm, timeout)
+                        in_flight[future] = ('fingerprint', path)
+                    else:
+                        chunk = list(islice(queue, PARSE_BATCH_SIZE))
+                        if not chunk:
+                            exhausted = True
+                            continue
+                        future = pool.submit(analyze_files, chunk, roles, timeout, charts_dir, chart_format, limits)
+                        in_flight[future] = ('analyze', None)
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, path = in_flight.pop(future)
+                    result = future.result()
+
+                    if kind == 'analyze':
+                        records = result
+                    elif isinstance(result, tuple):
+                        text, signature = result
+                        match = lsh.find_duplicate(signature)
+                        if match is None:
+                            lsh.insert(path, signature)
+                            originals_ready.append((path, text))
+                            continue
+                        original, score = match
+                        duplicates += 1
+                        if original not in originals:
+                            # The original is still being parsed; write this once it is
+                            held.setdefault(original, []).append((path, score))
+                            continue
+                        records = [_duplicate_record(path, original, score, originals[original])]
+                    else:
+                        records = [result]
+
+                    while records:
+                        record = records.pop(0)
+                        writer.write(record)
+                        if lsh is not None and record['status'] != 'duplicate':
+                            fields = {key: record[key] for key in DUPLICATE_FIELDS if key in record}
+                            originals[record['path']] = fields
+                            records.extend(_duplicate_record(duplicate, record['path'], score, fields)
+                                           for duplicate, score in held.pop(record['path'], ()))
+                        if index is not None and record['status'] == 'ok' and 'skill_proficiency' in record:
+                            index.add(record['path'], record['skill_proficiency'])
+                        if store is not None:
+                            unstored.append(record)
+                            if len(unstored) >= STORE_BATCH_ROWS:
+                                store.append(unstored)
+                                unstored = []
+                        processed += 1
+    finally:
+        if store is not None:
+            store.append(unstored)
+        writer.close()
+        if index is not None:
+            index.close()
+
+    return {'skipped': len(paths) - len(pending), 'processed': processed, 'duplicates': duplicates}
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Analyze a batch of PDF resumes")
+    arg_parser.add_argument('source', help="directory of PDFs or a manifest file with one path per line")
+    arg_parser.add_argument('-o', '--output', default='results.jsonl',
+                            help="output file; .csv writes CSV, anything else JSON Lines")
+    arg_parser.add_argument('-r', '--role', action='append', dest='roles', choices=list(JOB_SKILLS),
+                            help="job role to score against (repeatable, default: all roles)")
+    arg_parser.add_argument('-w', '--workers', type=int, default=None,
+                            help="worker processes (default: number of CPU cores)")
+    arg_parser.add_argument('-t', '--timeout', type=float, default=60.0,
+                            help="per-file time budget in seconds (0 disables)")
+    arg_parser.add_argument('--index', default=None,
+                            help="also add parsed skills to this skill index database")
+    arg_parser.add_argument('--charts', default=None,
+                            help="save a static dashboard image per resume in this directory (needs kaleido)")
+    arg_parser.add_argument('--chart-format', choices=['svg', 'png'], default='svg')
+    arg_parser.add_argument('--guarded', action='store_true',
+                            help="extract each PDF in a memory-capped child process with page and size budgets")
+    arg_parser.add_argument('--max-pages', type=int, default=None, help="guarded mode: pages read per PDF")
+    arg_parser.add_argument('--max-memory-mb', type=int, default=None, help="guarded mode: child memory ceiling")
+    arg_parser.add_argument('--dedup', type=float, default=None, metavar='THRESHOLD',
+                            help=f"skip parsing near-duplicates at this estimated similarity "
+                                 f"(e.g. {dedup.DEFAULT_THRESHOLD})")
+    arg_parser.add_argument('--store', default=None,
+                            help="also append records to a partitioned Parquet result store in this directory")
+    args = arg_parser.parse_args(argv)
+
+    limits = None
+    if args.guarded:
+        limits = {'max_pages': args.max_pages, 'max_memory_mb': args.max_memory_mb}
+        if args.timeout:
+            # Leave the rest of the budget for parsing
+            limits['timeout'] = args.timeout / 2
+
+    paths = collect_pdfs(args.source)
+    roles = args.roles or list(JOB_SKILLS)
+    summary = run_batch(paths, args.output, roles, workers=args.workers, timeout=args.timeout or None,
+                        index_path=args.index, charts_dir=args.charts, chart_format=args.chart_format,
+                        limits=limits, dedup_threshold=args.dedup, store_path=args.store)
+    print(f"Processed {summary['processed']} resumes ({summary['duplicates']} near-duplicates), "
+          f"skipped {summary['skipped']} already in {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
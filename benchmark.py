@@ -0,0 +1,186 @@
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from synthetic_corpus import generate_corpus
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# ResumeParser methods benchmarked on raw text; the rest get cleaned text, as
+# in parse_resume
+RAW_TEXT_METHODS = ['clean_text', 'extract_contact_info', 'identify_resume_sections', 'parse_text']
+CLEANED_TEXT_METHODS = ['extract_education', 'extract_experience', 'extract_skills']
+VISUALIZER_FUNCTIONS = [
+    'create_skills_chart', 'create_match_visualization', 'create_skills_distribution_bar',
+    'create_match_gauge', 'create_skills_radar'
+]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MB (None if unknown)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(fn, inputs, repeat=1, setup=None):
+    """Call fn on every input `repeat` times and summarize the latencies
+
+    `setup`, e.g. a cache's clear(), runs untimed before every call.
+    """
+    latencies = []
+    for _ in range(repeat):
+        for item in inputs:
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            fn(item)
+            latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        'calls': len(latencies),
+        'throughput_per_s': round(len(latencies) / total, 2) if total else None,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def _run_case(results, name, fn, inputs, repeat, setup=None):
+    try:
+        results[name] = measure(fn, inputs, repeat, setup)
+    except ImportError as e:
+        # Optional dependency missing in this environment
+        results[name] = {'error': str(e)}
+
+
+def run_benchmarks(paths, repeat=3, pdf=True):
+    """Benchmark every pipeline stage over the corpus; returns a JSON-ready dict"""
+    from extractor import extract_text_from_pdf
+    import matcher
+    from matcher import JOB_SKILLS, analyze_resume
+    from resume_parser import ResumeParser
+
+    texts = []
+    for base in paths:
+        with open(base + '.txt', encoding='utf-8') as f:
+            texts.append(f.read())
+
+    results = {}
+    if pdf:
+        pdf_bytes = []
+        for base in paths:
+            with open(base + '.pdf', 'rb') as f:
+                pdf_bytes.append(f.read())
+        _run_case(results, 'extractor.extract_text_from_pdf', extract_text_from_pdf, pdf_bytes, repeat)
+
+    # Plain strings are passed on purpose, so each method pays its own
+    # annotation cost as it would when called on its own
+    parser = ResumeParser()
+    cleaned = [parser.clean_text(text) for text in texts]
+    for method in RAW_TEXT_METHODS:
+        _run_case(results, f'ResumeParser.{method}', getattr(parser, method), texts, repeat)
+    for method in CLEANED_TEXT_METHODS:
+        _run_case(results, f'ResumeParser.{method}', getattr(parser, method), cleaned, repeat)
+    skills = [parser.skill_matcher.extract(text) for text in cleaned]
+    _run_case(results, 'ResumeParser.calculate_skill_proficiency',
+              lambda pair: parser.calculate_skill_proficiency(*pair), list(zip(cleaned, skills)), repeat)
+
+    roles = list(JOB_SKILLS)
+    # Cold: profiles and role scores are cached per resume, so clear them
+    # to time building them; the cached case times a repeat lookup
+    _run_case(results, 'matcher.analyze_resume',
+              lambda text: [analyze_resume(text, role) for role in roles], texts, repeat,
+              setup=matcher.clear_cache)
+    _run_case(results, 'matcher.analyze_resume.cached',
+              lambda text: [analyze_resume(text, role) for role in roles], texts, repeat)
+
+    analyses = [analyze_resume(text, roles[i % len(roles)]) for i, text in enumerate(texts)]
+    try:
+        import visualizer
+    except ImportError as e:
+        for name in VISUALIZER_FUNCTIONS:
+            results[f'visualizer.{name}'] = {'error': str(e)}
+    else:
+        for name in VISUALIZER_FUNCTIONS:
+            # The figures are memoized; time building them, not cache hits
+            _run_case(results, f'visualizer.{name}', getattr(visualizer, name), analyses, repeat,
+                      setup=visualizer.clear_cache)
+
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, current):
+    """Relative p50 change per case, positive means slower than the baseline"""
+    changes = {}
+    for name, result in current['results'].items():
+        before = baseline['results'].get(name, {})
+        if result.get('p50_ms') and before.get('p50_ms'):
+            changes[name] = round((result['p50_ms'] - before['p50_ms']) / before['p50_ms'] * 100, 1)
+    return changes
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Benchmark the resume analysis pipeline")
+    arg_parser.add_argument('-o', '--output', default='benchmark_results.json')
+    arg_parser.add_argument('-n', '--count', type=int, default=20, help="synthetic resumes to generate")
+    arg_parser.add_argument('--sections', type=int, default=4, help="experience entries and projects per resume")
+    arg_parser.add_argument('--skill-density', type=float, default=0.2)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--text-only', action='store_true', help="skip PDF generation and extraction")
+    arg_parser.add_argument('--compare', default=None, help="previous results JSON to diff p50 latencies against")
+    args = arg_parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        paths = generate_corpus(
+            corpus_dir, args.count, args.sections, args.skill_density, args.seed, pdf=not args.text_only
+        )
+        results = run_benchmarks(paths, repeat=args.repeat, pdf=not args.text_only)
+
+    report = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parameters': {key: value for key, value in vars(args).items() if key not in ('output', 'compare')},
+        'results': results,
+    }
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            report['p50_change_pct'] = compare(json.load(f), report)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import re
+import zlib
+
+import numpy as np
+
+# Near-duplicate detection: MinHash signatures over word shingles of the
+# cleaned resume text, bucketed by locality-sensitive hashing so a new
+# resume is only compared with the few stored ones that share a band.
+DEFAULT_THRESHOLD = 0.85
+DEFAULT_NUM_PERM = 128
+SHINGLE_SIZE = 5
+# Words only, so bullets and separators that change between exports don't matter
+_WORD_PATTERN = re.compile(r'\w+')
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """Stable 32-bit hashes of every run of `size` consecutive words"""
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) <= size:
+        return {zlib.crc32(' '.join(words).encode('utf-8'))} if words else set()
+    return {
+        zlib.crc32(' '.join(words[i:i + size]).encode('utf-8'))
+        for i in range(len(words) - size + 1)
+    }
+
+
+class MinHasher:
+    """`num_perm` universal hash functions; equal seeds give equal signatures in every process"""
+
+    def __init__(self, num_perm=DEFAULT_NUM_PERM, seed=1):
+        self.num_perm = num_perm
+        rng = np.random.RandomState(seed)
+        # a, b < 2**32 and shingle hashes < 2**32, so a * x + b fits in uint64
+        self.a = rng.randint(1, int(_MAX_HASH), size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, int(_MAX_HASH), size=num_perm, dtype=np.uint64)
+
+    def signature(self, shingle_set):
+        """MinHash signature (uint64 array of num_perm values) of a set of shingle hashes"""
+        if not shingle_set:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        values = np.fromiter(shingle_set, dtype=np.uint64, count=len(shingle_set))
+        # One row per shingle, one column per hash function; column minima
+        hashed = (np.outer(values, self.a) + self.b) % _MERSENNE_PRIME & _MAX_HASH
+        return hashed.min(axis=0)
+
+    def text_signature(self, text, shingle_size=SHINGLE_SIZE):
+        return self.signature(shingles(text, shingle_size))
+
+
+def similarity(signature, other):
+    """Estimated Jaccard similarity of the shingle sets behind two signatures"""
+    return float(np.count_nonzero(signature == other)) / len(signature)
+
+
+def optimal_bands(threshold, num_perm):
+    """(bands, rows) whose LSH S-curve, (1/b)**(1/r), crosses closest to threshold"""
+    best = None
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        crossing = (1.0 / bands) ** (1.0 / rows)
+        error = abs(crossing - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class LSHIndex:
+    """Banded LSH over MinHash signatures with an exact signature check on candidates"""
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, num_perm=DEFAULT_NUM_PERM):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+        self._buckets = [{} for _ in range(self.bands)]
+        self.signatures = {}
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def __contains__(self, key):
+        return key in self.signatures
+
+    def _band_keys(self, signature):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def insert(self, key, signature):
+        if key in self.signatures:
+            raise ValueError(f"'{key}' is already in the index")
+        self.signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+    def query(self, signature):
+        """Stored keys at or above the threshold, as (key, similarity), most similar first"""
+        candidates = set()
+        for band, band_key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        matches = []
+        for key in candidates:
+            score = similarity(signature, self.signatures[key])
+            if score >= self.threshold:
+                matches.append((key, score))
+        matches.sort(key=lambda match: -match[1])
+        return matches
+
+    def find_duplicate(self, signature):
+        """The most similar stored key as (key, similarity), or None"""
+        matches = self.query(signature)
+        return matches[0] if matches else None
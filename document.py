@@ -0,0 +1,90 @@
+from functools import cached_property
+
+from sections import section_text, segment_resume
+
+
+class AnnotatedText:
+    """Cleaned text plus annotations that are computed once, on first use
+
+    Every ResumeParser extractor accepts either a plain string or one of
+    these, so extractors working on the same text share its sentence
+    split, rule and skill matches and spaCy Doc.
+    """
+
+    def __init__(self, text, parser):
+        self.text = text
+        self.parser = parser
+        self._rule_hits = {}
+
+    def __str__(self):
+        return self.text
+
+    @cached_property
+    def sentence_spans(self):
+        """(start, end) offsets of sentences from NLTK's punkt tokenizer"""
+        import nltk
+
+        self.parser.setup_nltk()
+        # The tokenizer sent_tokenize uses, asked for offsets instead of strings
+        tokenizer = nltk.data.load('tokenizers/punkt/english.pickle')
+        return list(tokenizer.span_tokenize(self.text))
+
+    @cached_property
+    def sentences(self):
+        """Sentence strings, as sent_tokenize would return them"""
+        return [self.text[start:end] for start, end in self.sentence_spans]
+
+    def rule_hits(self, kinds=None):
+        """extraction_rules.Hit for every match of the parser's rules of these kinds, in one pass"""
+        key = None if kinds is None else tuple(sorted(kinds))
+        if key not in self._rule_hits:
+            self._rule_hits[key] = self.parser.rule_set.scan(self.text, key)
+        return self._rule_hits[key]
+
+    @cached_property
+    def skill_matches(self):
+        """(start, end, skill, category) for every skill the parser's matcher finds"""
+        return self.parser.skill_matcher.find_all(self.text)
+
+    @cached_property
+    def spacy_doc(self):
+        """spaCy Doc of the text, or None when no model is installed"""
+        nlp = self.parser.nlp
+        return nlp(self.text) if nlp else None
+
+
+class ResumeDocument:
+    """One resume's raw text with shared annotations for every pipeline stage
+
+    `scope(extractor)` returns the AnnotatedText of the sections that
+    extractor reads (see ResumeParser.extractor_sections); `results` holds
+    finished stage outputs so a stage can be cached, pre-filled or skipped.
+    """
+
+    def __init__(self, raw_text, parser, results=None):
+        self.raw_text = raw_text
+        self.parser = parser
+        self.results = dict(results or {})
+        self._scopes = {}
+
+    @cached_property
+    def cleaned(self):
+        """Annotated cleaned text of the whole resume"""
+        return AnnotatedText(self.parser.clean_text(self.raw_text), self.parser)
+
+    @cached_property
+    def sections(self):
+        """Sections found in the raw text, which still has its line breaks"""
+        return segment_resume(self.raw_text, self.parser.section_headers)
+
+    def scope(self, extractor):
+        """Annotated cleaned text of the sections an extractor reads"""
+        if extractor not in self._scopes:
+            names = self.parser.extractor_sections[extractor]
+            scoped = section_text(self.raw_text, self.sections, names)
+            if scoped is None:
+                # No matching section: fall back to the whole resume
+                self._scopes[extractor] = self.cleaned
+            else:
+                self._scopes[extractor] = AnnotatedText(self.parser.clean_text(scoped), self.parser)
+        return self._scopes[extractor]
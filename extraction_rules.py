@@ -0,0 +1,139 @@
+import re
+from collections import namedtuple
+
+# Declarative extraction rules: contact details, years of experience, job
+# titles and degree keywords. Every rule is compiled into one scanner, so a
+# single pass over the text finds all of them and a new rule costs another
+# alternative, not another pass. A rule may mark the part of its match to
+# keep with a (?P<value>...) group and convert it with a post-processor, and
+# list the characters a match can start with in `first` so the scanner can
+# rule it out at a glance wherever another character is.
+Rule = namedtuple('Rule', ['name', 'kind', 'pattern', 'post', 'first'], defaults=[None, None])
+Hit = namedtuple('Hit', ['name', 'kind', 'value', 'start', 'end'])
+
+
+def keywords(words):
+    """Pattern matching any of the words as a substring, longest match first
+
+    The words are merged into a prefix tree, e.g. m(?:\\.(?:com|sc)|aster),
+    so each position costs one test per distinct first letter rather than
+    one per word.
+    """
+    tree = {}
+    for word in words:
+        node = tree
+        for char in word.lower():
+            node = node.setdefault(char, {})
+        node[''] = {}
+    return _trie_pattern(tree)
+
+
+def first_letters(words):
+    """`first` for a keywords() rule"""
+    return ''.join(sorted({word[0].lower() for word in words}))
+
+
+def _trie_pattern(node):
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    if '' in node:
+        # A word ends here; the longer words through this node are optional
+        return '(?:' + '|'.join(branches) + ')?'
+    if len(branches) == 1:
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')'
+
+
+DEGREE_KEYWORDS = [
+    'bachelor', 'master', 'phd', 'doctorate', 'diploma', 'certificate',
+    'b.tech', 'm.tech', 'b.sc', 'm.sc', 'mba', 'bba', 'b.com', 'm.com'
+]
+
+RULES = (
+    # Contact details (ResumeParser.extract_contact_info keeps the first of each)
+    Rule('email', 'contact', r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', first=r'\w.%+-'),
+    Rule('phone', 'contact', r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', first=r'+(\d'),
+    Rule('linkedin', 'contact', r'linkedin\.com/in/[\w\-]+'),
+    Rule('github', 'contact', r'github\.com/[\w\-]+'),
+    # Stated years of experience
+    Rule('years', 'experience', r'(?P<value>\d+)[\+\s]*years?\s+(?:of\s+)?experience', int, first=r'\d'),
+    Rule('years', 'experience', r'experience[:\s]+(?P<value>\d+)[\+\s]*years?', int),
+    Rule('years', 'experience', r'(?P<value>\d+)[\+\s]*yrs?\s+(?:of\s+)?(?:exp|experience)', int, first=r'\d'),
+    # Common job titles
+    Rule('job_title', 'title',
+         r'(?:software|senior|junior|lead|principal)\s+(?:developer|engineer|analyst|manager)', first='sjlp'),
+    Rule('job_title', 'title', r'(?:data|business|product|project)\s+(?:scientist|analyst|manager)', first='dbp'),
+    Rule('job_title', 'title', r'(?:full stack|frontend|backend)\s+developer', first='fb'),
+    # Degree mentions; ResumeParser.extract_education keeps their sentences
+    Rule('degree', 'education', keywords(DEGREE_KEYWORDS), first=first_letters(DEGREE_KEYWORDS)),
+)
+
+
+def _escape_class(chars):
+    # Keep \d and \w shorthands, escape characters special in a class
+    return re.sub(r'(?<!\\)([\]\[^-])', r'\\\1', chars)
+
+
+class RuleSet:
+    """Rules compiled into a single case-insensitive scanner
+
+    The rules are alternatives inside one lookahead, so the scan reports a
+    hit at every position where some rule matches without consuming text
+    another rule might need. An empty group r<i> after rule i's pattern
+    tells which rule matched and where its match ends. Hits of the same
+    rule never overlap, as with one re.finditer per rule; where two rules
+    match at the same position the earlier rule wins.
+
+    scan() covers every rule; scan(text, kinds) uses a scanner compiled for
+    just the rules of those kinds, for callers that need only some of them.
+    """
+
+    def __init__(self, rules=RULES):
+        self.rules = tuple(rules)
+        parts = []
+        for i, rule in enumerate(self.rules):
+            pattern = rule.pattern.replace('(?P<value>', f'(?P<r{i}_value>')
+            if rule.first:
+                # A one-character test before the rule's own pattern
+                pattern = f'(?=[{_escape_class(rule.first)}]){pattern}'
+            parts.append(f'{pattern}(?P<r{i}>)')
+        self.pattern = re.compile('(?=' + '|'.join(parts) + ')', re.IGNORECASE)
+        self._group_rules = {f'r{i}': i for i in range(len(self.rules))}
+        self._value_groups = [
+            f'r{i}_value' if f'r{i}_value' in self.pattern.groupindex else None for i in range(len(self.rules))
+        ]
+        self._subsets = {}
+
+    def subset(self, kinds):
+        """RuleSet of the rules of the given kinds, compiled once"""
+        key = frozenset(kinds)
+        if key not in self._subsets:
+            self._subsets[key] = RuleSet(rule for rule in self.rules if rule.kind in key)
+        return self._subsets[key]
+
+    def scan(self, text, kinds=None):
+        """Every Hit (of the given kinds) in text, in order of position"""
+        if kinds is not None:
+            return self.subset(kinds).scan(text)
+        hits = []
+        # End of each rule's last hit, so a rule's hits don't overlap
+        last_end = [0] * len(self.rules)
+        for match in self.pattern.finditer(text):
+            i = self._group_rules[match.lastgroup]
+            start, end = match.start(), match.start(match.lastgroup)
+            if start < last_end[i]:
+                continue
+            last_end[i] = end
+
+            rule = self.rules[i]
+            value_group = self._value_groups[i]
+            value = match.group(value_group) if value_group else text[start:end]
+            if rule.post is not None:
+                value = rule.post(value)
+            hits.append(Hit(rule.name, rule.kind, value, start, end))
+        return hits
+
+
+# Compiled once per process and shared by every ResumeParser
+DEFAULT_RULE_SET = RuleSet(RULES)
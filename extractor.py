@@ -1,12 +1,271 @@
-import PyPDF2
+import io
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-def extract_text_from_pdf(pdf_path):
+import instrumentation
+
+# Backend used when callers don't pick one; run extractor_benchmark.py on a
+# sample of real resumes to find the fastest correct backend for a deployment
+DEFAULT_BACKEND = os.environ.get('RESUME_PDF_BACKEND', 'pypdf2')
+# Below this many pages, starting worker processes costs more than it saves
+PARALLEL_MIN_PAGES = 16
+
+# Process pool shared by parallel extractions, started on first use
+_pool = None
+_pool_workers = None
+_pool_lock = threading.Lock()
+
+
+def read_pdf_source(source):
+    """Normalize a PDF source to a filesystem path (str) or the PDF bytes
+
+    Accepts paths, bytes, bytearrays, memoryviews and file-like objects such
+    as Streamlit's UploadedFile. In-memory buffers are passed through without
+    copying whenever the underlying object already is a bytes instance.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, memoryview):
+        # getbuffer() views over a bytes object can hand back the object itself
+        if isinstance(source.obj, bytes) and source.nbytes == len(source.obj):
+            return source.obj
+        return source.tobytes()
+    if isinstance(source, bytearray):
+        return bytes(source)
+    if hasattr(source, 'getvalue'):
+        # BytesIO shares its initial bytes with getvalue() until written to
+        return source.getvalue()
+    if hasattr(source, 'read'):
+        return source.read()
+    raise TypeError(f"Unsupported PDF source: {type(source).__name__}")
+
+
+def _open_stream(pdf_source):
+    if isinstance(pdf_source, str):
+        return open(pdf_source, 'rb')
+    return io.BytesIO(pdf_source)
+
+
+def _page_stop(first_page, max_pages, page_count):
+    if max_pages is None:
+        return page_count
+    return min(page_count, first_page + max_pages)
+
+
+def _open_pymupdf(pdf_source):
+    import fitz  # PyMuPDF
+
+    if isinstance(pdf_source, str):
+        return fitz.open(pdf_source)
+    return fitz.open(stream=pdf_source, filetype="pdf")
+
+
+def _iter_pymupdf(pdf_source, max_pages, first_page=0):
+    document = _open_pymupdf(pdf_source)
+    try:
+        for page_num in range(first_page, _page_stop(first_page, max_pages, document.page_count)):
+            yield document[page_num].get_text()
+    finally:
+        document.close()
+
+
+def _iter_pypdf2(pdf_source, max_pages, first_page=0):
+    import PyPDF2
+
+    with _open_stream(pdf_source) as stream:
+        reader = PyPDF2.PdfReader(stream)
+        for page_num in range(first_page, _page_stop(first_page, max_pages, len(reader.pages))):
+            yield reader.pages[page_num].extract_text() or ""
+
+
+def _iter_pdfminer(pdf_source, max_pages, first_page=0):
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+
+    resource_manager = PDFResourceManager()
+    output = io.StringIO()
+    device = TextConverter(resource_manager, output, laparams=LAParams())
+    interpreter = PDFPageInterpreter(resource_manager, device)
+    stop = first_page + max_pages if max_pages is not None else None
+    try:
+        with _open_stream(pdf_source) as stream:
+            for page_num, page in enumerate(PDFPage.get_pages(stream, maxpages=stop or 0)):
+                if page_num < first_page:
+                    # Pages are parsed lazily; skipping one doesn't lay it out
+                    continue
+                interpreter.process_page(page)
+                # Hand out this page's text and reuse the buffer for the next one
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate(0)
+    finally:
+        device.close()
+
+
+BACKENDS = {
+    'pymupdf': _iter_pymupdf,
+    'pdfminer': _iter_pdfminer,
+    'pypdf2': _iter_pypdf2,
+}
+
+
+def page_count(source, backend=None):
+    """Number of pages in a PDF, read from its page tree without extracting text"""
+    backend = backend or DEFAULT_BACKEND
+    pdf_source = read_pdf_source(source)
+    if backend == 'pymupdf':
+        document = _open_pymupdf(pdf_source)
+        try:
+            return document.page_count
+        finally:
+            document.close()
+    if backend == 'pypdf2':
+        import PyPDF2
+
+        with _open_stream(pdf_source) as stream:
+            return len(PyPDF2.PdfReader(stream).pages)
+
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfparser import PDFParser
+    from pdfminer.pdftypes import resolve1
+
+    with _open_stream(pdf_source) as stream:
+        document = PDFDocument(PDFParser(stream))
+        return resolve1(document.catalog['Pages'])['Count']
+
+
+def iter_pages(source, backend=None, max_pages=None, max_bytes=None, page_range=None):
+    """Yield the text of each page in turn, stopping at the page or byte cap
+
+    `page_range` is a (start, stop) pair of 0-based page numbers, stop
+    exclusive or None for the last page. `max_bytes` bounds the UTF-8 size
+    of everything yielded; the page that crosses it is truncated and
+    extraction stops there.
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown PDF backend '{backend}', expected one of {sorted(BACKENDS)}")
+
+    first_page = 0
+    if page_range is not None:
+        first_page, stop = page_range
+        if stop is not None:
+            max_pages = stop - first_page if max_pages is None else min(max_pages, stop - first_page)
+
+    remaining = max_bytes
+    for text in BACKENDS[backend](read_pdf_source(source), max_pages, first_page):
+        instrumentation.count('pages')
+        if remaining is not None:
+            encoded = text.encode('utf-8')
+            if len(encoded) >= remaining:
+                yield encoded[:remaining].decode('utf-8', 'ignore')
+                return
+            remaining -= len(encoded)
+        yield text
+
+
+def _extract_range(pdf_source, backend, start, stop):
+    return list(iter_pages(pdf_source, backend=backend, page_range=(start, stop)))
+
+
+def _get_pool(workers):
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers)
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_pool(pool):
+    """Forget a broken pool so the next parallel extraction starts a fresh one"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+            _pool_workers = None
+    pool.shutdown(wait=False)
+
+
+def extract_pages(source, backend=None, max_pages=None, max_bytes=None, workers=None,
+                  min_pages=PARALLEL_MIN_PAGES):
+    """Text of each page, in page order, extracted by up to `workers` processes
+
+    Page ranges are handed to a shared process pool and every worker opens
+    the document on its own. Documents under `min_pages` pages, and calls
+    with one worker, take the serial iter_pages path. `max_bytes` is
+    applied to the reassembled pages, so it no longer stops work early.
+    """
+    backend = backend or DEFAULT_BACKEND
+    pdf_source = read_pdf_source(source)
+    workers = workers or 1
+    pages = None
+    if workers > 1:
+        pages = page_count(pdf_source, backend)
+        if max_pages is not None:
+            pages = min(pages, max_pages)
+    if pages is None or pages < min_pages:
+        return list(iter_pages(pdf_source, backend=backend, max_pages=max_pages, max_bytes=max_bytes))
+
+    # A few ranges per worker so one slow range doesn't hold up the rest
+    tasks = min(pages, workers * 2)
+    bounds = [pages * i // tasks for i in range(tasks + 1)]
+    spilled = None
+    if not isinstance(pdf_source, str):
+        # Workers get a path, not a pickled copy of the upload per task
+        fd, spilled = tempfile.mkstemp(suffix='.pdf')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(pdf_source)
+    pool = _get_pool(workers)
+    try:
+        futures = [
+            pool.submit(_extract_range, spilled or pdf_source, backend, bounds[i], bounds[i + 1])
+            for i in range(tasks)
+        ]
+        texts = [text for future in futures for text in future.result()]
+    except BrokenProcessPool:
+        # A worker died (e.g. out of memory); replace the pool for later
+        # calls and extract this document serially
+        _discard_pool(pool)
+        return list(iter_pages(pdf_source, backend=backend, max_pages=max_pages, max_bytes=max_bytes))
+    finally:
+        if spilled is not None:
+            os.unlink(spilled)
+    instrumentation.count('pages', len(texts))
+
+    if max_bytes is not None:
+        remaining = max_bytes
+        for i, text in enumerate(texts):
+            encoded = text.encode('utf-8')
+            if len(encoded) >= remaining:
+                texts[i] = encoded[:remaining].decode('utf-8', 'ignore')
+                del texts[i + 1:]
+                break
+            remaining -= len(encoded)
+    return texts
+
+
+def extract_text_from_pdf(source, backend=None, max_pages=None, max_bytes=None, workers=None):
+    """Extract text from a PDF given as a path, bytes, memoryview or file-like object
+
+    With `workers` > 1, large documents are split across processes (see
+    extract_pages).
+    """
     try:
-        with open(pdf_path, 'rb') as f:
-            reader = PyPDF2.PdfReader(f)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + " "
-        return text.strip()
+        if workers and workers > 1:
+            pages = extract_pages(source, backend=backend, max_pages=max_pages, max_bytes=max_bytes,
+                                  workers=workers)
+        else:
+            pages = iter_pages(source, backend=backend, max_pages=max_pages, max_bytes=max_bytes)
+        return " ".join(pages).strip()
     except Exception as e:
         return ""
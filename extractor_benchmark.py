@@ -0,0 +1,101 @@
+import argparse
+import json
+import os
+import re
+import time
+from collections import Counter
+
+from extractor import BACKENDS, extract_text_from_pdf
+
+
+def _tokens(text):
+    return Counter(re.findall(r'\w+', text.lower()))
+
+
+def token_similarity(reference, candidate):
+    """Multiset Jaccard similarity of the words in two texts (1.0 means identical)"""
+    reference_tokens = _tokens(reference)
+    candidate_tokens = _tokens(candidate)
+    union = sum((reference_tokens | candidate_tokens).values())
+    if not union:
+        return 1.0
+    return sum((reference_tokens & candidate_tokens).values()) / union
+
+
+def load_reference(path, reference_backend='pdfminer'):
+    """Expected text for a PDF: a sibling .txt file if present, else the reference backend"""
+    sidecar = os.path.splitext(path)[0] + '.txt'
+    if os.path.exists(sidecar):
+        with open(sidecar, encoding='utf-8') as f:
+            return f.read()
+    return extract_text_from_pdf(path, backend=reference_backend)
+
+
+def benchmark_backends(paths, backends=None, repeat=3, min_similarity=0.9, reference_backend='pdfminer'):
+    """Time every backend over the corpus and check its output against the reference text"""
+    pdf_bytes = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            pdf_bytes[path] = f.read()
+    references = {path: load_reference(path, reference_backend) for path in paths}
+
+    results = []
+    for backend in backends or list(BACKENDS):
+        seconds = 0.0
+        worst_similarity = 1.0
+        error = None
+        try:
+            for path in paths:
+                best = None
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    text = " ".join(BACKENDS[backend](pdf_bytes[path], None))
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                seconds += best
+                worst_similarity = min(worst_similarity, token_similarity(references[path], text))
+        except Exception as e:
+            # Usually the backend's package is not installed
+            error = str(e)
+
+        results.append({
+            'backend': backend,
+            'seconds': round(seconds, 6) if error is None else None,
+            'min_similarity': round(worst_similarity, 4) if error is None else None,
+            'correct': error is None and worst_similarity >= min_similarity,
+            'error': error,
+        })
+    return results
+
+
+def pick_fastest_backend(results):
+    """Name of the fastest backend whose output matched the reference, or None"""
+    candidates = [result for result in results if result['correct']]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda result: result['seconds'])['backend']
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Pick the fastest correct PDF text backend for a corpus")
+    arg_parser.add_argument('corpus', help="directory of sample PDFs (optionally with expected .txt siblings)")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="timed runs per file; the best one counts")
+    arg_parser.add_argument('--min-similarity', type=float, default=0.9,
+                            help="word overlap with the reference text needed to count as correct")
+    arg_parser.add_argument('--reference-backend', default='pdfminer', choices=list(BACKENDS),
+                            help="backend whose output is the reference when no .txt sibling exists")
+    args = arg_parser.parse_args(argv)
+
+    paths = sorted(
+        os.path.join(args.corpus, name) for name in os.listdir(args.corpus) if name.lower().endswith('.pdf')
+    )
+    results = benchmark_backends(paths, repeat=args.repeat, min_similarity=args.min_similarity,
+                                 reference_backend=args.reference_backend)
+    fastest = pick_fastest_backend(results)
+    print(json.dumps({'files': len(paths), 'results': results, 'fastest': fastest}, indent=2))
+    if fastest:
+        print(f"export RESUME_PDF_BACKEND={fastest}")
+
+
+if __name__ == "__main__":
+    main()
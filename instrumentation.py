@@ -0,0 +1,277 @@
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from functools import wraps
+
+# Per-stage timers and counters for one request at a time per thread. Nothing
+# is recorded unless a sink is configured, either with enable() or through
+# RESUME_ANALYZER_METRICS, e.g. "log,memory,prometheus:/var/lib/metrics/resume.prom".
+# Outside a recorded request, stage() hands back a shared no-op context
+# manager and count() returns immediately, so instrumented code pays one
+# thread-local lookup. A request can also be profiled without any sink.
+_enabled = False
+_sinks = []
+_local = threading.local()
+
+
+class Metrics:
+    """Timings, counters and optional profile output collected for one request"""
+
+    def __init__(self, name):
+        self.name = name
+        self.started_at = time.time()
+        self.stages = defaultdict(float)
+        self.counters = defaultdict(int)
+        self.total_seconds = None
+        self.profile = None
+        self.memory = None
+
+    def as_dict(self):
+        return {
+            'name': self.name,
+            'started_at': self.started_at,
+            'total_seconds': self.total_seconds,
+            'stages': dict(self.stages),
+            'counters': dict(self.counters),
+            'profile': self.profile,
+            'memory': self.memory,
+        }
+
+
+class _NullContext:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL = _NullContext()
+
+
+class _Stage:
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.stages[self.name] += time.perf_counter() - self.start
+        return False
+
+
+class _Request:
+    def __init__(self, name, profile):
+        self.name = name
+        self.profile = profile
+        self.metrics = None
+        self.outermost = False
+
+    def __enter__(self):
+        current = getattr(_local, 'metrics', None)
+        if current is not None:
+            # Nested request (e.g. parse_resume inside app.main): join the outer one
+            return current
+
+        self.outermost = True
+        self.metrics = _local.metrics = Metrics(self.name)
+        self.start = time.perf_counter()
+        if self.profile:
+            import cProfile
+            import tracemalloc
+
+            self.started_tracemalloc = not tracemalloc.is_tracing()
+            if self.started_tracemalloc:
+                tracemalloc.start()
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        return self.metrics
+
+    def __exit__(self, *exc_info):
+        if not self.outermost:
+            return False
+
+        metrics = self.metrics
+        if self.profile:
+            self._finish_profile(metrics)
+        metrics.total_seconds = time.perf_counter() - self.start
+        _local.metrics = None
+        for sink in list(_sinks):
+            try:
+                sink.emit(metrics)
+            except Exception:
+                logging.getLogger(__name__).exception("Metrics sink %r failed", sink)
+        return False
+
+    def _finish_profile(self, metrics):
+        import io
+        import pstats
+        import tracemalloc
+
+        self.profiler.disable()
+        output = io.StringIO()
+        pstats.Stats(self.profiler, stream=output).sort_stats('cumulative').print_stats(25)
+        metrics.profile = output.getvalue()
+
+        snapshot = tracemalloc.take_snapshot()
+        metrics.memory = [str(stat) for stat in snapshot.statistics('lineno')[:15]]
+        if self.started_tracemalloc:
+            tracemalloc.stop()
+
+
+def enabled():
+    return _enabled
+
+
+def enable(*sinks):
+    """Start recording and send finished requests to the given sinks"""
+    global _enabled
+    _sinks.extend(sinks)
+    _enabled = bool(_sinks)
+
+
+def disable():
+    global _enabled
+    _enabled = False
+    _sinks.clear()
+
+
+def sinks():
+    return list(_sinks)
+
+
+def request(name, profile=False):
+    """Context manager that scopes metrics to one request; profile adds cProfile and tracemalloc"""
+    if not _enabled and not profile:
+        return _NULL
+    return _Request(name, profile)
+
+
+def stage(name):
+    """Context manager that adds its wall time to the current request's stage total"""
+    metrics = getattr(_local, 'metrics', None)
+    if metrics is None:
+        return _NULL
+    return _Stage(metrics, name)
+
+
+def count(name, value=1):
+    """Add value to a counter on the current request"""
+    metrics = getattr(_local, 'metrics', None)
+    if metrics is not None:
+        metrics.counters[name] += value
+
+
+def timed(name):
+    """Decorator form of stage()"""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if getattr(_local, 'metrics', None) is None:
+                return fn(*args, **kwargs)
+            with stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def current():
+    """Metrics of the request running on this thread, if any"""
+    return getattr(_local, 'metrics', None)
+
+
+class LogSink:
+    """Write one log line per request with its stage timings and counters"""
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger('resume_analyzer.metrics')
+        self.level = level
+
+    def emit(self, metrics):
+        stages = ' '.join(f'{name}={seconds * 1000:.1f}ms' for name, seconds in metrics.stages.items())
+        counters = ' '.join(f'{name}={value}' for name, value in metrics.counters.items())
+        self.logger.log(self.level, 'request=%s total=%.1fms %s %s',
+                        metrics.name, metrics.total_seconds * 1000, stages, counters)
+
+
+class MemorySink:
+    """Keep the most recent requests in memory, e.g. for the app's debug panel"""
+
+    def __init__(self, maxlen=20):
+        self.requests = deque(maxlen=maxlen)
+
+    def emit(self, metrics):
+        self.requests.append(metrics)
+
+    def latest(self):
+        return self.requests[-1] if self.requests else None
+
+
+class PrometheusTextSink:
+    """Maintain running totals in a Prometheus textfile-collector file"""
+
+    def __init__(self, path, prefix='resume_analyzer'):
+        self.path = path
+        self.prefix = prefix
+        self.lock = threading.Lock()
+        self.stage_seconds = defaultdict(float)
+        self.stage_calls = defaultdict(int)
+        self.counters = defaultdict(int)
+        self.requests = defaultdict(int)
+
+    def emit(self, metrics):
+        with self.lock:
+            self.requests[metrics.name] += 1
+            for name, seconds in metrics.stages.items():
+                self.stage_seconds[name] += seconds
+                self.stage_calls[name] += 1
+            for name, value in metrics.counters.items():
+                self.counters[name] += value
+            self._write()
+
+    def _write(self):
+        p = self.prefix
+        lines = [f'# TYPE {p}_requests_total counter']
+        lines += [f'{p}_requests_total{{request="{name}"}} {value}' for name, value in self.requests.items()]
+        lines.append(f'# TYPE {p}_stage_seconds_total counter')
+        lines += [f'{p}_stage_seconds_total{{stage="{name}"}} {value:.6f}'
+                  for name, value in self.stage_seconds.items()]
+        lines.append(f'# TYPE {p}_stage_calls_total counter')
+        lines += [f'{p}_stage_calls_total{{stage="{name}"}} {value}' for name, value in self.stage_calls.items()]
+        lines.append(f'# TYPE {p}_items_total counter')
+        lines += [f'{p}_items_total{{counter="{name}"}} {value}' for name, value in self.counters.items()]
+
+        # Replace atomically so the collector never reads a partial file
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, self.path)
+
+
+def configure_from_env(value=None):
+    """Enable sinks listed in RESUME_ANALYZER_METRICS (log, memory, prometheus:<path>)"""
+    value = os.environ.get('RESUME_ANALYZER_METRICS', '') if value is None else value
+    configured = []
+    for spec in filter(None, (part.strip() for part in value.split(','))):
+        kind, _, argument = spec.partition(':')
+        if kind == 'log':
+            configured.append(LogSink())
+        elif kind == 'memory':
+            configured.append(MemorySink())
+        elif kind == 'prometheus' and argument:
+            configured.append(PrometheusTextSink(argument))
+        else:
+            logging.getLogger(__name__).warning("Ignoring unknown metrics sink '%s'", spec)
+    if configured:
+        enable(*configured)
+    return configured
+
+
+configure_from_env()
@@ -0,0 +1,288 @@
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+
+import numpy as np
+from scipy import sparse
+
+# Job-description matching: resumes and JDs become L2-normalized TF-IDF rows
+# from a vectorizer fitted offline (python jd_matcher.py fit ...), so cosine
+# similarity is a sparse dot product and one JD is ranked against every
+# cached resume with a single matrix-vector product. Without a fitted model
+# a stateless HashingVectorizer is used instead (term frequencies, no IDF).
+DEFAULT_MODEL_PATH = os.environ.get('RESUME_JD_MODEL', 'jd_vectorizer.pkl')
+DEFAULT_VECTOR_DIR = os.environ.get('RESUME_VECTOR_DIR', '.resume_vectors')
+HASHING_FEATURES = 2 ** 18
+
+_lock = threading.Lock()
+_models = {}
+
+
+def fit_vectorizer(texts, min_df=2, max_df=0.9, max_features=200000):
+    """Fit the TF-IDF vocabulary and IDF weights on a corpus of resume and JD texts"""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer(
+        lowercase=True, stop_words='english', ngram_range=(1, 2), sublinear_tf=True,
+        min_df=min_df, max_df=max_df, max_features=max_features, dtype=np.float32,
+    )
+    vectorizer.fit(texts)
+    return vectorizer
+
+
+def save_vectorizer(vectorizer, path=DEFAULT_MODEL_PATH):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(vectorizer, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_vectorizer(path=DEFAULT_MODEL_PATH):
+    """Return (model_key, vectorizer), loading a fitted model once per process
+
+    model_key identifies the feature space, so cached resume rows from
+    another model are never mixed in.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+
+    key = (path, mtime)
+    if key in _models:
+        return _models[key]
+
+    with _lock:
+        if key not in _models:
+            if mtime is None:
+                from sklearn.feature_extraction.text import HashingVectorizer
+
+                vectorizer = HashingVectorizer(
+                    n_features=HASHING_FEATURES, stop_words='english', ngram_range=(1, 2),
+                    alternate_sign=False, norm='l2', dtype=np.float32,
+                )
+                model_key = f'hashing-{HASHING_FEATURES}'
+            else:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                vectorizer = pickle.loads(data)
+                model_key = 'tfidf-' + hashlib.sha1(data).hexdigest()[:16]
+            _models[key] = (model_key, vectorizer)
+    return _models[key]
+
+
+def text_digest(text):
+    """Content hash of a resume text, so an edited resume gets a new vector"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class VectorStore:
+    """Cached sparse resume rows for one model, persisted in a single .npz
+
+    The CSR arrays, resume ids and the digest of each resume's text are
+    saved together and replaced in one os.replace, so the rows and ids
+    can't get out of step. A resume whose text changed is re-vectorized.
+    """
+
+    def __init__(self, directory=DEFAULT_VECTOR_DIR, model_key='default'):
+        self.directory = directory
+        self.path = os.path.join(directory, f'{model_key}.npz')
+        self.resume_ids = []
+        self.digests = []
+        self._index = {}
+        self._matrix = None
+        self._pending = []
+
+        if os.path.exists(self.path):
+            with np.load(self.path, allow_pickle=False) as data:
+                if 'ids' in data and len(data['ids']) == data['shape'][0] == len(data['digests']):
+                    self._matrix = sparse.csr_matrix(
+                        (data['data'], data['indices'], data['indptr']), shape=tuple(data['shape'])
+                    )
+                    self.resume_ids = data['ids'].tolist()
+                    self.digests = data['digests'].tolist()
+            self._index = {resume_id: i for i, resume_id in enumerate(self.resume_ids)}
+
+    def __len__(self):
+        return len(self.resume_ids)
+
+    def __contains__(self, resume_id):
+        return resume_id in self._index
+
+    def digest(self, resume_id):
+        """Text digest the stored row of resume_id was made from, or None"""
+        i = self._index.get(resume_id)
+        return self.digests[i] if i is not None else None
+
+    def add(self, resume_ids, rows, digests):
+        """Store one CSR row per resume id and text digest
+
+        Ids stored with the same digest are skipped; ids whose text changed
+        have their old row replaced.
+        """
+        keep = [i for i, resume_id in enumerate(resume_ids) if self.digest(resume_id) != digests[i]]
+        if not keep:
+            return 0
+        stale = {self._index[resume_ids[i]] for i in keep if resume_ids[i] in self._index}
+        if stale:
+            self._drop(stale)
+        for i in keep:
+            self._index[resume_ids[i]] = len(self.resume_ids)
+            self.resume_ids.append(resume_ids[i])
+            self.digests.append(digests[i])
+        self._pending.append(rows[keep])
+        return len(keep)
+
+    def _drop(self, rows):
+        matrix = self.matrix
+        kept = [i for i in range(len(self.resume_ids)) if i not in rows]
+        self._matrix = matrix[kept]
+        self.resume_ids = [self.resume_ids[i] for i in kept]
+        self.digests = [self.digests[i] for i in kept]
+        self._index = {resume_id: i for i, resume_id in enumerate(self.resume_ids)}
+
+    @property
+    def matrix(self):
+        """(resumes x features) CSR matrix, stacking pending rows on first use"""
+        if self._pending:
+            blocks = ([self._matrix] if self._matrix is not None else []) + self._pending
+            self._matrix = sparse.vstack(blocks, format='csr')
+            self._pending = []
+        return self._matrix
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        matrix = self.matrix
+        if matrix is None:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.npz')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(
+                    f, data=matrix.data, indices=matrix.indices, indptr=matrix.indptr,
+                    shape=np.asarray(matrix.shape), ids=np.asarray(self.resume_ids, dtype=str),
+                    digests=np.asarray(self.digests, dtype=str),
+                )
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class JDMatcher:
+    """Score and rank resumes against free-text job descriptions"""
+
+    def __init__(self, model_path=DEFAULT_MODEL_PATH, vector_dir=DEFAULT_VECTOR_DIR):
+        self.model_key, self.vectorizer = load_vectorizer(model_path)
+        self.store = VectorStore(vector_dir, self.model_key)
+
+    def vectorize(self, texts):
+        """L2-normalized (len(texts) x features) CSR matrix"""
+        return self.vectorizer.transform(texts).tocsr()
+
+    def similarity(self, jd_text, resume_text):
+        """Cosine similarity of one JD and one resume, in [0, 1]"""
+        rows = self.vectorize([jd_text, resume_text])
+        return float(rows[0].multiply(rows[1]).sum())
+
+    def add_resumes(self, resumes, save=True):
+        """Vectorize and cache {resume_id: text}; returns how many were new or changed"""
+        pending = {}
+        for resume_id, text in dict(resumes).items():
+            digest = text_digest(text)
+            if self.store.digest(resume_id) != digest:
+                pending[resume_id] = (text, digest)
+        if not pending:
+            return 0
+        texts = [text for text, _ in pending.values()]
+        digests = [digest for _, digest in pending.values()]
+        added = self.store.add(list(pending), self.vectorize(texts), digests)
+        if save:
+            self.store.save()
+        return added
+
+    def score_matrix(self, jd_texts):
+        """Dense (cached resumes x JDs) cosine similarities from one sparse product"""
+        matrix = self.store.matrix
+        if matrix is None:
+            return np.zeros((0, len(jd_texts)), dtype=np.float32)
+        return (matrix @ self.vectorize(jd_texts).T).toarray()
+
+    def rank(self, jd_text, top_k=20):
+        """Best top_k (resume_id, similarity) pairs for a JD, highest first"""
+        scores = self.score_matrix([jd_text])[:, 0]
+        k = min(top_k, len(scores))
+        if k <= 0:
+            return []
+        # argpartition finds the k best without sorting the whole corpus
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return [(self.store.resume_ids[i], float(scores[i])) for i in best]
+
+
+def _read_corpus(directory):
+    """{path: text} for every .txt and .pdf file under directory"""
+    from extractor import extract_text_from_pdf
+
+    texts = {}
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            if name.lower().endswith('.txt'):
+                with open(path, encoding='utf-8', errors='ignore') as f:
+                    texts[path] = f.read()
+            elif name.lower().endswith('.pdf'):
+                text = extract_text_from_pdf(path)
+                if text:
+                    texts[path] = text
+    return texts
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Match resumes against job descriptions")
+    arg_parser.add_argument('--model', default=DEFAULT_MODEL_PATH, help="fitted vectorizer file")
+    arg_parser.add_argument('--vectors', default=DEFAULT_VECTOR_DIR, help="directory of cached resume vectors")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    fit = commands.add_parser('fit', help="fit the TF-IDF vocabulary and IDF offline")
+    fit.add_argument('corpus', help="directory of .txt/.pdf resumes and job descriptions")
+    fit.add_argument('--min-df', type=int, default=2)
+
+    index = commands.add_parser('index', help="vectorize resumes into the cache")
+    index.add_argument('corpus', help="directory of .txt/.pdf resumes")
+
+    rank = commands.add_parser('rank', help="rank cached resumes against a job description")
+    rank.add_argument('jd', help="job description text file, or - for stdin")
+    rank.add_argument('-k', '--top', type=int, default=20)
+    args = arg_parser.parse_args(argv)
+
+    if args.command == 'fit':
+        texts = _read_corpus(args.corpus)
+        save_vectorizer(fit_vectorizer(list(texts.values()), min_df=args.min_df), args.model)
+        print(f"Fitted on {len(texts)} documents, saved to {args.model}", file=sys.stderr)
+    elif args.command == 'index':
+        matcher = JDMatcher(args.model, args.vectors)
+        added = matcher.add_resumes(_read_corpus(args.corpus))
+        print(f"Added {added} resumes, {len(matcher.store)} cached for {matcher.model_key}", file=sys.stderr)
+    else:
+        if args.jd == '-':
+            jd_text = sys.stdin.read()
+        else:
+            with open(args.jd, encoding='utf-8') as f:
+                jd_text = f.read()
+        for resume_id, score in JDMatcher(args.model, args.vectors).rank(jd_text, args.top):
+            print(f"{score:.3f}\t{resume_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,171 @@
-def analyze_resume(resume_text, selected_role):
-    # Define skills per role (expand as needed)
-    job_skills_dict = {
-        "Data Scientist": ["Python", "Machine Learning", "Statistics", "SQL", "Pandas"],
-        "ML Engineer": ["Python", "TensorFlow", "PyTorch", "Machine Learning", "Docker"],
-        "Software Developer": ["Java", "C++", "Git", "Agile", "SQL"],
-        "Business Analyst": ["Excel", "PowerPoint", "SQL", "Communication", "Problem Solving"],
-        "Product Manager": ["Roadmapping", "Agile", "Communication", "Leadership", "Analytics"],
-        "DevOps Engineer": ["Docker", "Kubernetes", "AWS", "CI/CD", "Linux"],
-        "Frontend Developer": ["JavaScript", "React", "CSS", "HTML", "Git"],
-        "Backend Developer": ["Python", "Django", "APIs", "SQL", "Docker"],
-        "Full Stack Developer": ["JavaScript", "React", "Node.js", "SQL", "Git"],
-        "Data Analyst": ["Excel", "SQL", "Tableau", "Python", "Statistics"]
-    }
-
-    required_skills = job_skills_dict.get(selected_role, [])
-
-    # Simple skill extraction: split words, title-case for matching
-    words = resume_text.split()
-    resume_skills = list(set([w.strip(",.()").title() for w in words if len(w) > 2]))
-
-    matched_skills = list(set(resume_skills) & set(required_skills))
-    missing_skills = list(set(required_skills) - set(matched_skills))
-    match_percentage = (len(matched_skills) / len(required_skills) * 100) if required_skills else 0.0
-
-    return {
-        'resume_skills': resume_skills,
-        'job_skills': required_skills,
-        'matched_skills': matched_skills,
-        'missing_skills': missing_skills,
-        'match_percentage': match_percentage
-    }
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
+
+import taxonomy
+
+
+class _RoleSkills(Mapping):
+    """Read-only {role: [skills]} view of the live taxonomy (taxonomy/roles.json)"""
+
+    def __getitem__(self, role):
+        if role not in taxonomy.current().roles:
+            raise KeyError(role)
+        return taxonomy.current().role_skills(role)
+
+    def __iter__(self):
+        return iter(taxonomy.current().role_names())
+
+    def __len__(self):
+        return len(taxonomy.current().roles)
+
+
+# Skills per role; edit taxonomy/roles.json to add roles or change them
+JOB_SKILLS = _RoleSkills()
+
+
+# Resumes whose skill profiles are kept, so a role switch only re-scores
+PROFILE_CACHE_SIZE = 256
+
+_profiles = OrderedDict()
+_parser = None
+
+
+def _get_parser():
+    global _parser
+    if _parser is None:
+        # Imported here: the parser pulls in the PDF and NLP helpers
+        from resume_parser import ResumeParser
+
+        _parser = ResumeParser()
+    return _parser
+
+
+class SkillProfile:
+    """Canonical skills found in one resume with their proficiency (1-5)
+
+    Built once per resume; score(role) is cheap and memoized, so comparing
+    the same resume against many roles never re-extracts anything.
+    """
+
+    def __init__(self, skills, proficiency=None):
+        # {canonical skill: category}
+        self.skills = skills
+        proficiency = proficiency or {}
+        self.proficiency = {skill: proficiency.get(skill, 2) for skill in skills}
+        self._scores = {}
+
+    @classmethod
+    def from_resume_data(cls, resume_data):
+        """Reuse ResumeParser.parse_resume output: its categorized skills and proficiency"""
+        skills = {
+            skill: category
+            for category, skills_list in resume_data.get('skills_by_category', {}).items()
+            for skill in skills_list
+        }
+        return cls(skills, resume_data.get('skill_proficiency'))
+
+    @classmethod
+    def from_text(cls, text):
+        """One automaton pass over the text, for callers without parse results"""
+        parser = _get_parser()
+        annotated = parser.annotate(text)
+        skills = {}
+        for _, _, skill, category in annotated.skill_matches:
+            skills.setdefault(skill, category)
+        categorized = {}
+        for skill, category in skills.items():
+            categorized.setdefault(category, []).append(skill)
+        return cls(skills, parser.calculate_skill_proficiency(annotated, categorized))
+
+    def score(self, role):
+        """Weighted match of this profile against one role, with a per-category breakdown"""
+        compiled = taxonomy.current()
+        key = (role, compiled.version)
+        if key not in self._scores:
+            self._scores[key] = self._score(compiled.roles.get(role, ()))
+        return self._scores[key]
+
+    def _score(self, requirements):
+        matched, missing = [], []
+        categories = {}
+        total_weight = matched_weight = proficiency_weight = 0.0
+
+        for requirement in requirements:
+            breakdown = categories.setdefault(requirement.category, {
+                'required': [], 'matched': [], 'weight': 0.0, 'matched_weight': 0.0,
+            })
+            breakdown['required'].append(requirement.name)
+            breakdown['weight'] += requirement.weight
+            total_weight += requirement.weight
+
+            if requirement.skill in self.skills:
+                matched.append(requirement.name)
+                breakdown['matched'].append(requirement.name)
+                breakdown['matched_weight'] += requirement.weight
+                matched_weight += requirement.weight
+                proficiency_weight += requirement.weight * self.proficiency[requirement.skill]
+            else:
+                missing.append((requirement.weight, requirement.name))
+
+        for breakdown in categories.values():
+            breakdown['match_percentage'] = breakdown['matched_weight'] / breakdown['weight'] * 100 \
+                if breakdown['weight'] else 0.0
+
+        return {
+            'resume_skills': list(self.skills),
+            'job_skills': [requirement.name for requirement in requirements],
+            'matched_skills': matched,
+            # Heaviest gaps first, so suggestions lead with what matters most
+            'missing_skills': [name for _, name in sorted(missing, key=lambda item: -item[0])],
+            'match_percentage': matched_weight / total_weight * 100 if total_weight else 0.0,
+            # Average proficiency of the matched skills, weighted like the match
+            'proficiency': proficiency_weight / matched_weight if matched_weight else 0.0,
+            'skills_categories': categories,
+        }
+
+
+def _resume_data_digest(resume_data):
+    """Hash of the parse results a SkillProfile is built from"""
+    if resume_data is None:
+        return None
+    skills = {category: sorted(skills_list)
+              for category, skills_list in (resume_data.get('skills_by_category') or {}).items()}
+    data = json.dumps([skills, resume_data.get('skill_proficiency') or {}], sort_keys=True)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def get_profile(resume_text, resume_data=None):
+    """Cached SkillProfile for a resume, built from parse results when given"""
+    # Keyed on what the profile is built from: a re-parse or a taxonomy
+    # reload for the same text gives a new profile
+    key = (hashlib.sha1(resume_text.encode('utf-8')).hexdigest(), _resume_data_digest(resume_data),
+           taxonomy.current().version)
+    profile = _profiles.get(key)
+    if profile is not None:
+        _profiles.move_to_end(key)
+        return profile
+
+    if resume_data is not None:
+        profile = SkillProfile.from_resume_data(resume_data)
+    else:
+        profile = SkillProfile.from_text(resume_text)
+    _profiles[key] = profile
+    if len(_profiles) > PROFILE_CACHE_SIZE:
+        _profiles.popitem(last=False)
+    return profile
+
+
+def clear_cache():
+    """Forget every cached SkillProfile and the role scores memoized on it"""
+    _profiles.clear()
+
+
+def analyze_resume(resume_text, selected_role, resume_data=None):
+    """Score a resume against a role's weighted skill requirements
+
+    Pass `resume_data` (parse_resume output) to reuse its skills and
+    proficiency; otherwise skills are matched in resume_text directly.
+    """
+    return get_profile(resume_text, resume_data).score(selected_role)
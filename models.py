@@ -0,0 +1,76 @@
+import threading
+
+# Process-wide registry of NLP models. Everything is imported and loaded on
+# first use, so importing the app or a batch worker stays cheap.
+_lock = threading.RLock()
+_spacy_models = {}
+_nltk_ready = set()
+
+DEFAULT_SPACY_MODEL = "en_core_web_sm"
+
+# NLTK resources by download name; the parser only needs the sentence tokenizer
+NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger',
+    'maxent_ne_chunker': 'chunkers/maxent_ne_chunker',
+    'words': 'corpora/words',
+}
+
+
+def ensure_nltk(*names):
+    """Probe (and download if missing) NLTK resources once per process"""
+    names = names or ('punkt',)
+    missing = [name for name in names if name not in _nltk_ready]
+    if not missing:
+        return
+
+    with _lock:
+        import nltk
+
+        for name in missing:
+            if name in _nltk_ready:
+                continue
+            try:
+                nltk.data.find(NLTK_RESOURCES[name])
+            except LookupError:
+                nltk.download(name, quiet=True)
+            _nltk_ready.add(name)
+
+
+def get_nlp(name=DEFAULT_SPACY_MODEL, components=None):
+    """Return a shared spaCy pipeline, or None if the model is not installed
+
+    `components` restricts the pipeline to the listed components (e.g.
+    ('ner',)); every other component is disabled at load time.
+    """
+    key = (name, tuple(components) if components else None)
+    if key in _spacy_models:
+        return _spacy_models[key]
+
+    with _lock:
+        if key not in _spacy_models:
+            import spacy
+
+            try:
+                if components:
+                    nlp = spacy.load(name, enable=list(components))
+                else:
+                    nlp = spacy.load(name)
+            except OSError:
+                nlp = None
+            _spacy_models[key] = nlp
+    return _spacy_models[key]
+
+
+def warm_up(spacy_components=('ner',), nltk_resources=('punkt',)):
+    """Load every model up front, e.g. in a parent process before forking workers"""
+    ensure_nltk(*nltk_resources)
+    return get_nlp(components=spacy_components) is not None
+
+
+def clear():
+    """Drop all loaded models (mostly useful for tests and hot reloads)"""
+    with _lock:
+        _spacy_models.clear()
+        _nltk_ready.clear()
@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+import tempfile
+
+import taxonomy
+from resume_parser import PARSER_VERSION
+
+DEFAULT_CACHE_DIR = os.environ.get('RESUME_CACHE_DIR', '.resume_cache')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def current_version():
+    """Version stamp of parse output: the parser version plus the live taxonomy's"""
+    return f'{PARSER_VERSION}-{taxonomy.current().version}'
+
+
+class ParseCache:
+    """On-disk cache of extracted text and parse results, keyed by PDF content hash
+
+    Entries are JSON files named after the SHA-256 of the uploaded bytes.
+    Reads refresh an entry's mtime, and writes evict the least recently used
+    entries once the cache grows past `max_bytes`. Entries written by another
+    parser or taxonomy version are treated as misses and removed.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, version=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._version = version
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def version(self):
+        """Explicit version, else the parser version plus the live taxonomy's"""
+        if self._version is not None:
+            return self._version
+        return current_version()
+
+    @staticmethod
+    def key_for(data):
+        """Content address of a PDF: the hex SHA-256 of its bytes"""
+        return hashlib.sha256(data).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.json')
+
+    def get(self, key):
+        """Return the cached entry for key, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get('parser_version') != self.version:
+            self._remove(path)
+            return None
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key, text, resume_data=None):
+        """Store extracted text and parse output for key, then enforce the size bound"""
+        entry = {
+            'parser_version': self.version,
+            'key': key,
+            'text': text,
+            'resume_data': resume_data,
+        }
+
+        # Write to a temp file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+        self.evict()
+        return entry
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for item in it:
+                if not item.name.endswith('.json'):
+                    continue
+                try:
+                    stat = item.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, item.path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                total -= size
+
+    def clear(self):
+        """Remove every cached entry"""
+        with os.scandir(self.directory) as it:
+            for item in it:
+                if item.name.endswith('.json'):
+                    self._remove(item.path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
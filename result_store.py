@@ -0,0 +1,185 @@
+import argparse
+import os
+import uuid
+from datetime import datetime, timezone
+
+DEFAULT_STORE_DIR = os.environ.get('RESUME_RESULT_STORE', 'resume_results')
+# Records buffered before a Parquet file is written; bigger files scan faster
+DEFAULT_BATCH_ROWS = 5000
+
+
+def _pyarrow():
+    # Imported on first use so the rest of the pipeline runs without pyarrow
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+
+    return pa, pc, ds
+
+
+def schema():
+    """Column layout of the store; role and ingest date are also hive partitions"""
+    pa, _, _ = _pyarrow()
+    skill_list = pa.list_(pa.dictionary(pa.int32(), pa.string()))
+    return pa.schema([
+        ('path', pa.string()),
+        ('status', pa.dictionary(pa.int8(), pa.string())),
+        ('email', pa.string()),
+        ('total_experience', pa.int16()),
+        # Parallel lists: skills[i] has proficiency proficiency[i] (1-5)
+        ('skills', skill_list),
+        ('proficiency', pa.list_(pa.int8())),
+        ('match_roles', skill_list),
+        ('match_scores', pa.list_(pa.float32())),
+        ('parsed_at', pa.timestamp('s', tz='UTC')),
+        ('best_role', pa.string()),
+        ('date', pa.string()),
+    ])
+
+
+PARTITION_COLUMNS = ['best_role', 'date']
+
+
+def _dictionary_list(values_per_row):
+    """list<dictionary<string>> array, encoding each distinct value once per file"""
+    pa, pc, _ = _pyarrow()
+    offsets = [0]
+    flat = []
+    for values in values_per_row:
+        flat.extend(values)
+        offsets.append(len(flat))
+    encoded = pc.dictionary_encode(pa.array(flat, type=pa.string()))
+    encoded = encoded.cast(pa.dictionary(pa.int32(), pa.string()))
+    return pa.ListArray.from_arrays(pa.array(offsets, type=pa.int32()), encoded)
+
+
+class ResultStore:
+    """Append-only, partitioned Parquet store of batch.analyze_pdf records
+
+    Each append writes new files under best_role=<role>/date=<day>/, so
+    writers never rewrite existing data. Reads go through pyarrow.dataset:
+    only the requested columns are decoded, and filters on the partition
+    columns skip whole directories before any file is opened.
+    """
+
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        self.root = root
+
+    def to_table(self, records, parsed_at=None):
+        """Arrow table of records in the store's schema"""
+        pa, _, _ = _pyarrow()
+        parsed_at = parsed_at or datetime.now(timezone.utc).replace(microsecond=0)
+        columns = {name: [] for name in schema().names}
+        skills_rows, match_role_rows = [], []
+
+        for record in records:
+            proficiency = record.get('skill_proficiency') or {}
+            skills = list(record.get('skills') or proficiency)
+            matches = record.get('matches') or {}
+            experience = record.get('total_experience')
+
+            columns['path'].append(record['path'])
+            columns['status'].append(record['status'])
+            columns['email'].append((record.get('contact_info') or {}).get('email'))
+            columns['total_experience'].append(int(experience) if experience is not None else None)
+            skills_rows.append(skills)
+            columns['proficiency'].append([int(proficiency.get(skill, 2)) for skill in skills])
+            match_role_rows.append(list(matches))
+            columns['match_scores'].append([float(score) for score in matches.values()])
+            columns['parsed_at'].append(parsed_at)
+            columns['best_role'].append(record.get('best_role') or 'none')
+            columns['date'].append(parsed_at.date().isoformat())
+
+        table_schema = schema()
+        arrays = []
+        for field in table_schema:
+            if field.name == 'skills':
+                arrays.append(_dictionary_list(skills_rows))
+            elif field.name == 'match_roles':
+                arrays.append(_dictionary_list(match_role_rows))
+            else:
+                arrays.append(pa.array(columns[field.name], type=field.type))
+        return pa.Table.from_arrays(arrays, schema=table_schema)
+
+    def append(self, records):
+        """Write records as new Parquet files; returns the number of rows written"""
+        records = list(records)
+        if not records:
+            return 0
+        _, _, ds = _pyarrow()
+
+        table = self.to_table(records)
+        ds.write_dataset(
+            table, self.root, format='parquet',
+            partitioning=PARTITION_COLUMNS, partitioning_flavor='hive',
+            # A fresh name per append, so earlier files are never replaced
+            basename_template=f'part-{uuid.uuid4().hex}-{{i}}.parquet',
+            existing_data_behavior='overwrite_or_ignore',
+        )
+        return table.num_rows
+
+    def dataset(self):
+        pa, _, ds = _pyarrow()
+        partitioning = ds.partitioning(pa.schema([('best_role', pa.string()), ('date', pa.string())]),
+                                       flavor='hive')
+        return ds.dataset(self.root, format='parquet', partitioning=partitioning)
+
+    def read(self, columns=None, filter=None):
+        """Arrow table of the given columns, with the filter pushed down to the scan
+
+        e.g. read(['path', 'skills'], filter=pyarrow.dataset.field('best_role') == 'Data Analyst')
+        """
+        return self.dataset().to_table(columns=columns, filter=filter)
+
+    def skill_prevalence(self, role=None, status='ok'):
+        """(best role, skill, resumes, share of that role's resumes), most common first
+
+        Only the best_role, status and skills columns are read.
+        """
+        pa, pc, ds = _pyarrow()
+        condition = ds.field('status') == status
+        if role is not None:
+            condition = condition & (ds.field('best_role') == role)
+        table = self.read(['best_role', 'skills'], filter=condition)
+        if table.num_rows == 0:
+            return []
+
+        per_role = table.group_by('best_role').aggregate([('best_role', 'count')])
+        resumes = dict(zip(per_role['best_role'].to_pylist(), per_role['best_role_count'].to_pylist()))
+
+        skills = table['skills'].combine_chunks()
+        # One row per (resume, skill), labelled with the resume's best role
+        pairs = pa.table({
+            'best_role': pc.take(table['best_role'], pc.list_parent_indices(skills)),
+            'skill': pc.list_flatten(skills).cast(pa.string()),
+        })
+        counts = pairs.group_by(['best_role', 'skill']).aggregate([('skill', 'count')])
+
+        rows = [
+            (best_role, skill, count, count / resumes[best_role])
+            for best_role, skill, count in zip(
+                counts['best_role'].to_pylist(), counts['skill'].to_pylist(), counts['skill_count'].to_pylist()
+            )
+        ]
+        rows.sort(key=lambda row: (row[0], -row[2], row[1]))
+        return rows
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Report skill prevalence from the Parquet result store")
+    arg_parser.add_argument('root', nargs='?', default=DEFAULT_STORE_DIR)
+    arg_parser.add_argument('-r', '--role', default=None, help="only resumes whose best role is this")
+    arg_parser.add_argument('-n', '--top', type=int, default=20, help="skills shown per role")
+    args = arg_parser.parse_args(argv)
+
+    shown = {}
+    for best_role, skill, count, share in ResultStore(args.root).skill_prevalence(args.role):
+        shown[best_role] = shown.get(best_role, 0) + 1
+        if shown[best_role] == 1:
+            print(f"\n{best_role}")
+        if shown[best_role] <= args.top:
+            print(f"  {skill:<30} {count:>8} {share:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,206 +1,208 @@
-import fitz  # PyMuPDF
+import bisect
 import re
-import nltk
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import stopwords
-from nltk.chunk import ne_chunk
-from nltk.tag import pos_tag
-import spacy
-import pandas as pd
 from datetime import datetime
-import streamlit as st
+import instrumentation
+import extraction_rules
+import models
+import taxonomy
+from document import AnnotatedText, ResumeDocument
+from extractor import extract_pages
+from sections import PREAMBLE, SECTION_HEADERS, segment_resume
+
+# Bump whenever parse_resume output changes so cached results are invalidated
+PARSER_VERSION = '10'
+
+# Only the named-entity recognizer is used for skill extraction
+SPACY_COMPONENTS = ('ner',)
+
+# Sections each extractor reads in parse_resume; see sections.SECTION_HEADERS
+EXTRACTOR_SECTIONS = {
+    'skills': (PREAMBLE, 'summary', 'skills', 'experience', 'projects', 'certifications'),
+    'education': ('education', 'certifications'),
+    'experience': (PREAMBLE, 'summary', 'experience')
+}
+
+# Keys of extract_contact_info's result, one extraction_rules contact rule each
+CONTACT_FIELDS = ('email', 'phone', 'linkedin', 'github')
+
+# spaCy entity labels that may name a skill
+ENTITY_LABELS = ('ORG', 'PRODUCT', 'LANGUAGE')
+# Entity names compared without separators, and again without a trailing
+# version, so "Node JS", "Scikit Learn" and "Python3" find their skills
+_COMPACT_PATTERN = re.compile(r'[^a-z0-9+#]')
+_VERSION_SUFFIX = re.compile(r'\d+(?:\.\d+)*$')
+
+# Stages run by parse_resume, in order; each one reads the shared ResumeDocument
+PIPELINE_STAGES = ('contact_info', 'education', 'experience', 'skills', 'skill_proficiency')
+# Text each stage reads: an extractor's scope, or None for the whole raw text
+STAGE_SCOPES = {
+    'contact_info': None,
+    'education': 'education',
+    'experience': 'experience',
+    'skills': 'skills',
+    'skill_proficiency': 'skills',
+}
+
+PROFICIENCY_KEYWORDS = {
+    'expert': 5,
+    'advanced': 4,
+    'proficient': 4,
+    'experienced': 3,
+    'intermediate': 3,
+    'familiar': 2,
+    'basic': 1,
+    'beginner': 1
+}
+PROFICIENCY_PATTERN = re.compile('|'.join(PROFICIENCY_KEYWORDS), re.IGNORECASE)
+# Characters on either side of a skill mention searched for proficiency keywords
+PROFICIENCY_WINDOW = 50
+
+
+def compact_name(name):
+    """Lowercased name with spaces and punctuation (other than + and #) removed"""
+    return _COMPACT_PATTERN.sub('', name.lower())
+
+
+def show_error(message):
+    """Report an error in the Streamlit UI without importing Streamlit eagerly"""
+    import streamlit as st
+    st.error(message)
 
 class ResumeParser:
-    def __init__(self):
-        """Initialize the Resume Parser with necessary NLP models and data"""
-        self.setup_nltk()
-        self.setup_spacy()
-        self.skills_database = self.load_skills_database()
+    def __init__(self, section_headers=None, pdf_workers=None, rule_set=None):
+        """Initialize the Resume Parser; NLP models load lazily from the shared registry"""
+        self.section_headers = section_headers or SECTION_HEADERS
+        # Contact, experience, job title and degree rules, compiled into one scanner
+        self.rule_set = rule_set or extraction_rules.DEFAULT_RULE_SET
+        self.extractor_sections = EXTRACTOR_SECTIONS
+        # Processes that share the pages of large PDFs (see extractor.extract_pages)
+        self.pdf_workers = pdf_workers
+        self._spacy_error_shown = False
+        self._compact_aliases = (None, {})
         
     def setup_nltk(self):
-        """Download required NLTK data"""
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt')
-        
-        try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('stopwords')
-            
-        try:
-            nltk.data.find('taggers/averaged_perceptron_tagger')
-        except LookupError:
-            nltk.download('averaged_perceptron_tagger')
-            
-        try:
-            nltk.data.find('chunkers/maxent_ne_chunker')
-        except LookupError:
-            nltk.download('maxent_ne_chunker')
-            
-        try:
-            nltk.data.find('corpora/words')
-        except LookupError:
-            nltk.download('words')
+        """Make sure the NLTK data used by the parser is available"""
+        models.ensure_nltk('punkt')
     
     def setup_spacy(self):
-        """Load spaCy model"""
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            st.error("spaCy English model not found. Please install it using: python -m spacy download en_core_web_sm")
-            self.nlp = None
+        """Load the spaCy model, with only the components we use enabled"""
+        nlp = models.get_nlp(components=SPACY_COMPONENTS)
+        if nlp is None and not self._spacy_error_shown:
+            show_error("spaCy English model not found. Please install it using: python -m spacy download en_core_web_sm")
+            self._spacy_error_shown = True
+        return nlp
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline shared by every parser in this process (None if unavailable)"""
+        return self.setup_spacy()
+    
+    # Skills come from the compiled taxonomy (taxonomy.py), which is reloaded
+    # when its files change, so these are looked up on every access
+    @property
+    def skills_database(self):
+        return taxonomy.current().skills_database
+    
+    @property
+    def skill_matcher(self):
+        return taxonomy.current().matcher
+    
+    @property
+    def skill_aliases(self):
+        return taxonomy.current().aliases
+    
+    @property
+    def compact_aliases(self):
+        """{compact_name(alias): (skill, category)}, rebuilt when the taxonomy changes"""
+        current = taxonomy.current()
+        version, compact = self._compact_aliases
+        if version != current.version:
+            compact = {}
+            for alias, match in current.aliases.items():
+                compact.setdefault(compact_name(alias), match)
+            compact.pop('', None)
+            self._compact_aliases = (current.version, compact)
+        return compact
     
     def load_skills_database(self):
         """Load comprehensive skills database categorized by job roles"""
-        skills_db = {
-            'programming': [
-                'python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'swift',
-                'kotlin', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash', 'powershell'
-            ],
-            'web_development': [
-                'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
-                'spring', 'laravel', 'bootstrap', 'jquery', 'webpack', 'sass', 'less'
-            ],
-            'data_science': [
-                'machine learning', 'deep learning', 'neural networks', 'tensorflow', 'pytorch',
-                'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'seaborn', 'plotly',
-                'tableau', 'power bi', 'statistics', 'data mining', 'nlp', 'computer vision'
-            ],
-            'databases': [
-                'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'cassandra', 'oracle',
-                'sqlite', 'nosql', 'elasticsearch', 'neo4j'
-            ],
-            'cloud': [
-                'aws', 'azure', 'google cloud', 'docker', 'kubernetes', 'jenkins', 'terraform',
-                'ansible', 'cloudformation', 'lambda', 'ec2', 's3', 'rds'
-            ],
-            'tools': [
-                'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence', 'slack', 'trello',
-                'figma', 'sketch', 'photoshop', 'illustrator', 'postman', 'swagger'
-            ],
-            'business': [
-                'project management', 'agile', 'scrum', 'kanban', 'business analysis',
-                'product management', 'stakeholder management', 'requirements gathering',
-                'process improvement', 'strategic planning'
-            ],
-            'soft_skills': [
-                'leadership', 'communication', 'teamwork', 'problem solving', 'analytical thinking',
-                'creativity', 'adaptability', 'time management', 'critical thinking', 'collaboration'
-            ]
-        }
-        return skills_db
+        return taxonomy.current().skills_database
     
     def extract_text_from_pdf(self, pdf_file):
-        """Extract text from PDF file using PyMuPDF"""
+        """Extract text from a PDF path, bytes, memoryview or file-like object using PyMuPDF"""
         try:
-            # Read PDF file
-            pdf_document = fitz.open(stream=pdf_file.read(), filetype="pdf")
-            text = ""
-            
-            # Extract text from each page
-            for page_num in range(pdf_document.page_count):
-                page = pdf_document[page_num]
-                text += page.get_text()
-            
-            pdf_document.close()
-            return text
+            # Join pages in one go instead of concatenating page by page
+            return "".join(extract_pages(pdf_file, backend='pymupdf', workers=self.pdf_workers))
         except Exception as e:
-            st.error(f"Error extracting text from PDF: {str(e)}")
+            show_error(f"Error extracting text from PDF: {str(e)}")
             return ""
     
+    def annotate(self, text):
+        """Wrap text so extractors can share its annotations (no-op if already wrapped)"""
+        if isinstance(text, AnnotatedText):
+            return text
+        return AnnotatedText(text, self)
+    
     def clean_text(self, text):
         """Clean and preprocess extracted text"""
         # Remove extra whitespaces and newlines
         text = re.sub(r'\s+', ' ', text)
-        # Remove special characters but keep important ones
-        text = re.sub(r'[^\w\s\.\,\@\-\+\(\)]', ' ', text)
+        # Remove special characters but keep important ones ("/" and "#" for
+        # skills such as ci/cd and c#)
+        text = re.sub(r'[^\w\s\.\,\@\-\+\(\)/#]', ' ', text)
         # Convert to lowercase for processing
         return text.lower().strip()
     
     def extract_contact_info(self, text):
         """Extract contact information from resume text"""
-        contact_info = {}
-        
-        # Email extraction
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text, re.IGNORECASE)
-        contact_info['email'] = emails[0] if emails else None
-        
-        # Phone number extraction
-        phone_pattern = r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, text)
-        contact_info['phone'] = phones[0] if phones else None
-        
-        # LinkedIn profile extraction
-        linkedin_pattern = r'linkedin\.com/in/[\w\-]+'
-        linkedin = re.findall(linkedin_pattern, text, re.IGNORECASE)
-        contact_info['linkedin'] = linkedin[0] if linkedin else None
-        
-        # GitHub profile extraction
-        github_pattern = r'github\.com/[\w\-]+'
-        github = re.findall(github_pattern, text, re.IGNORECASE)
-        contact_info['github'] = github[0] if github else None
-        
+        contact_info = dict.fromkeys(CONTACT_FIELDS)
+        # First hit of each contact rule, from one scan of the text
+        for hit in self.annotate(text).rule_hits(('contact',)):
+            if contact_info.get(hit.name) is None:
+                contact_info[hit.name] = hit.value
         return contact_info
     
     def extract_education(self, text):
         """Extract education information"""
-        education_keywords = [
-            'bachelor', 'master', 'phd', 'doctorate', 'diploma', 'certificate',
-            'b.tech', 'm.tech', 'b.sc', 'm.sc', 'mba', 'bba', 'b.com', 'm.com'
-        ]
-        
+        text = self.annotate(text)
         education_info = []
-        sentences = sent_tokenize(text)
+        degree_hits = text.rule_hits(('education',))
+        if not degree_hits:
+            # No degree keyword anywhere, so skip sentence splitting
+            return education_info
         
-        for sentence in sentences:
-            for keyword in education_keywords:
-                if keyword in sentence.lower():
-                    education_info.append(sentence.strip())
-                    break
+        # Keep each sentence that contains a degree keyword, once
+        spans = text.sentence_spans
+        starts = [start for start, _ in spans]
+        seen = set()
+        for hit in degree_hits:
+            i = bisect.bisect_right(starts, hit.start) - 1
+            if i < 0 or i in seen or hit.end > spans[i][1]:
+                continue
+            seen.add(i)
+            education_info.append(text.sentences[i].strip())
         
-        return list(set(education_info))  # Remove duplicates
+        return list(dict.fromkeys(education_info))  # Remove duplicates, keep order
     
     def extract_experience(self, text):
         """Extract work experience information"""
-        experience_patterns = [
-            r'(\d+)[\+\s]*years?\s+(?:of\s+)?experience',
-            r'experience[:\s]+(\d+)[\+\s]*years?',
-            r'(\d+)[\+\s]*yrs?\s+(?:of\s+)?(?:exp|experience)'
-        ]
-        
-        years_experience = []
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            years_experience.extend([int(match) for match in matches])
-        
+        hits = self.annotate(text).rule_hits(('experience', 'title'))
+        years_experience = [hit.value for hit in hits if hit.kind == 'experience']
         total_experience = max(years_experience) if years_experience else 0
         
-        # Extract company names and job titles (basic extraction)
-        job_titles = []
+        # Company names and job titles (basic extraction)
+        job_titles = [hit.value for hit in hits if hit.kind == 'title']
         company_names = []
         
-        # Common job title patterns
-        job_title_patterns = [
-            r'(?:software|senior|junior|lead|principal)\s+(?:developer|engineer|analyst|manager)',
-            r'(?:data|business|product|project)\s+(?:scientist|analyst|manager)',
-            r'(?:full stack|frontend|backend)\s+developer'
-        ]
-        
-        for pattern in job_title_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            job_titles.extend(matches)
-        
         return {
             'total_experience': total_experience,
-            'job_titles': list(set(job_titles)),
+            'job_titles': list(dict.fromkeys(job_titles)),
             'companies': company_names
         }
     
     def extract_skills(self, text):
         """Extract skills from resume text using multiple approaches"""
+        text = self.annotate(text)
         extracted_skills = {
             'programming': [],
             'web_development': [],
@@ -212,37 +214,17 @@ class ResumeParser:
             'soft_skills': []
         }
         
-        # Method 1: Direct keyword matching
-        for category, skills_list in self.skills_database.items():
-            for skill in skills_list:
-                # Use word boundaries to avoid partial matches
-                pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-                if re.search(pattern, text.lower()):
-                    extracted_skills[category].append(skill)
+        # Method 1: Direct keyword matching in a single pass over the text
+        for _, _, skill, category in text.skill_matches:
+            extracted_skills.setdefault(category, []).append(skill)
         
         # Method 2: NLP-based extraction using spaCy (if available)
-        if self.nlp:
-            doc = self.nlp(text)
-            
+        doc = text.spacy_doc
+        if doc is not None:
             # Extract entities that might be skills
             for ent in doc.ents:
-                if ent.label_ in ['ORG', 'PRODUCT', 'LANGUAGE']:
-                    skill_text = ent.text.lower()
-                    # Check if this entity matches any skill in our database
-                    for category, skills_list in self.skills_database.items():
-                        for skill in skills_list:
-                            if skill in skill_text or skill_text in skill:
-                                if skill not in extracted_skills[category]:
-                                    extracted_skills[category].append(skill)
-        
-        # Method 3: Section-based extraction
-        sections = self.identify_resume_sections(text)
-        if 'skills' in sections:
-            skills_section = sections['skills']
-            for category, skills_list in self.skills_database.items():
-                for skill in skills_list:
-                    pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-                    if re.search(pattern, skills_section.lower()):
+                if ent.label_ in ENTITY_LABELS:
+                    for skill, category in self.match_entity(ent.text):
                         if skill not in extracted_skills[category]:
                             extracted_skills[category].append(skill)
         
@@ -252,98 +234,163 @@ class ResumeParser:
         
         return extracted_skills
     
+    def match_entity(self, entity_text):
+        """Skills named by a spaCy entity that the skill automaton can miss
+
+        Entities the automaton already covers (an alias, or skills inside
+        the entity) are found in its own scan of the text; what NER adds
+        are names written with other spacing, punctuation or a version:
+        "Node JS", "Scikit Learn", "Power-BI", "Python3".
+        """
+        compact = compact_name(entity_text)
+        for key in (compact, _VERSION_SUFFIX.sub('', compact)):
+            if key in self.compact_aliases:
+                return [self.compact_aliases[key]]
+        return []
+    
     def identify_resume_sections(self, text):
         """Identify different sections of the resume"""
         sections = {}
         
-        section_patterns = {
-            'skills': r'(?:technical\s+)?skills?(?:\s+(?:and|&)\s+(?:technologies|expertise))?[:\s]*(.*?)(?=\n\s*(?:[A-Z][A-Z\s]{3,}|$))',
-            'experience': r'(?:work\s+)?experience[:\s]*(.*?)(?=\n\s*(?:[A-Z][A-Z\s]{3,}|$))',
-            'education': r'education[:\s]*(.*?)(?=\n\s*(?:[A-Z][A-Z\s]{3,}|$))',
-            'projects': r'projects?[:\s]*(.*?)(?=\n\s*(?:[A-Z][A-Z\s]{3,}|$))',
-            'certifications': r'certifications?[:\s]*(.*?)(?=\n\s*(?:[A-Z][A-Z\s]{3,}|$))'
-        }
-        
-        for section_name, pattern in section_patterns.items():
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                sections[section_name] = match.group(1).strip()
+        # One scan over the lines of the original (uncleaned) text
+        for section in segment_resume(text, self.section_headers):
+            body = text[section.start:section.end].strip()
+            if section.name in sections:
+                sections[section.name] += '\n' + body
+            else:
+                sections[section.name] = body
         
         return sections
     
     def calculate_skill_proficiency(self, text, skills):
         """Estimate skill proficiency based on context"""
+        text = self.annotate(text)
         proficiency_scores = {}
         
-        proficiency_keywords = {
-            'expert': 5,
-            'advanced': 4,
-            'proficient': 4,
-            'experienced': 3,
-            'intermediate': 3,
-            'familiar': 2,
-            'basic': 1,
-            'beginner': 1
-        }
+        # Proficiency keywords in one pass, as (start, end, level) sorted by start
+        keyword_hits = [
+            (match.start(), match.end(), PROFICIENCY_KEYWORDS[match.group().lower()])
+            for match in PROFICIENCY_PATTERN.finditer(text.text)
+        ]
+        keyword_starts = [start for start, _, _ in keyword_hits]
         
-        for category, skill_list in skills.items():
-            for skill in skill_list:
-                score = 2  # Default score
-                
-                # Look for proficiency indicators near the skill mention
-                skill_context_pattern = r'.{0,50}\b' + re.escape(skill.lower()) + r'\b.{0,50}'
-                context_matches = re.findall(skill_context_pattern, text.lower())
-                
-                for context in context_matches:
-                    for keyword, level in proficiency_keywords.items():
-                        if keyword in context:
-                            score = max(score, level)
-                
-                proficiency_scores[skill] = score
+        # Skill mentions in one pass; a keyword counts when it lies within
+        # PROFICIENCY_WINDOW characters of the mention, as before
+        wanted = {skill for skill_list in skills.values() for skill in skill_list}
+        for start, end, skill, _ in text.skill_matches:
+            if skill not in wanted:
+                continue
+            score = proficiency_scores.get(skill, 2)  # Default score
+            window_start = start - PROFICIENCY_WINDOW
+            window_end = end + PROFICIENCY_WINDOW
+            i = bisect.bisect_left(keyword_starts, window_start)
+            while i < len(keyword_hits) and keyword_hits[i][0] < window_end:
+                if keyword_hits[i][1] <= window_end:
+                    score = max(score, keyword_hits[i][2])
+                i += 1
+            proficiency_scores[skill] = score
+        
+        # Skills found only by NER have no keyword mention; keep the default
+        for skill in wanted:
+            proficiency_scores.setdefault(skill, 2)
         
         return proficiency_scores
     
-    def parse_resume(self, pdf_file):
+    def analyze_document(self, document, skip=()):
+        """Run every pipeline stage not in skip or already in document.results"""
+        for stage in PIPELINE_STAGES:
+            if stage in skip or stage in document.results:
+                continue
+            with instrumentation.stage('parse.' + stage):
+                document.results[stage] = getattr(self, '_stage_' + stage)(document)
+        return document.results
+    
+    def _stage_contact_info(self, document):
+        return self.extract_contact_info(document.raw_text)
+    
+    def _stage_education(self, document):
+        return self.extract_education(document.scope('education'))
+    
+    def _stage_experience(self, document):
+        return self.extract_experience(document.scope('experience'))
+    
+    def _stage_skills(self, document):
+        return self.extract_skills(document.scope('skills'))
+    
+    def _stage_skill_proficiency(self, document):
+        # Shares the skills scope, so its skill matches are not recomputed
+        skills = document.results.get('skills', {})
+        return self.calculate_skill_proficiency(document.scope('skills'), skills)
+    
+    def parse_text(self, raw_text, skip=(), results=None):
+        """Parse already-extracted resume text; stages in skip are left empty"""
+        return self.parse_document(ResumeDocument(raw_text, self, results), skip)
+    
+    def parse_document(self, document, skip=()):
+        """Run the pipeline on a ResumeDocument and assemble the resume data"""
+        raw_text = document.raw_text
+        results = self.analyze_document(document, skip)
+        skills_info = results.get('skills', {})
+        
+        # Flatten skills for easier processing
+        all_skills = []
+        for category, skills_list in skills_info.items():
+            all_skills.extend(skills_list)
+        instrumentation.count('characters', len(raw_text))
+        instrumentation.count('skills_matched', len(all_skills))
+        
+        # Create comprehensive resume data
+        resume_data = {
+            'raw_text': raw_text,
+            'cleaned_text': document.cleaned.text,
+            'contact_info': results.get('contact_info', {}),
+            'education': results.get('education', []),
+            'experience': results.get('experience', {'total_experience': 0, 'job_titles': [], 'companies': []}),
+            'skills_by_category': skills_info,
+            'all_skills': all_skills,
+            'skill_proficiency': results.get('skill_proficiency', {}),
+            'total_skills_count': len(all_skills),
+            'parsing_timestamp': datetime.now().isoformat()
+        }
+        
+        return resume_data
+    
+    def parse_texts(self, raw_texts, batch_size=32, n_process=1, skip=()):
+        """Parse many extracted resume texts, running spaCy NER in batches via nlp.pipe
+
+        Returns one resume_data dict per input text, in the same order.
+        """
+        parsed = []
+        documents = [ResumeDocument(raw_text, self) for raw_text in raw_texts]
+        
+        nlp = self.nlp
+        if nlp is not None and 'skills' not in skip:
+            scopes = [document.scope('skills') for document in documents]
+            texts = (scope.text for scope in scopes)
+            for scope, doc in zip(scopes, nlp.pipe(texts, batch_size=batch_size, n_process=n_process)):
+                # Pre-fill the cached annotation so extract_skills reuses it
+                scope.spacy_doc = doc
+        
+        for document in documents:
+            parsed.append(self.parse_document(document, skip))
+        return parsed
+    
+    def parse_resume(self, pdf_file, skip=()):
         """Main method to parse resume and extract all information"""
         try:
-            # Extract text from PDF
-            raw_text = self.extract_text_from_pdf(pdf_file)
-            if not raw_text:
-                return None
-            
-            # Clean text
-            cleaned_text = self.clean_text(raw_text)
-            
-            # Extract various components
-            contact_info = self.extract_contact_info(raw_text)
-            education_info = self.extract_education(cleaned_text)
-            experience_info = self.extract_experience(cleaned_text)
-            skills_info = self.extract_skills(cleaned_text)
-            skill_proficiency = self.calculate_skill_proficiency(cleaned_text, skills_info)
-            
-            # Flatten skills for easier processing
-            all_skills = []
-            for category, skills_list in skills_info.items():
-                all_skills.extend(skills_list)
-            
-            # Create comprehensive resume data
-            resume_data = {
-                'raw_text': raw_text,
-                'cleaned_text': cleaned_text,
-                'contact_info': contact_info,
-                'education': education_info,
-                'experience': experience_info,
-                'skills_by_category': skills_info,
-                'all_skills': all_skills,
-                'skill_proficiency': skill_proficiency,
-                'total_skills_count': len(all_skills),
-                'parsing_timestamp': datetime.now().isoformat()
-            }
-            
-            return resume_data
+            with instrumentation.request('parse_resume'):
+                # Extract text from PDF
+                with instrumentation.stage('parse.extract_pdf'):
+                    raw_text = self.extract_text_from_pdf(pdf_file)
+                if not raw_text:
+                    return None
+                
+                # Every extractor reads the same annotated document, so cleaning,
+                # segmentation, skill matching and spaCy each run once
+                return self.parse_text(raw_text, skip)
             
         except Exception as e:
-            st.error(f"Error parsing resume: {str(e)}")
+            show_error(f"Error parsing resume: {str(e)}")
             return None
     
     def get_skills_summary(self, resume_data):
@@ -0,0 +1,257 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+from document import ResumeDocument
+from extractor import read_pdf_source
+from parse_cache import current_version
+from resume_parser import PIPELINE_STAGES, STAGE_SCOPES
+
+DEFAULT_REVISION_DIR = os.environ.get('RESUME_REVISION_DIR', '.resume_revisions')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_REFERENCE = re.compile(rb'(\d+) \d+ R\b')
+
+
+def _digest(data):
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha1(data).hexdigest()
+
+
+def _object_digest(document, xref, digests):
+    """Hash of a PDF object and everything it references, memoized per document
+
+    Raw stream bytes are hashed as stored, so fonts and images are never
+    decoded. Objects are hashed once per document however many pages
+    share them.
+    """
+    if xref in digests:
+        return digests[xref]
+    # Placeholder so a reference cycle ends here
+    digests[xref] = ''
+    if document.xref_get_key(xref, 'Type')[1] in ('/Page', '/Pages'):
+        # A link back into the page tree; other pages don't change this one
+        return ''
+    source = document.xref_object(xref, compressed=True).encode('utf-8', 'replace')
+    hasher = hashlib.sha1(source)
+    if document.xref_is_stream(xref):
+        hasher.update(document.xref_stream_raw(xref) or b'')
+    _hash_references(document, source, hasher, digests)
+    digests[xref] = hasher.hexdigest()
+    return digests[xref]
+
+
+def _hash_references(document, source, hasher, digests):
+    for match in _REFERENCE.finditer(source):
+        xref = int(match.group(1))
+        if 0 < xref < document.xref_length():
+            hasher.update(_object_digest(document, xref, digests).encode('ascii'))
+
+
+def _page_resources(document, page):
+    """Source of a page's /Resources, inherited from the page tree if not its own"""
+    xref = page.xref
+    while xref:
+        kind, value = document.xref_get_key(xref, 'Resources')
+        if kind == 'xref':
+            return value.encode('ascii')
+        if kind == 'dict':
+            return value.encode('utf-8', 'replace')
+        kind, value = document.xref_get_key(xref, 'Parent')
+        xref = int(value.split()[0]) if kind == 'xref' else 0
+    return b''
+
+
+def page_fingerprint(document, page, digests):
+    """Hash of what a page draws: its content stream, size and /Resources
+
+    The resources cover the fonts and XObject streams the content refers
+    to, so replacing an embedded font or image changes the fingerprint
+    even when the content stream stays the same.
+    """
+    hasher = hashlib.sha1(page.read_contents())
+    hasher.update(repr(tuple(page.rect)).encode('ascii'))
+    resources = _page_resources(document, page)
+    hasher.update(resources)
+    _hash_references(document, resources, hasher, digests)
+    return hasher.hexdigest()
+
+
+def extract_pages(pdf_source, previous_pages=None):
+    """Return [fingerprint, text] per page, reusing the text of unchanged pages
+
+    A page's fingerprint hashes its content stream, size and resources,
+    which PyMuPDF reads without laying out any text, so only new or edited
+    pages pay for get_text(). Returns the pages and how many were reused.
+    """
+    import fitz  # PyMuPDF
+
+    previous_pages = previous_pages or {}
+    pdf_source = read_pdf_source(pdf_source)
+    if isinstance(pdf_source, str):
+        document = fitz.open(pdf_source)
+    else:
+        document = fitz.open(stream=pdf_source, filetype="pdf")
+
+    pages = []
+    reused = 0
+    digests = {}
+    try:
+        for page in document:
+            fingerprint = page_fingerprint(document, page, digests)
+            text = previous_pages.get(fingerprint)
+            if text is None:
+                text = page.get_text()
+            else:
+                reused += 1
+            pages.append([fingerprint, text])
+    finally:
+        document.close()
+    return pages, reused
+
+
+def stage_inputs(document):
+    """Hash of the text each pipeline stage reads from a ResumeDocument"""
+    inputs = {}
+    for stage in PIPELINE_STAGES:
+        scope = STAGE_SCOPES[stage]
+        text = document.raw_text if scope is None else document.scope(scope).text
+        inputs[stage] = _digest(text)
+    return inputs
+
+
+class RevisionStore:
+    """Last analyzed revision of each candidate's resume, for incremental re-analysis
+
+    When a candidate uploads a new version, pages whose content is unchanged
+    keep their extracted text, and every pipeline stage whose input sections
+    hash the same keeps its previous result; only the rest is recomputed.
+    One JSON file per candidate; revisions from another parser or taxonomy
+    version are removed when read. Reads refresh a revision's mtime, and
+    saves evict the least recently used revisions once the store grows
+    past `max_bytes`, as ParseCache does.
+    """
+
+    def __init__(self, directory=DEFAULT_REVISION_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, candidate_id):
+        # Hash the id so any string is a safe file name
+        return os.path.join(self.directory, _digest(str(candidate_id)) + '.json')
+
+    def load(self, candidate_id):
+        """The stored revision for a candidate, or None"""
+        path = self._path(candidate_id)
+        try:
+            with open(path, encoding='utf-8') as f:
+                revision = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if revision.get('parser_version') != current_version():
+            self._remove(path)
+            return None
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return revision
+
+    def save(self, candidate_id, revision):
+        revision = dict(revision, candidate_id=candidate_id, parser_version=current_version())
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(revision, f)
+            os.replace(tmp_path, self._path(candidate_id))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used revisions until the store fits in max_bytes"""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for item in it:
+                if not item.name.endswith('.json'):
+                    continue
+                try:
+                    stat = item.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, item.path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                total -= size
+
+    def delete(self, candidate_id):
+        self._remove(self._path(candidate_id))
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def analyze(self, candidate_id, parser, pdf_source=None, raw_text=None):
+        """Parse a candidate's new revision, reusing what didn't change
+
+        Give the PDF to also diff at page level, or already-extracted text
+        (e.g. from sandbox.extract_guarded) to diff at section level only.
+        Returns parse_resume-style data with a 'revision' entry that
+        reports what was reused, or None if the revision has no text.
+        """
+        previous = self.load(candidate_id) or {}
+
+        pages, pages_reused = None, 0
+        if raw_text is None:
+            pages, pages_reused = extract_pages(pdf_source, dict(previous.get('pages') or ()))
+            # Joined like ResumeParser.extract_text_from_pdf
+            raw_text = "".join(text for _, text in pages)
+        if not raw_text:
+            # Nothing to parse; keep the previous revision as it was
+            return None
+
+        document = ResumeDocument(raw_text, parser)
+        inputs = stage_inputs(document)
+        previous_inputs = previous.get('stage_inputs', {})
+        previous_results = previous.get('results', {})
+        reused_stages = [
+            stage for stage in PIPELINE_STAGES
+            if stage in previous_results and previous_inputs.get(stage) == inputs[stage]
+        ]
+        document.results.update((stage, previous_results[stage]) for stage in reused_stages)
+
+        resume_data = parser.parse_document(document)
+        self.save(candidate_id, {
+            'pages': pages,
+            'stage_inputs': inputs,
+            'results': {stage: document.results[stage] for stage in PIPELINE_STAGES if stage in document.results},
+        })
+
+        resume_data['revision'] = {
+            'candidate_id': candidate_id,
+            'previous': bool(previous),
+            'pages': len(pages) if pages is not None else None,
+            'pages_reused': pages_reused,
+            'stages_reused': reused_stages,
+        }
+        return resume_data
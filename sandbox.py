@@ -0,0 +1,157 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Guarded PDF extraction: the PDF is parsed in a short-lived child process
+# with an address-space ceiling, and text collection stops at the first
+# page, byte or time budget it hits. A decompression bomb or a 500-page scan
+# then costs one killed child instead of a worker.
+DEFAULT_LIMITS = {
+    'max_file_bytes': 20 * 1024 * 1024,
+    'max_pages': 50,
+    'max_bytes': 1024 * 1024,
+    'timeout': 30.0,
+    'max_memory_mb': 1024,
+}
+# Extra seconds the child gets to report partial text after its own deadline
+KILL_GRACE = 2.0
+# Exit status of a child that hit its memory ceiling
+MEMORY_EXIT_CODE = 3
+
+
+class ExtractionRejected(ValueError):
+    """The PDF was refused before any parsing, e.g. because it is too large"""
+
+
+class SandboxError(RuntimeError):
+    """The extraction child crashed, ran out of memory or had to be killed"""
+
+
+def extract_guarded(source, backend=None, max_file_bytes=None, max_pages=None, max_bytes=None,
+                    timeout=None, max_memory_mb=None):
+    """Extract text within budgets; returns {'text', 'pages', 'truncated', 'reason'}
+
+    `source` is a path or the PDF bytes; paths are opened by the child, so
+    the file is never loaded into this process. Unset budgets come from
+    DEFAULT_LIMITS. `reason` says which budget stopped extraction early.
+    """
+    limits = dict(DEFAULT_LIMITS)
+    for name, value in (('max_file_bytes', max_file_bytes), ('max_pages', max_pages), ('max_bytes', max_bytes),
+                        ('timeout', timeout), ('max_memory_mb', max_memory_mb)):
+        if value is not None:
+            limits[name] = value
+
+    if isinstance(source, (str, os.PathLike)):
+        path, data = os.fspath(source), None
+        size = os.path.getsize(path)
+    else:
+        path, data = None, bytes(source)
+        size = len(data)
+    if size > limits['max_file_bytes']:
+        raise ExtractionRejected(f"PDF is {size} bytes, over the {limits['max_file_bytes']} byte limit")
+
+    config = {
+        'path': path,
+        'backend': backend,
+        'max_pages': limits['max_pages'],
+        'max_bytes': limits['max_bytes'],
+        'timeout': limits['timeout'],
+        'max_memory_mb': limits['max_memory_mb'],
+    }
+    child = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), json.dumps(config)],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = child.communicate(data, timeout=limits['timeout'] + KILL_GRACE)
+    except subprocess.TimeoutExpired:
+        raise SandboxError(f"extraction killed after {limits['timeout'] + KILL_GRACE:.0f}s")
+    finally:
+        # Also reached when the caller's own timeout interrupts communicate()
+        if child.poll() is None:
+            child.kill()
+            child.wait()
+
+    if child.returncode != 0:
+        detail = stderr.decode('utf-8', 'replace').strip().splitlines()
+        raise SandboxError(f"extraction failed ({_describe_exit(child.returncode)})"
+                           + (f": {detail[-1]}" if detail else ""))
+    return json.loads(stdout)
+
+
+def _describe_exit(returncode):
+    if returncode < 0:
+        return f"killed by signal {-returncode}"
+    if returncode == MEMORY_EXIT_CODE:
+        return "memory limit exceeded"
+    return f"exit code {returncode}"
+
+
+def _apply_limits(max_memory_mb, timeout):
+    try:
+        import resource
+    except ImportError:  # Windows: only the parent's timeout applies
+        return
+    if max_memory_mb:
+        ceiling = int(max_memory_mb) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (ceiling, ceiling))
+    if timeout:
+        # Backstop for CPU spent inside a single page that never yields
+        seconds = int(timeout + KILL_GRACE) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (seconds, seconds))
+
+
+def _child_main(config):
+    # The parent reads the result from the original stdout; anything a PDF
+    # library prints goes to stderr instead of corrupting the JSON
+    result = os.fdopen(os.dup(sys.stdout.fileno()), 'w', encoding='utf-8')
+    sys.stdout.flush()
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    _apply_limits(config['max_memory_mb'], config['timeout'])
+    from extractor import iter_pages
+
+    source = config['path'] or sys.stdin.buffer.read()
+    deadline = time.monotonic() + config['timeout']
+    max_pages = config['max_pages']
+    max_bytes = config['max_bytes']
+    pages = []
+    reason = None
+    try:
+        # Ask for one page and one byte more than allowed to tell a capped
+        # document apart from one that is exactly at a limit
+        for text in iter_pages(source, backend=config['backend'],
+                               max_pages=max_pages + 1 if max_pages is not None else None,
+                               max_bytes=max_bytes + 1 if max_bytes is not None else None):
+            if max_pages is not None and len(pages) == max_pages:
+                reason = 'max_pages'
+                break
+            pages.append(text)
+            if time.monotonic() > deadline:
+                reason = 'timeout'
+                break
+    except MemoryError:
+        sys.exit(MEMORY_EXIT_CODE)
+
+    if max_bytes is not None:
+        size = sum(len(text.encode('utf-8')) for text in pages)
+        if size > max_bytes:
+            # Drop the extra byte we asked for
+            last = pages[-1].encode('utf-8')
+            pages[-1] = last[:len(last) - (size - max_bytes)].decode('utf-8', 'ignore')
+            reason = reason or 'max_bytes'
+
+    with result:
+        json.dump({
+            'text': " ".join(pages).strip(),
+            'pages': len(pages),
+            'truncated': reason is not None,
+            'reason': reason,
+        }, result)
+
+
+if __name__ == "__main__":
+    _child_main(json.loads(sys.argv[1]))
@@ -0,0 +1,156 @@
+from array import array
+
+import numpy as np
+from scipy import sparse
+
+import taxonomy
+from matcher import JOB_SKILLS
+from skill_matcher import SkillMatcher
+
+
+def normalize_skill(skill):
+    """Canonical form used to line up resume skills with role requirements"""
+    key = ' '.join(skill.lower().split())
+    # Aliases ("APIs", "k8s") resolve to the taxonomy's canonical skill
+    known = taxonomy.current().aliases.get(key)
+    return known[0] if known else key
+
+
+class ScoringMatrix:
+    """Score many resumes against every role at once with sparse matrix products
+
+    Resumes are rows of a sparse (resumes x skills) matrix and roles are
+    columns of a (skills x roles) requirement matrix. Their product, divided
+    by each role's total requirement weight, is the N x R match-percentage
+    matrix that matcher.analyze_resume computes one pair at a time.
+    """
+
+    def __init__(self, role_skills=None, role_weights=None):
+        if role_skills is None:
+            role_skills = JOB_SKILLS
+            if role_weights is None:
+                compiled = taxonomy.current()
+                role_weights = {role: compiled.role_weights(role) for role in compiled.roles}
+        role_weights = role_weights or {}
+        self.roles = list(role_skills)
+        self.role_index = {role: i for i, role in enumerate(self.roles)}
+
+        # Only skills some role asks for can change a score
+        self.skills = []
+        self.skill_index = {}
+        rows, cols, weights = [], [], []
+        for role_num, role in enumerate(self.roles):
+            for skill in role_skills[role]:
+                key = normalize_skill(skill)
+                if key not in self.skill_index:
+                    self.skill_index[key] = len(self.skills)
+                    self.skills.append(skill)
+                rows.append(self.skill_index[key])
+                cols.append(role_num)
+                weights.append(role_weights.get(role, {}).get(skill, 1.0))
+
+        self.requirements = sparse.csc_matrix(
+            (np.asarray(weights, dtype=np.float32), (rows, cols)),
+            shape=(len(self.skills), len(self.roles)),
+        )
+        self.role_totals = np.asarray(self.requirements.sum(axis=0), dtype=np.float32).ravel()
+        self.role_totals[self.role_totals == 0] = 1.0
+
+        # Multi-word and punctuated requirements ("machine learning", "ci/cd")
+        # are found in raw text with the same automaton as ResumeParser, and
+        # so are their taxonomy aliases ("k8s"), reported as the requirement
+        self.skill_matcher = SkillMatcher()
+        for skill in self.skills:
+            self.skill_matcher.add(skill, 'required')
+        for alias, (skill, _) in taxonomy.current().aliases.items():
+            col = self.skill_index.get(normalize_skill(skill))
+            if col is not None:
+                self.skill_matcher.add(alias, 'required', self.skills[col])
+        self.skill_matcher.build()
+
+        # Non-zero entries accumulate in compact arrays until the CSR is needed
+        self.resume_ids = []
+        self._id_index = {}
+        self._rows = array('i')
+        self._cols = array('i')
+        self._values = array('f')
+        self._matrix = None
+        self._scores = None
+
+    def __len__(self):
+        return len(self.resume_ids)
+
+    def add(self, resume_id, skills):
+        """Add one resume given its skills (an iterable of names, or {name: weight in [0, 1]})"""
+        if resume_id in self._id_index:
+            raise ValueError(f"Resume '{resume_id}' is already in the matrix")
+        if not isinstance(skills, dict):
+            skills = {skill: 1.0 for skill in skills}
+
+        row = len(self.resume_ids)
+        for skill, weight in skills.items():
+            col = self.skill_index.get(normalize_skill(skill))
+            if col is not None and weight:
+                self._rows.append(row)
+                self._cols.append(col)
+                self._values.append(min(float(weight), 1.0))
+
+        self._id_index[resume_id] = row
+        self.resume_ids.append(resume_id)
+        self._matrix = None
+        self._scores = None
+
+    def add_text(self, resume_id, text):
+        """Add one resume from its raw text by scanning for every required skill"""
+        found = {skill for _, _, skill, _ in self.skill_matcher.finditer(text)}
+        self.add(resume_id, found)
+
+    def add_many(self, resumes):
+        """Add resumes from a {resume_id: skills} mapping or (resume_id, skills) pairs"""
+        items = resumes.items() if isinstance(resumes, dict) else resumes
+        for resume_id, skills in items:
+            self.add(resume_id, skills)
+
+    @property
+    def matrix(self):
+        """Sparse (resumes x skills) CSR matrix, rebuilt lazily after additions"""
+        if self._matrix is None:
+            # Duplicate (row, col) entries are summed, so clip back to 1
+            self._matrix = sparse.csr_matrix(
+                (np.array(self._values, dtype=np.float32),
+                 (np.array(self._rows, dtype=np.int32), np.array(self._cols, dtype=np.int32))),
+                shape=(len(self.resume_ids), len(self.skills)),
+            )
+            self._matrix.data = np.minimum(self._matrix.data, 1.0)
+        return self._matrix
+
+    def score_matrix(self):
+        """Dense (resumes x roles) array of match percentages, cached until the next add"""
+        if self._scores is None:
+            product = (self.matrix @ self.requirements).toarray()
+            self._scores = product / self.role_totals * 100.0
+        return self._scores
+
+    def scores_for_role(self, role):
+        """Match percentage of every resume for one role"""
+        column = self.role_index[role]
+        if self._scores is not None:
+            return self._scores[:, column]
+        product = self.matrix @ self.requirements[:, column]
+        return product.toarray().ravel() / self.role_totals[column] * 100.0
+
+    def top_k(self, role, k=50):
+        """Best k (resume_id, match_percentage) pairs for a role, highest first"""
+        scores = self.scores_for_role(role)
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+
+        # argpartition finds the top k in linear time; only those k get sorted
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind='stable')]
+        return [(self.resume_ids[i], float(scores[i])) for i in best]
+
+    def score(self, resume_id, role):
+        """Match percentage of a single resume for a single role"""
+        return float(self.scores_for_role(role)[self._id_index[resume_id]])
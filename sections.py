@@ -0,0 +1,112 @@
+import re
+from collections import namedtuple
+
+# Header lexicon: section name -> header lines that open it (case-insensitive,
+# a trailing colon is optional and "&" is read as "and")
+SECTION_HEADERS = {
+    'summary': [
+        'summary', 'professional summary', 'career summary', 'profile', 'professional profile',
+        'objective', 'career objective', 'about me'
+    ],
+    'skills': [
+        'skills', 'technical skills', 'key skills', 'core skills', 'skills and technologies',
+        'skills and expertise', 'technologies', 'core competencies', 'competencies', 'tech stack'
+    ],
+    'experience': [
+        'experience', 'work experience', 'professional experience', 'employment',
+        'employment history', 'work history', 'career history'
+    ],
+    'education': [
+        'education', 'academic background', 'academic qualifications', 'qualifications',
+        'education and training'
+    ],
+    'projects': [
+        'projects', 'project', 'personal projects', 'academic projects', 'key projects'
+    ],
+    'certifications': [
+        'certifications', 'certification', 'certificates', 'licenses and certifications',
+        'courses and certifications'
+    ]
+}
+
+# Text before the first recognised header (name, contact details, intro)
+PREAMBLE = 'preamble'
+
+# Headers are short lines; anything longer is body text
+MAX_HEADER_LENGTH = 40
+
+Section = namedtuple('Section', ['name', 'header_start', 'start', 'end'])
+
+
+def _normalize_header(line):
+    line = line.strip().strip('•*-–—#|').strip().lower()
+    line = line.replace('&', ' and ')
+    return re.sub(r'\s+', ' ', line).rstrip(':').strip()
+
+
+def _is_upper_header(head):
+    letters = [char for char in head if char.isalpha()]
+    return bool(letters) and all(char.isupper() for char in letters)
+
+
+def build_header_lookup(header_lexicon=None):
+    """Map every normalized header alias to its section name"""
+    lookup = {}
+    for name, aliases in (header_lexicon or SECTION_HEADERS).items():
+        for alias in aliases:
+            lookup[_normalize_header(alias)] = name
+    return lookup
+
+
+_DEFAULT_LOOKUP = build_header_lookup()
+
+
+def segment_resume(text, header_lexicon=None):
+    """Split text into sections in one scan over its lines
+
+    Returns a list of Section(name, header_start, start, end), where
+    text[start:end] is the section body. A header may stand on its own line
+    ("EXPERIENCE", "Skills:") or, in upper case, introduce inline content
+    ("SKILLS: Python, SQL"). A title-case label with content after it
+    ("Technologies: Python" under a project) is body text.
+    """
+    lookup = build_header_lookup(header_lexicon) if header_lexicon else _DEFAULT_LOOKUP
+    sections = []
+    current = (PREAMBLE, 0, 0)
+    position = 0
+
+    for line in text.splitlines(keepends=True):
+        line_start = position
+        position += len(line)
+
+        stripped = line.strip()
+        if not stripped:
+            continue
+        head, colon, rest = stripped.partition(':')
+        if len(head) > MAX_HEADER_LENGTH:
+            continue
+        name = lookup.get(_normalize_header(head))
+        if name is None or (not colon and len(stripped) > MAX_HEADER_LENGTH):
+            continue
+        if rest.strip() and not _is_upper_header(head):
+            continue
+
+        # Close the running section and open a new one after the header
+        sections.append(Section(current[0], current[1], current[2], line_start))
+        if rest.strip():
+            body_start = line_start + line.index(':') + 1
+        else:
+            body_start = position
+        current = (name, line_start, body_start)
+
+    sections.append(Section(current[0], current[1], current[2], len(text)))
+    # Drop an empty preamble when the text opens with a header
+    return [section for section in sections if section.name != PREAMBLE or section.end > section.start]
+
+
+def section_text(text, sections, names):
+    """Join the bodies of the named sections, or return None if there are none"""
+    spans = [text[section.start:section.end] for section in sections if section.name in names]
+    if not spans:
+        return None
+    return '\n'.join(spans)
@@ -0,0 +1,275 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+import models
+from batch import analyze_pdf, init_worker
+from matcher import JOB_SKILLS
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+_REASONS = {
+    200: 'OK', 202: 'Accepted', 400: 'Bad Request', 404: 'Not Found',
+    405: 'Method Not Allowed', 413: 'Payload Too Large', 431: 'Request Header Fields Too Large',
+    503: 'Service Unavailable',
+}
+
+
+class AnalysisService:
+    """Resume analysis jobs on a bounded process pool, behind a small JSON API
+
+    Submitted PDFs wait in a bounded queue and `workers` dispatchers feed
+    them to the pool, so at most `workers` resumes are parsed at once.
+    New submissions are refused with 503 once `max_pending` jobs or
+    `max_queued_bytes` of PDF data are waiting. Finished results are
+    kept for `result_ttl` seconds.
+
+    With `sandboxed`, PDFs are extracted in memory-capped child processes
+    (sandbox.py) under `extraction_limits`, so a hostile upload can't
+    exhaust a worker's memory.
+    """
+
+    def __init__(self, workers=None, max_pending=64, max_upload_bytes=10 * 1024 * 1024,
+                 max_queued_bytes=256 * 1024 * 1024, job_timeout=60.0, result_ttl=3600,
+                 sandboxed=True, extraction_limits=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.max_upload_bytes = max_upload_bytes
+        self.max_queued_bytes = max_queued_bytes
+        self.job_timeout = job_timeout
+        self.result_ttl = result_ttl
+        self.extraction_limits = None
+        if sandboxed:
+            # Half the job budget for extraction, the rest for parsing
+            self.extraction_limits = {'max_file_bytes': max_upload_bytes, 'timeout': job_timeout / 2}
+            self.extraction_limits.update(extraction_limits or {})
+
+        self.jobs = {}
+        self.queued_bytes = 0
+        self.queue = None
+        self.executor = None
+        self._dispatchers = []
+
+    async def start(self):
+        # Warm models before the pool forks so every worker starts loaded
+        models.warm_up()
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker)
+        self.queue = asyncio.Queue(maxsize=self.max_pending)
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, pdf_bytes, roles, candidate_id=None):
+        """Queue a PDF for analysis; returns the job, or None when at capacity
+
+        Jobs with a `candidate_id` re-analyze only what changed since that
+        candidate's previous upload.
+        """
+        self._expire_results()
+        if self.queue.full() or self.queued_bytes + len(pdf_bytes) > self.max_queued_bytes:
+            return None
+
+        job = {
+            'job_id': uuid.uuid4().hex,
+            'status': 'queued',
+            'roles': roles,
+            'candidate_id': candidate_id,
+            'submitted_at': time.time(),
+            'finished_at': None,
+            'error': None,
+            'result': None,
+        }
+        self.jobs[job['job_id']] = job
+        self.queued_bytes += len(pdf_bytes)
+        self.queue.put_nowait((job, pdf_bytes))
+        return job
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job, pdf_bytes = await self.queue.get()
+            self.queued_bytes -= len(pdf_bytes)
+            job['status'] = 'running'
+            try:
+                result = await loop.run_in_executor(
+                    self.executor, analyze_pdf, pdf_bytes, job['roles'], self.job_timeout, True, None,
+                    self.extraction_limits, job['candidate_id']
+                )
+                job['status'] = 'done' if result['status'] == 'ok' else 'failed'
+                job['error'] = result['error']
+                job['result'] = result
+            except Exception as e:
+                # A crashed worker process surfaces here as BrokenProcessPool
+                job['status'] = 'failed'
+                job['error'] = str(e)
+            finally:
+                job['finished_at'] = time.time()
+                self.queue.task_done()
+
+    def _expire_results(self):
+        cutoff = time.time() - self.result_ttl
+        expired = [
+            job_id for job_id, job in self.jobs.items()
+            if job['finished_at'] is not None and job['finished_at'] < cutoff
+        ]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+    def stats(self):
+        running = sum(1 for job in self.jobs.values() if job['status'] == 'running')
+        return {
+            'workers': self.workers,
+            'queued': self.queue.qsize(),
+            'running': running,
+            'max_pending': self.max_pending,
+            'queued_bytes': self.queued_bytes,
+        }
+
+    @staticmethod
+    def describe(job):
+        """Job status without the (possibly large) result payload"""
+        return {key: value for key, value in job.items() if key != 'result'}
+
+    def route(self, method, target, body):
+        """Map a request to (status, payload)"""
+        url = urlsplit(target)
+        parts = [part for part in url.path.split('/') if part]
+
+        if parts == ['health'] and method == 'GET':
+            return 200, self.stats()
+
+        if parts == ['jobs']:
+            if method != 'POST':
+                return 405, {'error': 'use POST to submit a PDF'}
+            if not body:
+                return 400, {'error': 'request body must be the PDF bytes'}
+            query = parse_qs(url.query)
+            roles = query.get('role') or list(JOB_SKILLS)
+            unknown = [role for role in roles if role not in JOB_SKILLS]
+            if unknown:
+                return 400, {'error': f"unknown roles: {', '.join(unknown)}"}
+            candidate_id = (query.get('candidate') or [None])[0]
+            job = self.submit(body, roles, candidate_id)
+            if job is None:
+                return 503, {'error': 'analysis queue is full, retry later'}
+            return 202, self.describe(job)
+
+        if len(parts) in (2, 3) and parts[0] == 'jobs' and method == 'GET':
+            job = self.jobs.get(parts[1])
+            if job is None:
+                return 404, {'error': 'unknown job'}
+            if len(parts) == 2:
+                return 200, self.describe(job)
+            if parts[2] == 'result':
+                if job['status'] in ('queued', 'running'):
+                    return 202, self.describe(job)
+                return 200, {**self.describe(job), 'result': job['result']}
+
+        return 404, {'error': 'not found'}
+
+    async def handle(self, reader, writer):
+        """Serve one HTTP/1.1 request per connection"""
+        try:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except asyncio.LimitOverrunError:
+                await self._respond(writer, 431, {'error': 'request headers too large'})
+                return
+            except asyncio.IncompleteReadError:
+                return
+
+            lines = head.decode('latin-1').split('\r\n')
+            try:
+                method, target, _ = lines[0].split(' ', 2)
+                headers = {}
+                for line in lines[1:]:
+                    if line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length', 0))
+            except ValueError:
+                await self._respond(writer, 400, {'error': 'malformed request'})
+                return
+
+            # Refuse bad or oversized lengths before reading the body into memory
+            if length < 0:
+                await self._respond(writer, 400, {'error': 'negative content-length'})
+                return
+            if length > self.max_upload_bytes:
+                await self._respond(writer, 413, {'error': f'upload exceeds {self.max_upload_bytes} bytes'})
+                return
+            body = await reader.readexactly(length) if length else b''
+
+            status, payload = self.route(method, target, body)
+            await self._respond(writer, status, payload)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        head = (
+            f'HTTP/1.1 {status} {_REASONS.get(status, "")}\r\n'
+            'Content-Type: application/json\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            'Connection: close\r\n'
+        )
+        if status == 503:
+            head += 'Retry-After: 1\r\n'
+        writer.write(head.encode('latin-1') + b'\r\n' + body)
+        await writer.drain()
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, **options):
+    service = AnalysisService(**options)
+    await service.start()
+    server = await asyncio.start_server(service.handle, host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Run the resume analysis service")
+    arg_parser.add_argument('--host', default=DEFAULT_HOST)
+    arg_parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    arg_parser.add_argument('-w', '--workers', type=int, default=None,
+                            help="worker processes (default: number of CPU cores)")
+    arg_parser.add_argument('--max-pending', type=int, default=64,
+                            help="queued jobs accepted before new uploads get 503")
+    arg_parser.add_argument('--max-upload-mb', type=float, default=10.0)
+    arg_parser.add_argument('-t', '--timeout', type=float, default=60.0, help="per-resume time budget in seconds")
+    arg_parser.add_argument('--max-pages', type=int, default=None, help="pages read per PDF")
+    arg_parser.add_argument('--max-memory-mb', type=int, default=None, help="memory ceiling of each extraction")
+    arg_parser.add_argument('--no-sandbox', action='store_true',
+                            help="extract PDFs inside the workers instead of sandboxed child processes")
+    args = arg_parser.parse_args(argv)
+
+    extraction_limits = {'max_pages': args.max_pages, 'max_memory_mb': args.max_memory_mb}
+
+    try:
+        asyncio.run(serve(
+            args.host, args.port, workers=args.workers, max_pending=args.max_pending,
+            max_upload_bytes=int(args.max_upload_mb * 1024 * 1024), job_timeout=args.timeout,
+            sandboxed=not args.no_sandbox, extraction_limits=extraction_limits,
+        ))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import json
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import urlencode
+
+
+class ServiceError(Exception):
+    """The analysis service refused a request or a job failed"""
+
+
+class ServiceBusy(ServiceError):
+    """The service is at capacity; retry later"""
+
+
+def _request(url, data=None, timeout=30):
+    request = urllib.request.Request(url, data=data, method='POST' if data is not None else 'GET')
+    if data is not None:
+        request.add_header('Content-Type', 'application/pdf')
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        payload = json.loads(e.read() or b'{}')
+        if e.code == 503:
+            raise ServiceBusy(payload.get('error', 'service busy')) from None
+        raise ServiceError(payload.get('error', f'HTTP {e.code}')) from None
+
+
+def submit(base_url, pdf_bytes, roles=None, candidate_id=None):
+    """Submit a PDF and return its job id"""
+    params = [('role', role) for role in roles or []]
+    if candidate_id is not None:
+        params.append(('candidate', candidate_id))
+    query = urlencode(params)
+    url = base_url.rstrip('/') + '/jobs' + (f'?{query}' if query else '')
+    _, job = _request(url, data=pdf_bytes)
+    return job['job_id']
+
+
+def status(base_url, job_id):
+    """Current job status: queued, running, done or failed"""
+    _, job = _request(f"{base_url.rstrip('/')}/jobs/{job_id}")
+    return job
+
+
+def result(base_url, job_id, poll_interval=0.5, timeout=120):
+    """Poll until the job finishes and return its result record"""
+    deadline = time.monotonic() + timeout
+    url = f"{base_url.rstrip('/')}/jobs/{job_id}/result"
+    while True:
+        code, payload = _request(url)
+        if code == 200:
+            if payload['status'] != 'done':
+                raise ServiceError(payload.get('error') or 'analysis failed')
+            return payload['result']
+        if time.monotonic() > deadline:
+            raise ServiceError(f'job {job_id} did not finish within {timeout}s')
+        time.sleep(poll_interval)
+
+
+def analyze(base_url, pdf_bytes, roles=None, poll_interval=0.5, timeout=120, candidate_id=None):
+    """Submit a PDF and wait for its result"""
+    job_id = submit(base_url, pdf_bytes, roles, candidate_id)
+    return result(base_url, job_id, poll_interval=poll_interval, timeout=timeout)
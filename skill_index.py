@@ -0,0 +1,254 @@
+import re
+import sqlite3
+from datetime import datetime
+
+import taxonomy
+
+DEFAULT_INDEX_PATH = 'skill_index.db'
+
+_TOKEN_PATTERN = re.compile(r'"([^"]+)"|(\()|(\))|([^\s()"]+)')
+_OPERATORS = {'AND', 'OR', 'NOT'}
+
+
+def canonical_skills():
+    """Every canonical skill name in the current taxonomy"""
+    return set(taxonomy.current().categories)
+
+
+def canonical_skill(name):
+    """Canonical skill for a name or taxonomy alias ("js", "ML"); ValueError if unknown"""
+    skill = taxonomy.current().canonical(name)
+    if skill is None:
+        raise ValueError(f"Unknown skill '{name}'")
+    return skill
+
+
+class SkillIndex:
+    """On-disk inverted index from canonical skill to the resumes that list it
+
+    Postings are stored in SQLite clustered by (skill, resume_id) with the
+    proficiency from ResumeParser.calculate_skill_proficiency as payload,
+    so queries are answered from the index alone. Skill names in postings
+    and queries go through the live taxonomy's aliases, so a hot reload
+    reaches the index without reopening it.
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.executescript('''
+                CREATE TABLE IF NOT EXISTS resumes (
+                    resume_id TEXT PRIMARY KEY,
+                    indexed_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS postings (
+                    skill TEXT NOT NULL,
+                    resume_id TEXT NOT NULL,
+                    proficiency INTEGER NOT NULL,
+                    PRIMARY KEY (skill, resume_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS postings_by_resume ON postings (resume_id);
+            ''')
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM resumes').fetchone()[0]
+
+    def add(self, resume_id, skill_proficiency):
+        """Index (or re-index) a resume from its {skill: proficiency} mapping"""
+        compiled = taxonomy.current()
+        postings = []
+        for skill, level in skill_proficiency.items():
+            skill = compiled.canonical(skill)
+            if skill is not None:
+                postings.append((skill, resume_id, int(level)))
+        with self.connection:
+            self._delete(resume_id)
+            self.connection.execute(
+                'INSERT INTO resumes (resume_id, indexed_at) VALUES (?, ?)',
+                (resume_id, datetime.now().isoformat()),
+            )
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO postings (skill, resume_id, proficiency) VALUES (?, ?, ?)',
+                postings,
+            )
+
+    def add_parsed(self, resume_id, resume_data):
+        """Index a resume from ResumeParser.parse_resume output"""
+        self.add(resume_id, resume_data.get('skill_proficiency', {}))
+
+    def delete(self, resume_id):
+        """Remove a resume and all its postings"""
+        with self.connection:
+            self._delete(resume_id)
+
+    def _delete(self, resume_id):
+        self.connection.execute('DELETE FROM postings WHERE resume_id = ?', (resume_id,))
+        self.connection.execute('DELETE FROM resumes WHERE resume_id = ?', (resume_id,))
+
+    def skills_for(self, resume_id):
+        """{skill: proficiency} stored for one resume"""
+        rows = self.connection.execute(
+            'SELECT skill, proficiency FROM postings WHERE resume_id = ?', (resume_id,)
+        )
+        return dict(rows)
+
+    def postings(self, skill, min_proficiency=None):
+        """Set of resume ids listing skill at or above min_proficiency"""
+        skill = canonical_skill(skill)
+        rows = self.connection.execute(
+            'SELECT resume_id FROM postings WHERE skill = ? AND proficiency >= ?',
+            (skill, min_proficiency or 0),
+        )
+        return {resume_id for resume_id, in rows}
+
+    def _all_resumes(self):
+        return {resume_id for resume_id, in self.connection.execute('SELECT resume_id FROM resumes')}
+
+    def search(self, query, min_proficiency=None):
+        """Resume ids matching a boolean query such as 'python AND (docker OR kubernetes)'
+
+        Operators are AND, OR and NOT (case-insensitive) with parentheses;
+        multi-word skills can be written bare ("machine learning") or quoted.
+        `min_proficiency` applies to every skill in the query.
+        """
+        parser = _QueryParser(_tokenize(query))
+        tree = parser.parse()
+        return sorted(self._evaluate(tree, min_proficiency))
+
+    def _evaluate(self, node, min_proficiency):
+        kind = node[0]
+        if kind == 'skill':
+            return self.postings(node[1], min_proficiency)
+        if kind == 'not':
+            return self._all_resumes() - self._evaluate(node[1], min_proficiency)
+
+        left = self._evaluate(node[1], min_proficiency)
+        if kind == 'and' and not left:
+            return left
+        right = self._evaluate(node[2], min_proficiency)
+        return left & right if kind == 'and' else left | right
+
+    def rank(self, weights, min_proficiency=None, limit=50):
+        """Top resumes by sum of weight x proficiency over the given skills
+
+        `weights` is a {skill: weight} mapping or a list of skills (weight 1).
+        Returns (resume_id, score) pairs, best first.
+        """
+        if not isinstance(weights, dict):
+            weights = {skill: 1.0 for skill in weights}
+        compiled = taxonomy.current()
+        unknown = [skill for skill in weights if compiled.canonical(skill) is None]
+        if unknown:
+            raise ValueError(f"Unknown skills: {', '.join(unknown)}")
+        canonical = {}
+        for skill, weight in weights.items():
+            # An alias and its skill given together add up
+            skill = compiled.canonical(skill)
+            canonical[skill] = canonical.get(skill, 0) + weight
+        weights = canonical
+        if not weights:
+            return []
+
+        # The weights travel as a VALUES table so SQLite does the aggregation
+        values = ', '.join('(?, ?)' for _ in weights)
+        params = [item for pair in weights.items() for item in pair]
+        rows = self.connection.execute(
+            f'''
+            WITH query (skill, weight) AS (VALUES {values})
+            SELECT postings.resume_id, SUM(query.weight * postings.proficiency) AS score
+            FROM query JOIN postings ON postings.skill = query.skill
+            WHERE postings.proficiency >= ?
+            GROUP BY postings.resume_id
+            ORDER BY score DESC, postings.resume_id
+            LIMIT ?
+            ''',
+            params + [min_proficiency or 0, limit],
+        )
+        return [(resume_id, score) for resume_id, score in rows]
+
+
+def _tokenize(query):
+    """Split a query into operators, parentheses and skill names"""
+    tokens = []
+    words = []
+    for quoted, open_paren, close_paren, word in _TOKEN_PATTERN.findall(query):
+        if word and word.upper() not in _OPERATORS:
+            # Consecutive bare words form one multi-word skill
+            words.append(word)
+            continue
+        if words:
+            tokens.append(('skill', ' '.join(words)))
+            words = []
+        if quoted:
+            tokens.append(('skill', quoted))
+        elif open_paren:
+            tokens.append(('(', None))
+        elif close_paren:
+            tokens.append((')', None))
+        else:
+            tokens.append((word.upper(), None))
+    if words:
+        tokens.append(('skill', ' '.join(words)))
+    return tokens
+
+
+class _QueryParser:
+    """Recursive-descent parser: OR binds loosest, then AND, then NOT"""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def _peek(self):
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def _take(self, expected=None):
+        token = self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+        if expected and token[0] != expected:
+            raise ValueError(f"Expected {expected} in query, found {token[0] or 'end of query'}")
+        self.position += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise ValueError("Empty query")
+        node = self._or()
+        if self.position != len(self.tokens):
+            raise ValueError(f"Unexpected {self._peek()} in query")
+        return node
+
+    def _or(self):
+        node = self._and()
+        while self._peek() == 'OR':
+            self._take()
+            node = ('or', node, self._and())
+        return node
+
+    def _and(self):
+        node = self._not()
+        while self._peek() == 'AND':
+            self._take()
+            node = ('and', node, self._not())
+        return node
+
+    def _not(self):
+        if self._peek() == 'NOT':
+            self._take()
+            return ('not', self._not())
+        if self._peek() == '(':
+            self._take()
+            node = self._or()
+            self._take(')')
+            return node
+        kind, value = self._take('skill')
+        return ('skill', value)
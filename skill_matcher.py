@@ -0,0 +1,116 @@
+from collections import deque
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton that finds every known skill in a single scan"""
+
+    def __init__(self, skills_database=None):
+        # Each state is a dict of outgoing transitions; fail links and outputs
+        # are kept in parallel lists indexed by state number.
+        self._goto = [{}]
+        self._terminal = [[]]
+        self._fail = [0]
+        self._output = [[]]
+        self.skills = {}
+
+        for category, skills_list in (skills_database or {}).items():
+            for skill in skills_list:
+                self.add(skill, category)
+        self.build()
+
+    def add(self, pattern, category, skill=None):
+        """Register a pattern that reports `skill` in `category`; call build() afterwards"""
+        skill = skill or pattern
+        pattern = pattern.lower()
+        if not pattern:
+            return
+
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._terminal.append([])
+            state = next_state
+
+        entry = (len(pattern), skill, category)
+        if entry not in self._terminal[state]:
+            self._terminal[state].append(entry)
+        self.skills.setdefault(skill, category)
+
+    def build(self):
+        """Compute failure links breadth-first and merge outputs along them"""
+        self._fail = [0] * len(self._goto)
+        self._output = [list(entries) for entries in self._terminal]
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def finditer(self, text):
+        """Yield (start, end, skill, category) for every whole-word skill match"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        length = len(text)
+        state = 0
+
+        for index, char in enumerate(text):
+            # Lowercase per character so offsets stay valid for the input text
+            for lowered in char.lower():
+                while state and lowered not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(lowered, 0)
+
+            for size, skill, category in output[state]:
+                start = index - size + 1
+                if start < 0:
+                    continue
+                if _is_boundary(text, start, length, before=True) and \
+                        _is_boundary(text, index + 1, length, before=False):
+                    yield start, index + 1, skill, category
+
+    def find_all(self, text):
+        """Return all skill matches with offsets, ordered by end position"""
+        return list(self.finditer(text))
+
+    def extract(self, text, categories=None):
+        """Return {category: [skills]} for the skills present in text"""
+        found = {category: [] for category in (categories or ())}
+        for _, _, skill, category in self.finditer(text):
+            skills_list = found.setdefault(category, [])
+            if skill not in skills_list:
+                skills_list.append(skill)
+        return found
+
+
+def _is_boundary(text, position, length, before):
+    """Mimic regex \\b around a match, but only where the skill edge is a word character"""
+    if before:
+        edge = text[position]
+        neighbour = text[position - 1] if position > 0 else ''
+    else:
+        edge = text[position - 1]
+        neighbour = text[position] if position < length else ''
+    if not _is_word_char(edge):
+        # Skills such as "c++" end in punctuation, where \b would never match
+        return True
+    if neighbour == '.':
+        # A dot between word characters is part of the token, so "js" is not
+        # found inside "node.js"
+        beyond = position - 2 if before else position + 1
+        return not (0 <= beyond < length and _is_word_char(text[beyond]))
+    return not _is_word_char(neighbour)
+
+
+def _is_word_char(char):
+    return bool(char) and (char.isalnum() or char == '_')
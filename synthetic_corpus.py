@@ -0,0 +1,111 @@
+import argparse
+import os
+import random
+
+from resume_parser import PROFICIENCY_KEYWORDS, ResumeParser
+
+FIRST_NAMES = ['Alex', 'Priya', 'Sam', 'Wei', 'Maria', 'Omar', 'Jordan', 'Aisha', 'Lucas', 'Mei']
+LAST_NAMES = ['Sharma', 'Chen', 'Garcia', 'Okafor', 'Smith', 'Kumar', 'Novak', 'Haddad', 'Silva', 'Kim']
+JOB_TITLES = [
+    'Software Engineer', 'Senior Developer', 'Data Scientist', 'Business Analyst',
+    'Product Manager', 'Backend Developer', 'Frontend Developer', 'Lead Engineer'
+]
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries', 'Wayne Analytics']
+DEGREES = ['Bachelor of Technology', 'Master of Science', 'B.Sc. Computer Science', 'MBA', 'PhD in Statistics']
+FILLER = (
+    'delivered designed built improved migrated maintained scaled reduced costs for the team '
+    'across multiple services with customers stakeholders and partners in a fast paced environment'
+).split()
+
+
+def generate_resume_text(seed=0, sections=4, skill_density=0.2):
+    """Deterministic plain-text resume
+
+    `sections` scales the length (each adds an experience entry and a
+    project); `skill_density` is the fraction of body words that are
+    skills from the parser's database.
+    """
+    rng = random.Random(seed)
+    skills = [skill for skills_list in ResumeParser().load_skills_database().values() for skill in skills_list]
+    keywords = list(PROFICIENCY_KEYWORDS)
+
+    def sentence(length=18):
+        words = []
+        for _ in range(length):
+            if rng.random() < skill_density:
+                if rng.random() < 0.2:
+                    words.append(rng.choice(keywords))
+                words.append(rng.choice(skills))
+            else:
+                words.append(rng.choice(FILLER))
+        return ' '.join(words).capitalize() + '.'
+
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    lines = [
+        f'{first} {last}',
+        f'{first.lower()}.{last.lower()}@example.com | +1 555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}',
+        f'linkedin.com/in/{first.lower()}{last.lower()} | github.com/{first.lower()}{rng.randint(1, 99)}',
+        '',
+        'SUMMARY',
+        f'{rng.randint(1, 20)} years of experience. ' + sentence(),
+        '',
+        'TECHNICAL SKILLS',
+        ', '.join(rng.sample(skills, min(len(skills), 8 + int(40 * skill_density)))),
+        '',
+        'WORK EXPERIENCE',
+    ]
+    for _ in range(sections):
+        lines.append(f'{rng.choice(JOB_TITLES)} - {rng.choice(COMPANIES)} ({rng.randint(2005, 2024)})')
+        lines.extend(f'- {sentence()}' for _ in range(rng.randint(3, 6)))
+        lines.append('')
+    lines.append('PROJECTS')
+    for _ in range(sections):
+        lines.append(f'- {sentence(24)}')
+    lines.extend(['', 'EDUCATION', f'{rng.choice(DEGREES)}, University of Somewhere, {rng.randint(2000, 2020)}'])
+    return '\n'.join(lines) + '\n'
+
+
+def write_pdf(text, path, lines_per_page=50):
+    """Render plain text into a simple multi-page PDF with PyMuPDF"""
+    import fitz  # PyMuPDF
+
+    document = fitz.open()
+    lines = text.splitlines()
+    for page_start in range(0, max(len(lines), 1), lines_per_page):
+        page = document.new_page()
+        for offset, line in enumerate(lines[page_start:page_start + lines_per_page]):
+            page.insert_text((50, 60 + offset * 14), line, fontsize=9)
+    document.save(path)
+    document.close()
+
+
+def generate_corpus(out_dir, count=20, sections=4, skill_density=0.2, seed=0, pdf=True):
+    """Write count resumes as .txt (and .pdf) files; returns the list of base paths"""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for i in range(count):
+        text = generate_resume_text(seed=seed + i, sections=sections, skill_density=skill_density)
+        base = os.path.join(out_dir, f'resume_{i:05d}')
+        with open(base + '.txt', 'w', encoding='utf-8') as f:
+            f.write(text)
+        if pdf:
+            write_pdf(text, base + '.pdf')
+        paths.append(base)
+    return paths
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Generate a deterministic synthetic resume corpus")
+    arg_parser.add_argument('out_dir')
+    arg_parser.add_argument('-n', '--count', type=int, default=20)
+    arg_parser.add_argument('--sections', type=int, default=4, help="experience entries and projects per resume")
+    arg_parser.add_argument('--skill-density', type=float, default=0.2, help="fraction of body words that are skills")
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--text-only', action='store_true', help="skip PDF rendering")
+    args = arg_parser.parse_args(argv)
+
+    generate_corpus(args.out_dir, args.count, args.sections, args.skill_density, args.seed, pdf=not args.text_only)
+
+
+if __name__ == "__main__":
+    main()
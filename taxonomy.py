@@ -0,0 +1,223 @@
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import namedtuple
+
+from skill_matcher import SkillMatcher
+
+# Role and skill definitions live in JSON under taxonomy/ and are compiled
+# into one pickled artifact holding the alias map, category lookup, role
+# requirements and a built SkillMatcher automaton. Each process unpickles the
+# artifact instead of rebuilding anything, and picks up a new one (or edited
+# sources) on the next lookup after it changes on disk.
+DEFAULT_TAXONOMY_DIR = os.environ.get(
+    'RESUME_TAXONOMY_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'taxonomy')
+)
+SOURCE_FILES = ('skills.json', 'roles.json')
+ARTIFACT_NAME = 'taxonomy.pkl'
+ARTIFACT_FORMAT = 1
+# Seconds between mtime checks, so lookups on the hot path are a clock read
+CHECK_INTERVAL = 1.0
+
+RoleSkill = namedtuple('RoleSkill', ['name', 'skill', 'category', 'weight'])
+
+
+class CompiledTaxonomy:
+    """Everything derived from the taxonomy sources, ready to use"""
+
+    def __init__(self, version, skills_database, aliases, roles):
+        self.version = version
+        # {category: [canonical skills]}, the shape ResumeParser always used
+        self.skills_database = skills_database
+        # {lowercased alias or skill: (canonical skill, category)}
+        self.aliases = aliases
+        self.categories = {
+            skill: category for category, skills_list in skills_database.items() for skill in skills_list
+        }
+        # {role: [RoleSkill]} in the order the roles file lists them
+        self.roles = roles
+        self.matcher = SkillMatcher()
+        for alias, (skill, category) in aliases.items():
+            self.matcher.add(alias, category, skill)
+        self.matcher.build()
+
+    def canonical(self, name):
+        """Canonical skill for a skill name or alias in any case and spacing, or None"""
+        known = self.aliases.get(' '.join(name.lower().split()))
+        return known[0] if known else None
+
+    def role_names(self):
+        return list(self.roles)
+
+    def role_skills(self, role):
+        """Display names of the skills a role requires"""
+        return [requirement.name for requirement in self.roles.get(role, ())]
+
+    def role_weights(self, role):
+        return {requirement.name: requirement.weight for requirement in self.roles.get(role, ())}
+
+
+def source_paths(directory=DEFAULT_TAXONOMY_DIR):
+    return [os.path.join(directory, name) for name in SOURCE_FILES]
+
+
+def compile_taxonomy(directory=DEFAULT_TAXONOMY_DIR):
+    """Validate the JSON sources and build a CompiledTaxonomy from them"""
+    raw = []
+    for path in source_paths(directory):
+        with open(path, 'rb') as f:
+            raw.append(f.read())
+    skills_source, roles_source = (json.loads(data) for data in raw)
+    version = hashlib.sha256(b'\0'.join(raw)).hexdigest()[:16]
+
+    skills_database = {}
+    aliases = {}
+    for category, skills_list in skills_source['categories'].items():
+        skills_database[category] = []
+        for skill in skills_list:
+            skill = skill.lower()
+            if skill in aliases:
+                raise ValueError(f"Skill '{skill}' is listed in more than one category")
+            skills_database[category].append(skill)
+            aliases[skill] = (skill, category)
+
+    for skill, names in skills_source.get('aliases', {}).items():
+        if skill not in aliases:
+            raise ValueError(f"Aliases given for unknown skill '{skill}'")
+        for alias in names:
+            alias = ' '.join(alias.lower().split())
+            if aliases.get(alias, aliases[skill]) != aliases[skill]:
+                raise ValueError(f"Alias '{alias}' already names skill '{aliases[alias][0]}'")
+            aliases[alias] = aliases[skill]
+
+    roles = {}
+    for role, requirements in roles_source.items():
+        roles[role] = []
+        for name, weight in requirements.items():
+            key = ' '.join(name.lower().split())
+            if key not in aliases:
+                raise ValueError(f"Role '{role}' requires '{name}', which is not a known skill or alias")
+            skill, category = aliases[key]
+            roles[role].append(RoleSkill(name, skill, category, float(weight)))
+
+    return CompiledTaxonomy(version, skills_database, aliases, roles)
+
+
+def write_artifact(taxonomy, path):
+    """Pickle a compiled taxonomy, replacing any previous artifact atomically"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'format': ARTIFACT_FORMAT, 'taxonomy': taxonomy}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_artifact(path):
+    """Unpickle a compiled taxonomy written by write_artifact"""
+    with open(path, 'rb') as f:
+        payload = pickle.load(f)
+    if payload.get('format') != ARTIFACT_FORMAT:
+        raise ValueError(f"Taxonomy artifact {path} has an unsupported format")
+    return payload['taxonomy']
+
+
+class TaxonomyStore:
+    """Serve the compiled taxonomy, reloading it when the artifact changes
+
+    The artifact is rebuilt from the sources when it is missing or older
+    than them, so editing a JSON file is enough to roll out a change.
+    """
+
+    def __init__(self, directory=DEFAULT_TAXONOMY_DIR, artifact_path=None, check_interval=CHECK_INTERVAL):
+        self.directory = directory
+        self.artifact_path = artifact_path or os.path.join(directory, ARTIFACT_NAME)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._taxonomy = None
+        self._artifact_mtime = None
+        self._compiled_from = None
+        self._next_check = 0.0
+
+    def get(self):
+        """Return the current CompiledTaxonomy"""
+        now = time.monotonic()
+        if self._taxonomy is not None and now < self._next_check:
+            return self._taxonomy
+
+        with self._lock:
+            if self._taxonomy is None or now >= self._next_check:
+                self._refresh()
+                self._next_check = time.monotonic() + self.check_interval
+        return self._taxonomy
+
+    def _refresh(self):
+        source_mtime = max(os.stat(path).st_mtime_ns for path in source_paths(self.directory))
+        try:
+            artifact_mtime = os.stat(self.artifact_path).st_mtime_ns
+        except FileNotFoundError:
+            artifact_mtime = None
+
+        if artifact_mtime is None or artifact_mtime < source_mtime:
+            if self._compiled_from == source_mtime:
+                # Already compiled these sources but couldn't save the artifact
+                return
+            self._taxonomy = compile_taxonomy(self.directory)
+            self._compiled_from = source_mtime
+            try:
+                write_artifact(self._taxonomy, self.artifact_path)
+                self._artifact_mtime = os.stat(self.artifact_path).st_mtime_ns
+            except OSError:
+                # Read-only deployment: keep serving the in-memory copy
+                self._artifact_mtime = None
+        elif artifact_mtime != self._artifact_mtime:
+            try:
+                self._taxonomy = load_artifact(self.artifact_path)
+            except (pickle.UnpicklingError, AttributeError, ImportError, ValueError, EOFError):
+                # Unreadable or from another format: rebuild it from the sources
+                self._taxonomy = compile_taxonomy(self.directory)
+                self._compiled_from = source_mtime
+                try:
+                    write_artifact(self._taxonomy, self.artifact_path)
+                    artifact_mtime = os.stat(self.artifact_path).st_mtime_ns
+                except OSError:
+                    pass
+            self._artifact_mtime = artifact_mtime
+
+
+_store = TaxonomyStore()
+
+
+def current():
+    """The process-wide taxonomy, hot-reloaded from DEFAULT_TAXONOMY_DIR"""
+    return _store.get()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Compile the role and skill taxonomy into its binary artifact")
+    arg_parser.add_argument('directory', nargs='?', default=DEFAULT_TAXONOMY_DIR,
+                            help="directory holding skills.json and roles.json")
+    arg_parser.add_argument('-o', '--output', default=None, help=f"artifact path (default: <directory>/{ARTIFACT_NAME})")
+    args = arg_parser.parse_args(argv)
+
+    # Compile through the imported module rather than __main__, so the
+    # pickled classes resolve in every process that loads the artifact
+    import taxonomy as module
+
+    taxonomy = module.compile_taxonomy(args.directory)
+    output = args.output or os.path.join(args.directory, ARTIFACT_NAME)
+    module.write_artifact(taxonomy, output)
+    print(f"Compiled {len(taxonomy.aliases)} skill names and {len(taxonomy.roles)} roles "
+          f"into {output} (version {taxonomy.version})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import json
+import time
+
+import batch
+import dedup
+import models
+
+
+def _slow_extract(pdf_source, *args, **kwargs):
+    # Like the extractors, falls back to "" on any ordinary exception
+    try:
+        time.sleep(5)
+    except Exception:
+        return ""
+    return "never reached"
+
+
+class SlowParser:
+    extract_text_from_pdf = staticmethod(_slow_extract)
+
+
+def test_file_past_timeout_is_reported_as_timeout(monkeypatch):
+    monkeypatch.setattr(batch, '_parser', SlowParser())
+
+    started = time.monotonic()
+    record = batch.analyze_pdf(b'%PDF-1.4', ['Data Scientist'], timeout=0.2)
+
+    assert record['status'] == 'timeout'
+    assert time.monotonic() - started < 2
+
+
+def test_fingerprint_past_timeout_is_reported_as_timeout(monkeypatch):
+    monkeypatch.setattr(batch, '_parser', SlowParser())
+
+    record = batch.fingerprint_file('resume.pdf', timeout=0.2)
+
+    assert record['status'] == 'timeout'
+
+
+def _fake_fingerprint(path, limits=None, num_perm=dedup.DEFAULT_NUM_PERM, timeout=None):
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    return text, dedup.MinHasher(num_perm).text_signature(text)
+
+
+def _fake_analyze_files(paths, roles, timeout=None, charts_dir=None, chart_format='svg', limits=None, texts=None):
+    return [
+        {'path': path, 'status': 'ok', 'error': None, 'skills': text.split(),
+         'matches': {role: 50.0 for role in roles}, 'best_role': roles[0]}
+        for path, text in zip(paths, texts)
+    ]
+
+
+def test_duplicate_records_copy_their_original(monkeypatch, tmp_path):
+    monkeypatch.setattr(models, 'warm_up', lambda: False)
+    monkeypatch.setattr(batch, 'init_worker', lambda: None)
+    monkeypatch.setattr(batch, 'fingerprint_file', _fake_fingerprint)
+    monkeypatch.setattr(batch, 'analyze_files', _fake_analyze_files)
+    text = "python sql machine learning pandas numpy statistics tableau spark"
+    paths = []
+    for name in ('r0.pdf', 'r0copy.pdf', 'other.pdf'):
+        paths.append(str(tmp_path / name))
+        with open(paths[-1], 'w', encoding='utf-8') as f:
+            f.write("kubernetes terraform docker aws linux bash go networking" if name == 'other.pdf' else text)
+    output = str(tmp_path / 'results.jsonl')
+
+    summary = batch.run_batch(paths, output, ['Data Scientist'], workers=1, dedup_threshold=0.9)
+
+    with open(output, encoding='utf-8') as f:
+        records = {record['path']: record for record in map(json.loads, f)}
+    assert summary['duplicates'] == 1
+    assert len(records) == 3
+    # Either copy may be fingerprinted first and become the original
+    (copy,) = [record for record in records.values() if record['status'] == 'duplicate']
+    assert {copy['path'], copy['duplicate_of']} == set(paths[:2])
+    assert copy['best_role'] == 'Data Scientist'
+    assert copy['skills'] == text.split()
@@ -0,0 +1,34 @@
+import dedup
+
+TEXT = ("jane doe senior data scientist with eight years of experience building machine learning "
+        "models in python and sql, leading a team of analysts and shipping forecasting services")
+
+
+def test_near_duplicate_is_found_and_unrelated_text_is_not():
+    hasher = dedup.MinHasher()
+    index = dedup.LSHIndex(threshold=0.8)
+    index.insert('original', hasher.text_signature(TEXT))
+
+    match = index.find_duplicate(hasher.text_signature(TEXT + " and dashboards"))
+    unrelated = index.find_duplicate(hasher.text_signature(
+        "kubernetes operator written in go for rolling database upgrades across regions with zero downtime"))
+
+    assert match[0] == 'original' and match[1] >= 0.8
+    assert unrelated is None
+
+
+def test_similarity_estimates_jaccard():
+    hasher = dedup.MinHasher(num_perm=256)
+    first, second = dedup.shingles(TEXT), dedup.shingles(TEXT.replace('python', 'java'))
+    jaccard = len(first & second) / len(first | second)
+
+    estimate = dedup.similarity(hasher.signature(first), hasher.signature(second))
+
+    assert abs(estimate - jaccard) < 0.1
+
+
+def test_optimal_bands_use_every_permutation_at_most():
+    bands, rows = dedup.optimal_bands(0.9, 128)
+
+    assert bands * rows <= 128
+    assert abs((1 / bands) ** (1 / rows) - 0.9) < 0.05
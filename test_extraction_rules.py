@@ -0,0 +1,37 @@
+import re
+
+from extraction_rules import RULES, Rule, RuleSet, keywords
+
+
+def test_scan_reports_every_kind_in_one_pass():
+    text = "Jane jane@example.com +1 555-123-4567, 5+ years of experience as a Senior Engineer. M.Sc in CS"
+
+    hits = RuleSet(RULES).scan(text)
+
+    assert ('email', 'jane@example.com') in [(hit.name, hit.value) for hit in hits]
+    assert [hit.value for hit in hits if hit.name == 'years'] == [5]
+    assert [hit.value.lower() for hit in hits if hit.name == 'job_title'] == ['senior engineer']
+    assert [hit.value.lower() for hit in hits if hit.name == 'degree'] == ['m.sc']
+    assert [hit.start for hit in hits] == sorted(hit.start for hit in hits)
+
+
+def test_scan_by_kind_matches_the_full_scan():
+    text = "Bachelor of Science, 3 years experience, github.com/jane"
+    rule_set = RuleSet(RULES)
+
+    assert rule_set.scan(text, ['education']) == [hit for hit in rule_set.scan(text) if hit.kind == 'education']
+
+
+def test_hits_of_one_rule_do_not_overlap():
+    rule_set = RuleSet([Rule('digits', 'test', r'\d{2}')])
+
+    assert [hit.value for hit in rule_set.scan("12345")] == ['12', '34']
+
+
+def test_keywords_matches_like_an_alternation():
+    words = ['m.sc', 'master', 'mba', 'b.com']
+    pattern = re.compile(keywords(words))
+
+    for word in words:
+        assert pattern.fullmatch(word)
+    assert not pattern.fullmatch('m.s')
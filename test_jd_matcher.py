@@ -0,0 +1,35 @@
+import os
+
+import jd_matcher
+
+
+def _matcher(tmp_path):
+    return jd_matcher.JDMatcher(str(tmp_path / 'missing.pkl'), str(tmp_path / 'vectors'))
+
+
+def test_rank_puts_the_closest_resume_first(tmp_path):
+    matcher = _matcher(tmp_path)
+    matcher.add_resumes({'py': "python django rest services", 'ops': "kubernetes terraform aws on call"})
+
+    ranking = matcher.rank("backend python developer for django services", top_k=2)
+
+    assert [resume_id for resume_id, _ in ranking] == ['py', 'ops']
+
+
+def test_edited_resume_replaces_its_vector(tmp_path):
+    _matcher(tmp_path).add_resumes({'a': "python developer", 'b': "java developer"})
+
+    matcher = _matcher(tmp_path)
+    assert matcher.add_resumes({'a': "python developer", 'b': "rust developer"}) == 1
+
+    reloaded = _matcher(tmp_path)
+    assert sorted(reloaded.store.resume_ids) == ['a', 'b']
+    assert reloaded.rank("rust", top_k=1)[0][0] == 'b'
+
+
+def test_rows_and_ids_are_saved_in_one_file(tmp_path):
+    matcher = _matcher(tmp_path)
+    matcher.add_resumes({'a': "python developer"})
+
+    assert os.listdir(tmp_path / 'vectors') == [os.path.basename(matcher.store.path)]
+    assert len(_matcher(tmp_path).store) == 1
@@ -0,0 +1,34 @@
+import matcher
+
+
+def _resume_data(skills_by_category, proficiency=None):
+    return {'skills_by_category': skills_by_category, 'skill_proficiency': proficiency or {}}
+
+
+def test_match_is_weighted_by_requirement():
+    data = _resume_data({'programming': ['python'], 'data_science': ['machine learning']})
+
+    result = matcher.analyze_resume("resume text", 'Data Scientist', data)
+
+    # Python 2 + Machine Learning 2 of 7.5
+    assert round(result['match_percentage'], 2) == round(4 / 7.5 * 100, 2)
+    assert result['matched_skills'] == ['Python', 'Machine Learning']
+    assert result['missing_skills'][0] == 'Statistics'
+
+
+def test_new_parse_results_for_the_same_text_are_not_served_from_cache():
+    matcher.clear_cache()
+    before = matcher.analyze_resume("same text", 'Data Scientist', _resume_data({'programming': ['python']}))
+    after = matcher.analyze_resume("same text", 'Data Scientist',
+                                   _resume_data({'programming': ['python', 'sql']}))
+
+    assert after['match_percentage'] > before['match_percentage']
+
+
+def test_clear_cache_forgets_profiles():
+    data = _resume_data({'programming': ['python']})
+    matcher.analyze_resume("text", 'Data Scientist', data)
+
+    matcher.clear_cache()
+
+    assert not matcher._profiles
@@ -0,0 +1,31 @@
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from result_store import ResultStore  # noqa: E402
+
+
+def _record(path, role, skills):
+    return {
+        'path': path, 'status': 'ok', 'contact_info': {'email': f'{path}@example.com'},
+        'total_experience': 3, 'skills': skills, 'skill_proficiency': {skill: 3 for skill in skills},
+        'matches': {role: 80.0}, 'best_role': role,
+    }
+
+
+def test_appends_are_read_back_across_files(tmp_path):
+    store = ResultStore(str(tmp_path))
+    store.append([_record('a', 'Data Analyst', ['sql'])])
+    store.append([_record('b', 'Data Analyst', ['sql', 'excel']), _record('c', 'ML Engineer', ['python'])])
+
+    assert sorted(store.read(['path'])['path'].to_pylist()) == ['a', 'b', 'c']
+
+
+def test_skill_prevalence_per_role(tmp_path):
+    store = ResultStore(str(tmp_path))
+    store.append([_record('a', 'Data Analyst', ['sql']), _record('b', 'Data Analyst', ['sql', 'excel'])])
+
+    assert store.skill_prevalence('Data Analyst') == [
+        ('Data Analyst', 'sql', 2, 1.0),
+        ('Data Analyst', 'excel', 1, 0.5),
+    ]
@@ -0,0 +1,56 @@
+import json
+import os
+
+import pytest
+
+import revisions
+
+
+def test_saved_revision_loads_back(tmp_path):
+    store = revisions.RevisionStore(str(tmp_path))
+    store.save('candidate-1', {'pages': [['abc', 'text']]})
+
+    assert store.load('candidate-1')['pages'] == [['abc', 'text']]
+    assert store.load('candidate-2') is None
+
+
+def test_revision_from_another_parser_version_is_dropped(tmp_path):
+    store = revisions.RevisionStore(str(tmp_path))
+    store.save('candidate-1', {'pages': []})
+    path = store._path('candidate-1')
+    with open(path, encoding='utf-8') as f:
+        revision = json.load(f)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(dict(revision, parser_version='old'), f)
+
+    assert store.load('candidate-1') is None
+    assert not os.path.exists(path)
+
+
+def test_least_recently_used_revisions_are_evicted(tmp_path):
+    store = revisions.RevisionStore(str(tmp_path))
+    store.save('old', {'pages': [['x', 'a' * 100]]})
+    os.utime(store._path('old'), (0, 0))
+    store.max_bytes = os.path.getsize(store._path('old')) + 10
+
+    store.save('new', {'pages': [['y', 'b' * 100]]})
+
+    assert store.load('old') is None
+    assert store.load('new') is not None
+
+
+def test_changed_font_changes_the_page_fingerprint():
+    fitz = pytest.importorskip('fitz')
+
+    def pdf(fontname):
+        document = fitz.open()
+        document.new_page().insert_text((72, 72), "Jane Doe, Python", fontname=fontname)
+        return document.tobytes()
+
+    pages, reused = revisions.extract_pages(pdf('helv'))
+    again, reused_again = revisions.extract_pages(pdf('helv'), dict(pages))
+    other, _ = revisions.extract_pages(pdf('cour'), dict(pages))
+
+    assert reused == 0 and reused_again == 1
+    assert again[0][0] == pages[0][0]
+    assert other[0][0] != pages[0][0]
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+import matcher
+import scoring
+
+
+def test_scores_match_analyze_resume():
+    matrix = scoring.ScoringMatrix()
+    matrix.add('a', {'python': 1.0, 'machine learning': 1.0})
+    matrix.add('b', ['sql', 'excel', 'tableau'])
+
+    scores = matrix.score_matrix()
+    expected = matcher.analyze_resume(
+        "a", 'Data Scientist', {'skills_by_category': {'x': ['python', 'machine learning']}}
+    )['match_percentage']
+
+    assert np.isclose(scores[0, matrix.role_index['Data Scientist']], expected)
+    assert scores[1, matrix.role_index['Data Analyst']] > scores[1, matrix.role_index['Data Scientist']]
+
+
+def test_add_text_finds_required_skills_through_aliases():
+    matrix = scoring.ScoringMatrix()
+
+    matrix.add_text('a', "Deployed services on k8s behind REST APIs")
+
+    found = {matrix.skills[col] for col in matrix.matrix.indices}
+    assert found == {'Kubernetes', 'APIs'}
+
+
+def test_duplicate_resume_id_is_rejected():
+    matrix = scoring.ScoringMatrix()
+    matrix.add('a', ['python'])
+
+    with pytest.raises(ValueError):
+        matrix.add('a', ['sql'])
+
+
+def test_top_k_orders_by_score():
+    matrix = scoring.ScoringMatrix()
+    matrix.add_many({'low': ['linux'], 'high': ['docker', 'kubernetes', 'aws'], 'none': []})
+
+    assert [resume_id for resume_id, _ in matrix.top_k('DevOps Engineer', k=2)] == ['high', 'low']
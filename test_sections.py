@@ -0,0 +1,40 @@
+from sections import PREAMBLE, section_text, segment_resume
+
+
+def _bodies(text):
+    return [(section.name, text[section.start:section.end]) for section in segment_resume(text)]
+
+
+def test_standalone_headers_open_sections():
+    text = "Jane Doe\nEXPERIENCE\nAcme, 2019-2023\nTechnical Skills:\nPython, SQL\n"
+
+    assert _bodies(text) == [
+        (PREAMBLE, "Jane Doe\n"),
+        ('experience', "Acme, 2019-2023\n"),
+        ('skills', "Python, SQL\n"),
+    ]
+
+
+def test_upper_case_header_with_inline_content():
+    text = "SKILLS: Python, SQL\nEducation\nBSc\n"
+
+    assert _bodies(text) == [('skills', " Python, SQL\n"), ('education', "BSc\n")]
+
+
+def test_label_inside_a_section_does_not_open_one():
+    text = "Projects\nChat app\nTechnologies: Python, Flask\n"
+
+    assert _bodies(text) == [('projects', "Chat app\nTechnologies: Python, Flask\n")]
+
+
+def test_long_lines_are_body_text():
+    text = "Summary\nExperience with large teams and skills in many areas of the business\n"
+
+    assert [name for name, _ in _bodies(text)] == ['summary']
+
+
+def test_section_text_joins_named_sections():
+    text = "Skills\nPython\nEducation\nBSc\nKey Skills\nSQL\n"
+
+    assert section_text(text, segment_resume(text), {'skills'}) == "Python\n\nSQL\n"
+    assert section_text(text, segment_resume(text), {'projects'}) is None
@@ -0,0 +1,31 @@
+import pytest
+
+from skill_index import SkillIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    with SkillIndex(str(tmp_path / 'index.db')) as index:
+        index.add('a', {'javascript': 4, 'machine learning': 3})
+        index.add('b', {'python': 5, 'sql': 2})
+        yield index
+
+
+def test_queries_resolve_aliases(index):
+    assert index.search('js') == ['a']
+    assert index.search('ML OR python') == ['a', 'b']
+    assert index.search('NOT "Machine Learning"') == ['b']
+
+
+def test_min_proficiency_filters_postings(index):
+    assert index.search('python OR sql', min_proficiency=3) == ['b']
+    assert index.search('sql', min_proficiency=3) == []
+
+
+def test_rank_sums_weighted_proficiency(index):
+    assert index.rank({'js': 1, 'python': 2}) == [('b', 10), ('a', 4)]
+
+
+def test_unknown_skill_is_an_error(index):
+    with pytest.raises(ValueError):
+        index.search('cobol')
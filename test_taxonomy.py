@@ -0,0 +1,47 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import taxonomy
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _copy_sources(tmp_path):
+    for name in taxonomy.SOURCE_FILES:
+        shutil.copy(os.path.join(taxonomy.DEFAULT_TAXONOMY_DIR, name), tmp_path / name)
+    return str(tmp_path)
+
+
+def test_artifact_built_by_the_script_loads_in_another_process(tmp_path):
+    directory = _copy_sources(tmp_path)
+    subprocess.run([sys.executable, os.path.join(HERE, 'taxonomy.py'), directory], check=True,
+                   stdout=subprocess.DEVNULL)
+
+    store = taxonomy.TaxonomyStore(directory)
+    compiled = store.get()
+
+    assert store._compiled_from is None  # loaded from the artifact, not recompiled
+    assert compiled.aliases['k8s'][0] == 'kubernetes'
+    assert [skill for _, _, skill, _ in compiled.matcher.finditer("Deployed on k8s")] == ['kubernetes']
+
+
+def test_unreadable_artifact_is_rebuilt_from_the_sources(tmp_path):
+    directory = _copy_sources(tmp_path)
+    with open(os.path.join(directory, taxonomy.ARTIFACT_NAME), 'wb') as f:
+        f.write(b'not a pickle')
+
+    compiled = taxonomy.TaxonomyStore(directory).get()
+
+    assert 'python' in compiled.aliases
+    assert taxonomy.load_artifact(os.path.join(directory, taxonomy.ARTIFACT_NAME)).version == compiled.version
+
+
+def test_js_alias_does_not_match_inside_node_js():
+    matcher = taxonomy.current().matcher
+
+    found = [skill for _, _, skill, _ in matcher.finditer("Built services in Node.js and Vue.js")]
+
+    assert found == ['node.js', 'vue']
+    assert [skill for _, _, skill, _ in matcher.finditer("Frontend in JS.")] == ['javascript']
@@ -1,6 +1,83 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from functools import wraps
+
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+import instrumentation
+
+# Analysis fields the charts read; everything else (e.g. the full resume
+# skill list) is left out of the cache key
+CHART_FIELDS = ('job_skills', 'matched_skills', 'missing_skills', 'match_percentage', 'skills_categories')
+FIGURE_CACHE_SIZE = 128
+
+_figure_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def result_key(analysis_result):
+    """Stable hash of the parts of an analysis result that the charts depend on"""
+    fields = {}
+    for field in CHART_FIELDS:
+        value = analysis_result.get(field)
+        # Skill lists often come from sets, so their order is not stable
+        if isinstance(value, (list, tuple, set)):
+            value = sorted(value)
+        elif isinstance(value, dict):
+            # Category order is the chart's axis order, so keep it in the key
+            value = list(value.items())
+        fields[field] = value
+    payload = json.dumps(fields, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def memoized(fn):
+    """Reuse the figure built for an equal analysis result
+
+    Cached figures are shared between callers, so don't mutate them; build
+    a copy with go.Figure(fig) first when a caller needs to.
+    """
+    @wraps(fn)
+    def wrapper(analysis_result, *args, **kwargs):
+        key = (fn.__name__, result_key(analysis_result), args, tuple(sorted(kwargs.items())))
+        with _cache_lock:
+            if key in _figure_cache:
+                _figure_cache.move_to_end(key)
+                instrumentation.count('chart_cache_hits')
+                return _figure_cache[key]
+
+        # Build outside the lock; two threads may build the same figure once
+        result = fn(analysis_result, *args, **kwargs)
+        with _cache_lock:
+            _figure_cache[key] = result
+            if len(_figure_cache) > FIGURE_CACHE_SIZE:
+                _figure_cache.popitem(last=False)
+        return result
+    return wrapper
+
+
+def clear_cache():
+    with _cache_lock:
+        _figure_cache.clear()
+
+
+def _category_counts(analysis_result):
+    """(names, required counts, matched counts), or None without categories"""
+    categories = analysis_result.get('skills_categories', {})
+    if not categories:
+        return None
+    return (
+        list(categories.keys()),
+        [len(skills['required']) for skills in categories.values()],
+        [len(skills['matched']) for skills in categories.values()],
+    )
+
+
+@memoized
+@instrumentation.timed('chart.skills_chart')
 def create_skills_chart(analysis_result):
     # Bar chart showing matched vs missing skills counts
     matched = len(analysis_result.get('matched_skills', []))
@@ -14,6 +91,8 @@ def create_skills_chart(analysis_result):
                       xaxis=dict(title='Skill Status'))
     return fig
 
+@memoized
+@instrumentation.timed('chart.match_visualization')
 def create_match_visualization(analysis_result):
     # Pie chart showing matched vs missing skills proportion
     matched = len(analysis_result.get('matched_skills', []))
@@ -25,15 +104,15 @@ def create_match_visualization(analysis_result):
     fig.update_layout(title='Skill Match Proportion')
     return fig
 
+@memoized
+@instrumentation.timed('chart.skills_distribution_bar')
 def create_skills_distribution_bar(analysis_result):
     # Bar chart showing number of skills required and found per skill category if available
     # For simplicity, using job skills categories if present in analysis_result['skills_categories']
     # If not available, fallback to a dummy bar chart
-    categories = analysis_result.get('skills_categories', {})
-    if categories:
-        categories_names = list(categories.keys())
-        required_counts = [len(skills['required']) for skills in categories.values()]
-        matched_counts = [len(skills['matched']) for skills in categories.values()]
+    counts = _category_counts(analysis_result)
+    if counts:
+        categories_names, required_counts, matched_counts = counts
 
         fig = go.Figure()
         fig.add_trace(go.Bar(name='Required', x=categories_names, y=required_counts))
@@ -46,6 +125,8 @@ def create_skills_distribution_bar(analysis_result):
 
     return fig
 
+@memoized
+@instrumentation.timed('chart.match_gauge')
 def create_match_gauge(analysis_result):
     # Gauge chart to show overall match percentage
     match_pct = analysis_result.get('match_percentage', 0)
@@ -63,13 +144,13 @@ def create_match_gauge(analysis_result):
     ))
     return fig
 
+@memoized
+@instrumentation.timed('chart.skills_radar')
 def create_skills_radar(analysis_result):
     # Radar chart comparing required vs matched skills count by category if categories exist
-    categories = analysis_result.get('skills_categories', {})
-    if categories:
-        categories_names = list(categories.keys())
-        required_counts = [len(skills['required']) for skills in categories.values()]
-        matched_counts = [len(skills['matched']) for skills in categories.values()]
+    counts = _category_counts(analysis_result)
+    if counts:
+        categories_names, required_counts, matched_counts = counts
 
         fig = go.Figure()
 
@@ -124,3 +205,73 @@ def create_skills_radar(analysis_result):
             title="Skills Coverage Radar Chart"
         )
     return fig
+
+
+@memoized
+@instrumentation.timed('chart.dashboard')
+def create_dashboard(analysis_result):
+    """All charts in one figure, so a page sends a single chart payload
+
+    The pie chart is left out: it shows the same two numbers as the
+    matched vs missing bar chart.
+    """
+    matched = len(analysis_result.get('matched_skills', []))
+    missing = len(analysis_result.get('missing_skills', []))
+    counts = _category_counts(analysis_result)
+    if counts is None:
+        names = ['All Skills']
+        required_counts = [len(analysis_result.get('job_skills', []))]
+        matched_counts = [matched]
+    else:
+        names, required_counts, matched_counts = counts
+
+    fig = make_subplots(
+        rows=2, cols=2,
+        specs=[[{'type': 'indicator'}, {'type': 'xy'}],
+               [{'type': 'xy'}, {'type': 'polar'}]],
+        subplot_titles=('Overall Match Percentage', 'Matched vs Missing Skills',
+                        'Skills by Category', 'Skills Coverage'),
+        vertical_spacing=0.15,
+    )
+    fig.add_trace(go.Indicator(
+        mode="gauge+number",
+        value=analysis_result.get('match_percentage', 0),
+        gauge={'axis': {'range': [None, 100]},
+               'bar': {'color': "darkblue"},
+               'steps': [
+                   {'range': [0, 50], 'color': "red"},
+                   {'range': [50, 80], 'color': "yellow"},
+                   {'range': [80, 100], 'color': "green"}]}
+    ), row=1, col=1)
+    fig.add_trace(go.Bar(x=['Matched', 'Missing'], y=[matched, missing],
+                         marker_color=['green', 'red'], showlegend=False), row=1, col=2)
+    fig.add_trace(go.Bar(name='Required', x=names, y=required_counts,
+                         marker_color='#1f77b4', legendgroup='required'), row=2, col=1)
+    fig.add_trace(go.Bar(name='Matched', x=names, y=matched_counts,
+                         marker_color='#2ca02c', legendgroup='matched'), row=2, col=1)
+    fig.add_trace(go.Scatterpolar(r=required_counts, theta=names, fill='toself', name='Required',
+                                  line_color='#1f77b4', legendgroup='required', showlegend=False), row=2, col=2)
+    fig.add_trace(go.Scatterpolar(r=matched_counts, theta=names, fill='toself', name='Matched',
+                                  line_color='#2ca02c', legendgroup='matched', showlegend=False), row=2, col=2)
+    fig.update_layout(
+        barmode='group',
+        height=720,
+        margin=dict(t=60, b=40, l=40, r=40),
+        polar=dict(radialaxis=dict(visible=True, range=[0, max(required_counts + matched_counts) + 1])),
+    )
+    return fig
+
+
+@memoized
+def export_dashboard(analysis_result, format='svg', width=900, height=720):
+    """Static SVG or PNG bytes of the dashboard, e.g. for batch reports
+
+    Needs the optional kaleido package.
+    """
+    if format not in ('svg', 'png'):
+        raise ValueError(f"Unsupported image format '{format}', expected 'svg' or 'png'")
+    try:
+        import kaleido  # noqa: F401
+    except ImportError:
+        raise ImportError("Static chart export needs kaleido: pip install kaleido")
+    return create_dashboard(analysis_result).to_image(format=format, width=width, height=height)